@@ -0,0 +1,37 @@
+"""
+rlimit 적용 후 exec (prlimit 명령이 없는 호스트용)
+
+    python -I -S _rlimit_exec.py CPU=30:31 AS=536870912:536870912 -- argv...
+
+core.process_supervisor가 학생 프로그램을 이 스크립트 아래에서 실행한다. 스레드가 있는 채점 프로세스에서
+fork 후 exec 전에 파이썬 코드(preexec_fn)를 실행하지 않도록, 새 프로세스에서 setrlimit 후 argv를 exec한다.
+값은 부모가 자기 hard 한도 안으로 맞춰서 넘긴다. 설정에 실패한 한도는 건너뛴다 (preexec_fn 때와 같음).
+
+채점 코드(core 등)를 import하지 않는 독립 스크립트이다.
+"""
+import os
+import resource
+import sys
+
+_EXEC_FAILED = 127
+
+
+def main() -> None:
+    separator = sys.argv.index("--")
+    argv = sys.argv[separator + 1:]
+    for arg in sys.argv[1:separator]:
+        name, _, values = arg.partition("=")
+        soft, _, hard = values.partition(":")
+        try:
+            resource.setrlimit(getattr(resource, f"RLIMIT_{name}"), (int(soft), int(hard)))
+        except (AttributeError, ValueError, OSError):
+            pass
+    try:
+        os.execvp(argv[0], argv)
+    except OSError as e:
+        print(f"rlimit: {argv[0]}: {e.strerror}", file=sys.stderr)
+    os._exit(_EXEC_FAILED)
+
+
+if __name__ == "__main__":
+    main()
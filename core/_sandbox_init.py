@@ -0,0 +1,179 @@
+"""
+샌드박스 부트스트랩 (학생 프로그램을 새 네임스페이스에서 실행)
+
+    python -I -S _sandbox_init.py scratch=/tmp/... tmpfs_mb=64 network=0 cgroup=/sys/fs/cgroup/... -- argv...
+
+(시작 시간을 줄이기 위해 json 대신 key=value 인자를 쓴다 — json import가 re/enum까지 불러옴)
+
+1. cgroup이 주어지면 자신을 그 cgroup으로 옮긴다 (이후 fork한 프로세스도 같은 cgroup).
+2. mount/PID(/network) 네임스페이스를 만든다 (root가 아니면 user 네임스페이스도 함께).
+3. fork한 자식이 새 PID 네임스페이스의 PID 1(init)이 되어 /proc를 다시 마운트하고, scratch 디렉토리에
+   tmpfs를 마운트해 TMPDIR/HOME으로 쓴 뒤 argv를 fork/exec한다. init은 고아 프로세스를 회수하다가
+   argv 프로세스가 끝나면 그 종료 상태를 전달하고 끝난다 (PID 1이 끝나면 네임스페이스의 나머지는 커널이 종료).
+4. 이 프로세스는 init의 종료를 기다려 argv 프로세스와 같은 종료 코드/시그널로 끝난다.
+
+stdin/stdout/stderr와 그 밖의 상속된 파일 디스크립터(pass_fds)는 그대로 argv 프로세스에 넘어간다.
+네임스페이스를 만들지 못하면 stderr에 사유를 쓰고 종료 코드 125로 끝난다.
+
+채점 코드(core 등)를 import하지 않는 독립 스크립트이다.
+"""
+import ctypes
+import os
+import signal
+import sys
+
+CLONE_NEWNS = 0x00020000
+CLONE_NEWUSER = 0x10000000
+CLONE_NEWPID = 0x20000000
+CLONE_NEWNET = 0x40000000
+
+MS_NOSUID = 0x2
+MS_NODEV = 0x4
+MS_NOEXEC = 0x8
+MS_REC = 0x4000
+MS_PRIVATE = 1 << 18
+
+_PR_SET_PDEATHSIG = 1
+
+# 샌드박스 자체를 준비하지 못함 (docker run과 같은 관례)
+_SETUP_FAILED = 125
+_EXEC_FAILED = 127
+
+_libc = ctypes.CDLL(None, use_errno=True)
+
+
+def main() -> None:
+    separator = sys.argv.index("--")
+    options = dict(arg.split("=", 1) for arg in sys.argv[1:separator])
+    argv = sys.argv[separator + 1:]
+
+    try:
+        if options.get("cgroup"):
+            _write(os.path.join(options["cgroup"], "cgroup.procs"), str(os.getpid()))
+        _unshare(options)
+        _call(_libc.mount, b"none", b"/", None, MS_REC | MS_PRIVATE, None)
+    except OSError as e:
+        print(f"sandbox: {e}", file=sys.stderr)
+        os._exit(_SETUP_FAILED)
+
+    # init이 argv 프로세스의 종료 상태를 알려 주는 채널 (PID 1은 자기 자신에게 시그널을 보내 끝날 수 없음)
+    status_r, status_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(status_r)
+        code = _SETUP_FAILED
+        try:
+            _prctl(_PR_SET_PDEATHSIG, signal.SIGKILL)
+            code = _init(options, argv, status_w)
+        finally:
+            os._exit(code)
+
+    os.close(status_w)
+    _, status = _wait(pid)
+    with os.fdopen(status_r, "rb") as f:
+        reported = f.read()
+    if reported:
+        status = int(reported)
+    _exit_like(status)
+
+
+def _unshare(options: dict) -> None:
+    flags = CLONE_NEWNS | CLONE_NEWPID
+    if options.get("network") != "1":
+        flags |= CLONE_NEWNET
+    uid, gid = os.geteuid(), os.getegid()
+    if uid != 0:
+        flags |= CLONE_NEWUSER
+    _call(_libc.unshare, flags)
+    if uid != 0:
+        # 새 user 네임스페이스 안에서 root로 보이도록 (마운트 권한)
+        _write("/proc/self/setgroups", "deny")
+        _write("/proc/self/uid_map", f"0 {uid} 1")
+        _write("/proc/self/gid_map", f"0 {gid} 1")
+
+
+def _init(options: dict, argv: list, status_w: int) -> int:
+    """PID 1: 환경 준비 → argv 실행 → 고아 회수 → argv 종료 상태 전달"""
+    try:
+        _call(_libc.mount, b"proc", b"/proc", b"proc", MS_NOSUID | MS_NODEV | MS_NOEXEC, None)
+        scratch = options["scratch"]
+        _call(_libc.mount, b"tmpfs", scratch.encode(), b"tmpfs", MS_NOSUID | MS_NODEV,
+              f"size={int(options.get('tmpfs_mb', 64))}m,mode=1777".encode())
+    except OSError as e:
+        print(f"sandbox: {e}", file=sys.stderr)
+        return _SETUP_FAILED
+    if options.get("network") != "1":
+        _loopback_up()
+
+    env = dict(os.environ, TMPDIR=scratch, HOME=scratch)
+    child = os.fork()
+    if child == 0:
+        os.close(status_w)
+        try:
+            os.execvpe(argv[0], argv, env)
+        except OSError as e:
+            print(f"sandbox: {argv[0]}: {e.strerror}", file=sys.stderr)
+        os._exit(_EXEC_FAILED)
+
+    while True:
+        pid, status = _wait(-1)
+        if pid == child:
+            os.write(status_w, str(status).encode())
+            return 0
+
+
+def _loopback_up() -> None:
+    """새 network 네임스페이스의 lo 인터페이스 켜기 (localhost 통신만 허용)"""
+    import fcntl
+    import socket
+    import struct
+
+    siocgifflags, siocsifflags, iff_up = 0x8913, 0x8914, 0x1
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            request = struct.pack("16sh22x", b"lo", 0)
+            flags = struct.unpack("16sh", fcntl.ioctl(sock, siocgifflags, request)[:18])[1]
+            fcntl.ioctl(sock, siocsifflags, struct.pack("16sh22x", b"lo", flags | iff_up))
+    except OSError:
+        pass
+
+
+def _wait(pid: int):
+    while True:
+        try:
+            return os.waitpid(pid, 0)
+        except InterruptedError:
+            continue
+
+
+def _exit_like(status: int) -> None:
+    """wait 상태와 같은 방식으로 종료 (시그널 종료는 같은 시그널로)"""
+    if os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        if sig not in (signal.SIGKILL, signal.SIGSTOP):
+            signal.signal(sig, signal.SIG_DFL)
+        os.kill(os.getpid(), sig)
+        os._exit(128 + sig)
+    os._exit(os.WEXITSTATUS(status) if os.WIFEXITED(status) else _SETUP_FAILED)
+
+
+def _call(function, *args) -> None:
+    if function(*args) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"{function.__name__}: {os.strerror(errno)}")
+
+
+def _prctl(option: int, value: int) -> None:
+    try:
+        _call(_libc.prctl, option, value, 0, 0, 0)
+    except OSError:
+        pass
+
+
+def _write(path: str, text: str) -> None:
+    with open(path, "w") as f:
+        f.write(text)
+
+
+if __name__ == "__main__":
+    main()
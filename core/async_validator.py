@@ -0,0 +1,71 @@
+"""
+AsyncBaseValidator 추상 클래스
+학생 프로그램 실행/대기가 대부분인 검증기를 asyncio 이벤트 루프 하나에서 돌리기 위한 베이스
+"""
+import asyncio
+from abc import abstractmethod
+from typing import Dict, Any
+
+from . import tracing
+from .base_validator import BaseValidator
+
+
+class AsyncBaseValidator(BaseValidator):
+    """
+    비동기 검증기 클래스
+
+    setup_async()/teardown_async()와 코루틴 검증 함수(async def)를 쓸 수 있다.
+    프로세스 실행은 core.process_runner, 대기는 asyncio.sleep()을 사용하면
+    Grader.execute_async()/grade_many_async()에서 스레드 없이 여러 제출물을 동시에 채점한다.
+    validate()로 호출하면 새 이벤트 루프에서 실행되므로 기존 동기 경로와도 호환된다.
+
+    Example:
+        class TTLValidator(AsyncBaseValidator):
+            async def setup_async(self):
+                self.process = await InteractiveProcess.start([...])
+
+            async def _check_expire(self) -> bool:
+                await asyncio.sleep(2)
+                ...
+    """
+
+    @abstractmethod
+    async def setup_async(self) -> None:
+        """검증 전 초기화 작업 (비동기)"""
+        pass
+
+    async def teardown_async(self) -> None:
+        """검증 후 정리 작업 (비동기)"""
+        pass
+
+    def setup(self) -> None:
+        """동기 훅은 쓰지 않음 — 초기화는 validate_async()가 호출하는 setup_async()에서 함"""
+
+    def teardown(self) -> None:
+        """동기 훅은 쓰지 않음 — 정리는 validate_async()가 호출하는 teardown_async()에서 함"""
+
+    def validate(self) -> Dict[str, Any]:
+        """동기 호출용 진입점 (새 이벤트 루프에서 validate_async() 실행)"""
+        return asyncio.run(self.validate_async())
+
+    async def validate_async(self) -> Dict[str, Any]:
+        """
+        전체 검증 프로세스 실행 (비동기)
+
+        Returns:
+            검증 결과 딕셔너리
+        """
+        name = self.__class__.__name__
+        try:
+            with tracing.span("setup", cat="validator", validator=name):
+                await self.setup_async()
+            with tracing.span("build_checklist", cat="validator", validator=name):
+                self.build_checklist()
+            with tracing.span("execute_all", cat="validator", validator=name):
+                result = await self.checklist.execute_all_async()
+            return result
+        except Exception as e:
+            return self._error_result(e)
+        finally:
+            with tracing.span("teardown", cat="validator", validator=name):
+                await self.teardown_async()
@@ -3,7 +3,8 @@ BaseValidator 추상 클래스
 모든 플러그인 검증기는 이 클래스를 상속받아야 함
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from . import tracing
 from .checklist import Checklist
 
 
@@ -12,18 +13,39 @@ class BaseValidator(ABC):
     추상 검증기 클래스
 
     모든 미션 플러그인은 이 클래스를 상속받아 validate() 메서드를 구현해야 함
+
+    Attributes:
+        shares_state: 프로세스 전역 상태(sys.path, sys.modules, 제출물 디렉토리 파일 등)를
+            변경하는 검증기면 True. 병렬 실행 시 이런 검증기끼리는 직렬화된다.
+        input_files: 검증기가 읽는 제출물 파일의 glob 패턴 (submission_dir 기준, 예: ["**/*.py"]).
+            결과 캐시 사용 시 이 파일들이 바뀌지 않았으면 이전 결과를 재사용한다.
+            None이면 제출물 전체를 입력으로 간주한다 (input_modules도 None일 때).
+        input_modules: 검증기가 읽는 학생 모듈 (예: ["models"]). 이 모듈과 그 모듈이 (간접적으로)
+            import하는 제출물 모듈 파일(core.source_check.student_module_files())이 input_files에
+            더해진다. 어떤 파일을 import하는지 알 수 없으면 "**/*.py" 전체를 입력으로 본다.
+        sleep_bound: 실행 시간 대부분이 실제 대기(sleep)인 단계가 있는 AsyncBaseValidator면 True
+            (예: TTL 만료 대기). 배치 채점 시 이런 미션은 워커마다 여러 제출물을 이벤트 루프
+            하나에서 동시에 채점하여 대기 시간을 겹친다.
     """
 
+    shares_state: bool = False
+    input_files: Optional[List[str]] = None
+    input_modules: Optional[List[str]] = None
+    sleep_bound: bool = False
+
     def __init__(self, mission_config: Dict[str, Any]):
         """
         Args:
             mission_config: 미션 설정 딕셔너리 (config.yaml에서 로드)
         """
         self.config = mission_config
+        execution = mission_config.get("execution") or {}
         self.checklist = Checklist(
             name=mission_config.get("name", "Unknown Mission"),
             description=mission_config.get("description", ""),
-            passing_score=mission_config.get("passing_score", 70)
+            passing_score=mission_config.get("passing_score", 70),
+            max_workers=execution.get("check_workers", 1),
+            decide_only=execution.get("decide_only", False)
         )
 
     @abstractmethod
@@ -57,18 +79,27 @@ class BaseValidator(ABC):
         Returns:
             검증 결과 딕셔너리
         """
+        name = self.__class__.__name__
         try:
-            self.setup()
-            self.build_checklist()
-            result = self.checklist.execute_all()
+            with tracing.span("setup", cat="validator", validator=name):
+                self.setup()
+            with tracing.span("build_checklist", cat="validator", validator=name):
+                self.build_checklist()
+            with tracing.span("execute_all", cat="validator", validator=name):
+                result = self.checklist.execute_all()
             return result
         except Exception as e:
-            return {
-                "error": str(e),
-                "is_passed": False,
-                "score": 0,
-                "name": self.config.get("name", "Unknown"),
-                "description": self.config.get("description", "")
-            }
+            return self._error_result(e)
         finally:
-            self.teardown()
+            with tracing.span("teardown", cat="validator", validator=name):
+                self.teardown()
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """검증 과정에서 예외 발생 시 결과 딕셔너리"""
+        return {
+            "error": str(error),
+            "is_passed": False,
+            "score": 0,
+            "name": self.config.get("name", "Unknown"),
+            "description": self.config.get("description", "")
+        }
@@ -1,10 +1,15 @@
 """
 개별 체크 항목 클래스
 """
-from typing import Callable, Optional
+import inspect
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+from . import tracing
+from .resource_usage import ResourceMeter, record_timeout
+
 
 class CheckStatus(Enum):
     """체크 상태 열거형"""
@@ -12,6 +17,13 @@ class CheckStatus(Enum):
     PASSED = "passed"        # 통과
     FAILED = "failed"        # 실패
     ERROR = "error"          # 에러 발생
+    SKIPPED = "skipped"      # 선행 항목 미통과로 실행하지 않음
+
+
+class ConcurrencyClass(Enum):
+    """체크 항목 동시 실행 분류"""
+    SERIAL = "serial"        # 단독 실행 (다른 항목과 겹치지 않음)
+    PARALLEL = "parallel"    # 다른 PARALLEL 항목과 동시 실행 가능 (독립적인 검증)
 
 
 @dataclass
@@ -23,9 +35,11 @@ class CheckItem:
         id: 체크 항목 고유 ID (예: "ssh_port_check")
         description: 체크 항목 설명 (예: "SSH 포트가 20022로 설정되어 있는지 확인")
         points: 배점 (기본 10점)
-        validator: 검증 함수 (Callable, 반환값: bool)
+        validator: 검증 함수 (Callable, 반환값: bool — AsyncBaseValidator에서는 코루틴 함수도 가능)
         hint: 실패 시 힌트 메시지
         ai_trap: AI가 놓치기 쉬운 함정 요소 여부
+        depends_on: 선행 체크 항목 ID 목록 (먼저 실행되며, 하나라도 통과하지 못하면 SKIPPED)
+        concurrency: 동시 실행 분류 (기본 SERIAL)
     """
     id: str
     description: str
@@ -33,32 +47,79 @@ class CheckItem:
     validator: Callable[[], bool]
     hint: Optional[str] = None
     ai_trap: bool = False
+    depends_on: List[str] = field(default_factory=list)
+    concurrency: ConcurrencyClass = ConcurrencyClass.SERIAL
 
     # 실행 결과 (dataclass field로 기본값 설정)
     status: CheckStatus = field(default=CheckStatus.PENDING)
     error_message: Optional[str] = field(default=None)
+    skip_reason: Optional[str] = field(default=None)
     execution_time: float = field(default=0.0)
+    # 리소스 사용량 (wall_ns, cpu_s, children_cpu_s, children_max_rss_kb, spawned_processes)
+    resources: Dict[str, Any] = field(default_factory=dict)
 
     def execute(self) -> bool:
         """
-        검증 함수 실행
+        검증 함수 실행 (소요 시간/CPU 시간/자식 프로세스 사용량 기록)
+
+        Returns:
+            검증 성공 여부
+        """
+        with tracing.span(self.id, cat="check"), ResourceMeter(per_thread=True) as meter:
+            try:
+                result = self.validator()
+                if inspect.isawaitable(result):
+                    # 코루틴 검증 함수는 execute_async()로만 실행 가능
+                    result.close()
+                    raise TypeError("비동기 검증 함수는 AsyncBaseValidator에서만 사용할 수 있습니다")
+                self._record(result)
+            except Exception as e:
+                result = self._record_error(e)
+
+        self._record_usage(meter)
+        return result
+
+    async def execute_async(self) -> bool:
+        """
+        execute()의 비동기 버전
+
+        검증 함수가 코루틴(async def)이면 이벤트 루프에서 기다리고,
+        일반 함수면 그대로 호출한다.
 
         Returns:
             검증 성공 여부
         """
-        import time
-        start_time = time.time()
-
-        try:
-            result = self.validator()
-            self.status = CheckStatus.PASSED if result else CheckStatus.FAILED
-            return result
-        except Exception as e:
-            self.status = CheckStatus.ERROR
-            self.error_message = str(e)
-            return False
-        finally:
-            self.execution_time = time.time() - start_time
+        with tracing.span(self.id, cat="check"), ResourceMeter(per_thread=True) as meter:
+            try:
+                result = self.validator()
+                if inspect.isawaitable(result):
+                    result = await result
+                self._record(result)
+            except Exception as e:
+                result = self._record_error(e)
+
+        self._record_usage(meter)
+        return result
+
+    def _record(self, result: Any) -> None:
+        self.status = CheckStatus.PASSED if result else CheckStatus.FAILED
+
+    def _record_error(self, error: Exception) -> bool:
+        if isinstance(error, subprocess.TimeoutExpired):
+            record_timeout()
+        self.status = CheckStatus.ERROR
+        self.error_message = str(error)
+        return False
+
+    def _record_usage(self, meter: ResourceMeter) -> None:
+        self.resources = meter.usage
+        self.execution_time = meter.usage["wall_ns"] / 1e9
+
+    def skip(self, reason: str) -> None:
+        """검증 함수를 실행하지 않고 SKIPPED로 기록"""
+        self.status = CheckStatus.SKIPPED
+        self.skip_reason = reason
+        self.execution_time = 0.0
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (결과 저장용)"""
@@ -68,7 +129,9 @@ class CheckItem:
             "points": self.points,
             "status": self.status.value,
             "error_message": self.error_message,
-            "execution_time": round(self.execution_time, 3),
+            "skip_reason": self.skip_reason,
+            "execution_time": round(self.execution_time, 6),
+            "resources": self.resources,
             "ai_trap": self.ai_trap,
             "hint": self.hint if self.status != CheckStatus.PASSED else None
         }
@@ -1,24 +1,32 @@
 """
 체크리스트 관리 클래스
 """
-from typing import List, Dict, Any
-from .check_item import CheckItem, CheckStatus
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional
+from .check_item import CheckItem, CheckStatus, ConcurrencyClass
 
 
 class Checklist:
     """
     체크리스트 (여러 CheckItem의 집합)
     """
-    def __init__(self, name: str, description: str, passing_score: int = 70):
+    def __init__(self, name: str, description: str, passing_score: int = 70,
+                 max_workers: int = 1, decide_only: bool = False):
         """
         Args:
             name: 체크리스트 이름
             description: 설명
             passing_score: 합격 기준 점수 (기본 70점)
+            max_workers: PARALLEL 항목 동시 실행 스레드 수 (기본 1 = 순차 실행)
+            decide_only: 합격/불합격이 확정되면 남은 항목을 실행하지 않음 (점수는 부분 집계)
         """
         self.name = name
         self.description = description
         self.passing_score = passing_score
+        self.max_workers = max_workers
+        self.decide_only = decide_only
         self.items: List[CheckItem] = []
 
     def add_item(self, item: CheckItem) -> None:
@@ -29,22 +37,68 @@ class Checklist:
         """
         모든 체크 항목 실행
 
+        depends_on 순서를 지키며, 선행 항목이 통과하지 못한 항목은 실행하지 않고
+        SKIPPED로 기록한다. decide_only 모드에서는 합격/불합격이 확정되는 순간
+        이후 항목도 SKIPPED로 기록한다. max_workers > 1이면 PARALLEL 항목을
+        스레드 풀에서 동시에 실행한다. SERIAL 항목은 실행 중인 항목이
+        모두 끝난 뒤 단독으로 실행된다.
+        리포트 순서와 점수 집계는 항상 add_item 순서를 따른다.
+
+        Returns:
+            실행 결과 딕셔너리
+        """
+        ordered = self._execution_order()
+
+        if self.max_workers > 1:
+            self._execute_parallel(ordered)
+        else:
+            for item in ordered:
+                self._run_item(item)
+
+        return self._summarize()
+
+    async def execute_all_async(self) -> Dict[str, Any]:
+        """
+        모든 체크 항목을 이벤트 루프에서 실행 (AsyncBaseValidator용)
+
+        execute_all()과 같은 순서/SKIPPED/decide_only 규칙을 따르며,
+        PARALLEL 항목은 max_workers와 관계없이 코루틴으로 동시에 실행한다.
+
         Returns:
             실행 결과 딕셔너리
         """
+        tasks: Dict[str, asyncio.Task] = {}
+        for item in self._execution_order():
+            if item.concurrency is ConcurrencyClass.PARALLEL:
+                deps = [tasks[dep] for dep in item.depends_on if dep in tasks]
+                tasks[item.id] = asyncio.ensure_future(self._run_after_async(item, deps))
+            else:
+                if tasks:
+                    await asyncio.gather(*tasks.values())
+                    tasks.clear()
+                await self._run_item_async(item)
+        if tasks:
+            await asyncio.gather(*tasks.values())
+
+        return self._summarize()
+
+    def _summarize(self) -> Dict[str, Any]:
+        """add_item 순서로 결과 집계"""
         results = []
         passed_count = 0
+        skipped_count = 0
         total_points = 0
         earned_points = 0
 
         for item in self.items:
-            success = item.execute()
             results.append(item.to_dict())
 
             total_points += item.points
-            if success:
+            if item.status == CheckStatus.PASSED:
                 passed_count += 1
                 earned_points += item.points
+            elif item.status == CheckStatus.SKIPPED:
+                skipped_count += 1
 
         score = (earned_points / total_points * 100) if total_points > 0 else 0
         is_passed = score >= self.passing_score
@@ -54,6 +108,7 @@ class Checklist:
             "description": self.description,
             "total_items": len(self.items),
             "passed_items": passed_count,
+            "skipped_items": skipped_count,
             "total_points": total_points,
             "earned_points": earned_points,
             "score": round(score, 2),
@@ -65,3 +120,108 @@ class Checklist:
     def get_total_points(self) -> int:
         """총 배점 계산"""
         return sum(item.points for item in self.items)
+
+    def is_decided(self) -> bool:
+        """
+        현재까지의 결과만으로 합격/불합격이 확정되었는지 확인
+
+        통과 점수만으로 합격선을 넘었거나, 아직 실행하지 않은 항목을
+        모두 통과해도 합격선에 못 미치면 확정.
+        """
+        total_points = self.get_total_points()
+        if total_points <= 0:
+            return False
+
+        earned_points = sum(item.points for item in self.items
+                            if item.status == CheckStatus.PASSED)
+        pending_points = sum(item.points for item in self.items
+                             if item.status == CheckStatus.PENDING)
+
+        if earned_points / total_points * 100 >= self.passing_score:
+            return True
+        return (earned_points + pending_points) / total_points * 100 < self.passing_score
+
+    def _skip_reason(self, item: CheckItem) -> Optional[str]:
+        """실행하지 않을 이유 (실행해야 하면 None)"""
+        if self.decide_only and self.is_decided():
+            return "합격/불합격 확정으로 실행 생략 (decide-only)"
+
+        items_by_id = {other.id: other for other in self.items}
+        failed = [dep for dep in item.depends_on
+                  if items_by_id[dep].status != CheckStatus.PASSED]
+        if failed:
+            return f"선행 항목 미통과: {', '.join(failed)}"
+        return None
+
+    def _run_item(self, item: CheckItem) -> None:
+        """선행 항목이 모두 통과했으면 실행, 아니면 SKIPPED 처리 (비용 0)"""
+        reason = self._skip_reason(item)
+        if reason:
+            item.skip(reason)
+            return
+        item.execute()
+
+    async def _run_item_async(self, item: CheckItem) -> None:
+        """_run_item의 비동기 버전"""
+        reason = self._skip_reason(item)
+        if reason:
+            item.skip(reason)
+            return
+        await item.execute_async()
+
+    def _execution_order(self) -> List[CheckItem]:
+        """
+        depends_on을 반영한 실행 순서 (선행 항목이 없으면 add_item 순서 유지)
+
+        Raises:
+            ValueError: 존재하지 않는 선행 항목 또는 순환 의존성
+        """
+        item_ids = {item.id for item in self.items}
+        for item in self.items:
+            for dep in item.depends_on:
+                if dep not in item_ids:
+                    raise ValueError(f"알 수 없는 선행 항목: {item.id} → {dep}")
+
+        ordered: List[CheckItem] = []
+        done = set()
+        remaining = list(self.items)
+        while remaining:
+            ready = next(
+                (item for item in remaining if all(dep in done for dep in item.depends_on)),
+                None,
+            )
+            if ready is None:
+                cycle = ", ".join(item.id for item in remaining)
+                raise ValueError(f"체크 항목 순환 의존성: {cycle}")
+            ordered.append(ready)
+            done.add(ready.id)
+            remaining.remove(ready)
+        return ordered
+
+    def _execute_parallel(self, ordered: List[CheckItem]) -> None:
+        """PARALLEL 항목은 스레드 풀에 제출, SERIAL 항목은 배리어 후 단독 실행"""
+        futures: Dict[str, Future] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for item in ordered:
+                if item.concurrency is ConcurrencyClass.PARALLEL:
+                    # 선행 항목은 먼저 제출되었으므로 FIFO 풀에서 교착되지 않음
+                    deps = [futures[dep] for dep in item.depends_on if dep in futures]
+                    # 컨텍스트 전달 → 풀 스레드의 프로세스 생성/타임아웃도 검증기 미터에 집계
+                    context = contextvars.copy_context()
+                    futures[item.id] = executor.submit(context.run, self._run_after, item, deps)
+                else:
+                    wait(list(futures.values()))
+                    futures.clear()
+                    self._run_item(item)
+
+    def _run_after(self, item: CheckItem, deps: List[Future]) -> None:
+        """선행 항목 완료를 기다린 뒤 체크 항목 실행"""
+        wait(deps)
+        self._run_item(item)
+
+    async def _run_after_async(self, item: CheckItem, deps: List["asyncio.Task"]) -> None:
+        """선행 항목 태스크 완료를 기다린 뒤 체크 항목 실행"""
+        if deps:
+            await asyncio.wait(deps)
+        await self._run_item_async(item)
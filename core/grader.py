@@ -1,30 +1,86 @@
 """
 채점 엔진 (Grader)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+import asyncio
+import contextvars
 import importlib
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from . import tracing
+from .async_validator import AsyncBaseValidator
 from .base_validator import BaseValidator
+from .metrics import GradingMetrics
+from .resource_usage import ResourceMeter
+from .result_cache import ResultCache
+from .submission_health import SCOPE_KEY as HEALTH_KEY, SubmissionHealth, current_health
+from .submission_scope import SubmissionScope
 from .validation_result import ValidationResult
 
 
+# 워커 프로세스별 캐시 (배치 채점 시 미션 설정/검증기 클래스 재사용)
+_VALIDATOR_CLASSES: Dict[Tuple[str, str], type] = {}
+_WORKER_STATE: Dict[str, Any] = {}
+
+# shares_state 검증기 직렬화용 (sys.path/sys.modules 등 프로세스 전역 상태 보호)
+_SHARED_STATE_LOCK = threading.Lock()
+
+# 작업마다 새 워커 (forkserver + max_tasks_per_child는 Python 3.11+)
+_FRESH_WORKERS_SUPPORTED = (
+    sys.version_info >= (3, 11) and "forkserver" in multiprocessing.get_all_start_methods()
+)
+
+# forkserver가 항상 미리 import하는 모듈 (채점 코어)
+_FRAMEWORK_MODULES = ("core.grader", "core.supervised_executor", "core.process_runner")
+
+
+def load_validator_class(module_path: str, class_name: str) -> type:
+    """
+    검증기 클래스를 동적으로 로드 (프로세스 내 캐시)
+
+    Args:
+        module_path: 모듈 경로 (예: "plugins.ds.validators.lru_validator")
+        class_name: 클래스 이름 (예: "LRUValidator")
+
+    Returns:
+        검증기 클래스
+    """
+    key = (module_path, class_name)
+    if key not in _VALIDATOR_CLASSES:
+        with tracing.span(f"import {class_name}", cat="import", module=module_path):
+            module = importlib.import_module(module_path)
+        _VALIDATOR_CLASSES[key] = getattr(module, class_name)
+    return _VALIDATOR_CLASSES[key]
+
+
 class Grader:
     """
     채점 엔진
     플러그인을 로드하고 실행하여 최종 결과를 생성
     """
 
-    def __init__(self, student_id: str, mission_id: str, mission_config: Dict[str, Any]):
+    def __init__(self, student_id: str, mission_id: str, mission_config: Dict[str, Any],
+                 cache: Optional[ResultCache] = None,
+                 metrics: Optional[GradingMetrics] = None):
         """
         Args:
             student_id: 학습자 ID
             mission_id: 미션 ID (예: "linux_level1_mission01")
             mission_config: 미션 설정 (config.yaml에서 로드)
+            cache: 채점 결과 캐시 (None이면 사용 안 함)
+            metrics: 채점 메트릭 레지스트리 (None이면 기록 안 함)
         """
         self.student_id = student_id
         self.mission_id = mission_id
         self.config = mission_config
+        self.cache = cache
+        self.metrics = metrics
         self.result = ValidationResult(student_id, mission_id)
 
     def load_validators(self) -> List[BaseValidator]:
@@ -37,12 +93,10 @@ class Grader:
         validators = []
 
         for validator_config in self.config.get("validators", []):
-            module_path = validator_config["module"]
-            class_name = validator_config["class"]
-
-            # 동적 import
-            module = importlib.import_module(module_path)
-            validator_class = getattr(module, class_name)
+            # 동적 import (프로세스 내 캐시)
+            validator_class = load_validator_class(
+                validator_config["module"], validator_config["class"]
+            )
 
             # 인스턴스 생성
             validator = validator_class(self.config)
@@ -54,24 +108,605 @@ class Grader:
         """
         모든 검증기 실행 및 결과 수집
 
+        config.yaml의 execution.parallel_validators가 true이면 검증기를
+        스레드 풀에서 동시에 실행한다 (shares_state 검증기끼리는 직렬화).
+        execution.decide_only가 true이면 검증기 하나가 불합격하는 순간
+        최종 불합격이 확정되므로 남은 검증기는 실행하지 않는다.
+        결과는 항상 config.yaml에 정의된 순서대로 기록된다.
+        결과 캐시가 지정되어 있고 제출물/설정/채점 코드가 이전 채점과 같으면
+        검증기를 실행하지 않고 저장된 결과를 반환한다. 제출물이 바뀌었으면
+        입력 파일(input_files)이 바뀐 검증기만 다시 실행한다.
+        AsyncBaseValidator가 포함된 미션은 이벤트 루프 하나에서 execute_async()와 같은 경로로 실행한다.
+        이미 이벤트 루프가 도는 스레드에서 호출하면 전용 스레드의 새 이벤트 루프에서 채점하고
+        끝날 때까지 호출한 루프를 막으므로, 비동기 코드에서는 execute_async()/grade_many_async()를 쓴다.
+
         Returns:
             ValidationResult 객체
         """
+        with tracing.span(f"grade {self.student_id}", cat="grader", mission_id=self.mission_id):
+            result = self._grade()
+        if self.metrics is not None:
+            self.metrics.record(result)
+        return result
+
+    async def execute_async(self) -> ValidationResult:
+        """
+        execute()의 비동기 버전 (이벤트 루프 하나에서 여러 제출물 동시 채점용)
+
+        AsyncBaseValidator는 현재 이벤트 루프에서 실행하고, 동기 검증기와
+        shares_state 검증기는 기본 스레드 풀에서 실행한다.
+        parallel_validators/decide_only/결과 캐시 규칙은 execute()와 같다.
+
+        Returns:
+            ValidationResult 객체
+        """
+        with tracing.span(f"grade {self.student_id}", cat="grader", mission_id=self.mission_id):
+            result = await self._grade_async()
+        if self.metrics is not None:
+            self.metrics.record(result)
+        return result
+
+    def _grade(self) -> ValidationResult:
+        """캐시 조회 → 검증기 실행 → 결과 집계"""
+        if self._has_async_validators():
+            # 비동기 검증기는 이벤트 루프 하나에서 실행 (검증기끼리 학생 프로그램 세션 등을 공유)
+            return _run_coroutine(self._grade_async)
+
+        start_time = time.perf_counter()
+
+        cache_key, cached = self._lookup(start_time)
+        if cached is not None:
+            return cached
+
         validators = self.load_validators()
 
-        for validator in validators:
-            validator_name = validator.__class__.__name__
+        # 제출물 단위 공유 자원(소스 인덱스 등)은 이 채점이 끝나면 정리
+        scope = SubmissionScope()
+        health = self._health(scope)
+        try:
+            with scope.activate():
+                results, decide_only = self._run_all(validators)
+        finally:
+            scope.close()
 
-            try:
-                result = validator.validate()
-                self.result.add_result(validator_name, result)
-            except Exception as e:
-                # 검증기 실행 중 오류 발생 시 기록
-                self.result.add_result(validator_name, {
-                    "error": f"검증기 실행 실패: {str(e)}",
-                    "is_passed": False,
-                    "score": 0
-                })
+        self.result.circuit_breaker = health.to_dict() if health is not None else None
+        return self._collect(validators, results, decide_only, start_time, cache_key)
+
+    def _health(self, scope: SubmissionScope) -> Optional[SubmissionHealth]:
+        """제출물의 학생 프로그램 상태 (검증기끼리 공유하는 circuit breaker, 꺼져 있으면 None)"""
+        return scope.get(HEALTH_KEY, lambda: SubmissionHealth.from_config(self.config))
+
+    def _run_all(self, validators: List[BaseValidator]) -> Tuple[List[Dict[str, Any]], bool]:
+        """검증기 실행 (parallel_validators/decide_only 적용) → (설정 순서 결과, decide_only)"""
+        execution = self.config.get("execution") or {}
+        decide_only = bool(execution.get("decide_only"))
+        if execution.get("parallel_validators") and len(validators) > 1:
+            max_workers = execution.get("max_workers") or len(validators)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # 워커 스레드에서도 현재 SubmissionScope가 보이도록 컨텍스트 복사
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._run_or_reuse, v)
+                    for v in validators
+                ]
+                if decide_only:
+                    for future in as_completed(futures):
+                        if not future.result().get("is_passed", False):
+                            # 아직 시작하지 않은 검증기만 취소됨
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                results = [
+                    self._not_run_result() if future.cancelled() else future.result()
+                    for future in futures
+                ]
+        else:
+            results = []
+            for validator in validators:
+                if decide_only and any(not r.get("is_passed", False) for r in results):
+                    results.append(self._not_run_result())
+                else:
+                    results.append(self._run_or_reuse(validator))
+        return results, decide_only
+
+    async def _grade_async(self) -> ValidationResult:
+        """_grade()의 비동기 버전"""
+        start_time = time.perf_counter()
 
+        cache_key, cached = self._lookup(start_time)
+        if cached is not None:
+            return cached
+
+        validators = self.load_validators()
+
+        # 제출물 단위 공유 자원은 이 채점이 끝나면 정리
+        scope = SubmissionScope()
+        health = self._health(scope)
+        try:
+            with scope.activate():
+                results, decide_only = await self._run_all_async(validators)
+        finally:
+            await scope.aclose()
+
+        self.result.circuit_breaker = health.to_dict() if health is not None else None
+        return self._collect(validators, results, decide_only, start_time, cache_key)
+
+    async def _run_all_async(self, validators: List[BaseValidator]) -> Tuple[List[Dict[str, Any]], bool]:
+        """검증기 실행 (parallel_validators/decide_only 적용) → (설정 순서 결과, decide_only)"""
+        execution = self.config.get("execution") or {}
+        decide_only = bool(execution.get("decide_only"))
+        if execution.get("parallel_validators") and len(validators) > 1:
+            tasks = [asyncio.ensure_future(self._run_or_reuse_async(v)) for v in validators]
+            if decide_only:
+                for done in asyncio.as_completed(tasks):
+                    if not (await done).get("is_passed", False):
+                        # 실행 중인 비동기 검증기도 취소됨 (스레드 풀 검증기는 끝까지 실행)
+                        for pending in tasks:
+                            pending.cancel()
+                        break
+            await asyncio.gather(*tasks, return_exceptions=True)
+            results = [
+                self._not_run_result() if task.cancelled() else task.result()
+                for task in tasks
+            ]
+        else:
+            results = []
+            for validator in validators:
+                if decide_only and any(not r.get("is_passed", False) for r in results):
+                    results.append(self._not_run_result())
+                else:
+                    results.append(await self._run_or_reuse_async(validator))
+        return results, decide_only
+
+    def _has_async_validators(self) -> bool:
+        return any(
+            issubclass(load_validator_class(vc["module"], vc["class"]), AsyncBaseValidator)
+            for vc in self.config.get("validators", [])
+        )
+
+    def _lookup(self, start_time: float) -> Tuple[Optional[str], Optional[ValidationResult]]:
+        """제출물 단위 캐시 조회 → (캐시 키, 적중 시 복원한 결과)"""
+        if self.cache is None:
+            return None, None
+        with tracing.span("cache lookup", cat="cache"):
+            cache_key = self._cache_key()
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+        if cached is None:
+            return cache_key, None
+        return cache_key, self._restore_cached(cached, start_time)
+
+    def _collect(self, validators: List[BaseValidator], results: List[Dict[str, Any]],
+                 decide_only: bool, start_time: float,
+                 cache_key: Optional[str]) -> ValidationResult:
+        """검증기 결과를 설정 순서대로 기록하고 최종 결과 집계/캐시 저장"""
+        for validator, result in zip(validators, results):
+            self.result.add_result(validator.__class__.__name__, result)
+
+        self.result.decide_only = decide_only
         self.result.finalize()
+        self.result.duration = time.perf_counter() - start_time
+
+        # 검증기 실행 오류/타임아웃/circuit breaker 중단(일시적일 수 있음)이 있는 결과는 캐시하지 않음
+        if (cache_key is not None and self.result.circuit_breaker is None
+                and not any(_transient(r["result"]) for r in self.result.results)):
+            self._put_cache(cache_key, self.result.to_dict())
         return self.result
+
+    def _cache_key(self) -> Optional[str]:
+        """결과 캐시 키 (캐시 미사용, 제출물 없음, 해시 실패 시 None)"""
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.submission_key(self.mission_id, self.config)
+        except (OSError, ImportError):
+            return None
+
+    def _restore_cached(self, cached: Dict[str, Any], start_time: float) -> ValidationResult:
+        """캐시된 결과를 현재 학습자/채점 시각으로 복원"""
+        result = ValidationResult.from_dict(cached)
+        result.student_id = self.student_id
+        result.timestamp = self.result.timestamp
+        result.cache_hit = True
+        result.duration = time.perf_counter() - start_time
+        self.result = result
+        return result
+
+    def _run_or_reuse(self, validator: BaseValidator) -> Dict[str, Any]:
+        """입력 파일이 바뀌지 않은 검증기는 캐시된 결과 재사용, 아니면 실행 후 저장"""
+        key, cached = self._lookup_validator(validator)
+        if cached is not None:
+            return cached
+
+        result = self._run_validator(validator)
+        self._store_validator(key, result)
+        return result
+
+    async def _run_or_reuse_async(self, validator: BaseValidator) -> Dict[str, Any]:
+        """_run_or_reuse()의 비동기 버전"""
+        key, cached = self._lookup_validator(validator)
+        if cached is not None:
+            return cached
+
+        if isinstance(validator, AsyncBaseValidator) and not validator.shares_state:
+            result = await self._run_validator_async(validator)
+        else:
+            # 동기 검증기는 스레드 풀에서 실행 (이벤트 루프를 막지 않음)
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            result = await loop.run_in_executor(None, context.run, self._run_validator, validator)
+        self._store_validator(key, result)
+        return result
+
+    def _lookup_validator(self, validator: BaseValidator) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """검증기 단위 캐시 조회 → (캐시 키, 적중 시 결과)"""
+        if self.cache is None:
+            return None, None
+        try:
+            key = self.cache.validator_key(self.mission_id, self.config, type(validator))
+        except (OSError, ImportError):
+            return None, None
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return key, {**cached, "cache_hit": True}
+        return key, None
+
+    def _store_validator(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        if key is None or _transient(result):
+            return
+        health = current_health()
+        if health is not None and health.to_dict() is not None:
+            # circuit breaker가 열린 뒤의 결과는 실행하지 않은 항목을 포함할 수 있음
+            return
+        self._put_cache(key, result)
+
+    def _put_cache(self, key: str, data: Dict[str, Any]) -> None:
+        """캐시 저장 (실패하면 저장하지 않은 것으로 처리 — 채점 결과에는 영향 없음)"""
+        try:
+            self.cache.put(key, data)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _run_validator(validator: BaseValidator) -> Dict[str, Any]:
+        """검증기 하나 실행 (shares_state 검증기는 전역 락으로 직렬화)"""
+        try:
+            if validator.shares_state:
+                with _SHARED_STATE_LOCK:
+                    return Grader._measure(validator)
+            return Grader._measure(validator)
+        except Exception as e:
+            # 검증기 실행 중 오류 발생 시 기록
+            return {
+                "error": f"검증기 실행 실패: {str(e)}",
+                "is_passed": False,
+                "score": 0
+            }
+
+    @staticmethod
+    async def _run_validator_async(validator: AsyncBaseValidator) -> Dict[str, Any]:
+        """비동기 검증기 하나 실행 (현재 이벤트 루프)"""
+        name = validator.__class__.__name__
+        try:
+            with tracing.span(f"validate {name}", cat="validator"), ResourceMeter() as meter:
+                result = await validator.validate_async()
+        except Exception as e:
+            return {
+                "error": f"검증기 실행 실패: {str(e)}",
+                "is_passed": False,
+                "score": 0
+            }
+        result["resources"] = meter.usage
+        return result
+
+    @staticmethod
+    def _measure(validator: BaseValidator) -> Dict[str, Any]:
+        """검증기 실행 + 리소스 사용량 기록 (프로세스 전체 기준)"""
+        name = validator.__class__.__name__
+        with tracing.span(f"validate {name}", cat="validator"), ResourceMeter() as meter:
+            result = validator.validate()
+        result["resources"] = meter.usage
+        return result
+
+    @staticmethod
+    def _not_run_result() -> Dict[str, Any]:
+        """decide-only 모드에서 실행하지 않은 검증기의 결과"""
+        return {
+            "is_passed": False,
+            "score": 0,
+            "skipped": True,
+            "skip_reason": "다른 검증기 불합격으로 최종 불합격 확정, 실행 생략 (decide-only)"
+        }
+
+
+def _transient(result: Dict[str, Any]) -> bool:
+    """다시 채점하면 달라질 수 있는 검증기 결과 (실행 오류 또는 학생 프로그램 타임아웃)"""
+    return "error" in result or (result.get("resources") or {}).get("timeouts", 0) > 0
+
+
+# -- 배치 채점 --
+
+def _init_worker(mission_id: str, mission_config: Dict[str, Any],
+                 cache: Optional[ResultCache] = None, trace: bool = False) -> None:
+    """워커 프로세스 초기화: 미션 설정 보관 + 검증기 클래스 선로딩"""
+    _WORKER_STATE["mission_id"] = mission_id
+    _WORKER_STATE["mission_config"] = mission_config
+    _WORKER_STATE["cache"] = cache
+    _WORKER_STATE["trace"] = trace
+    if trace:
+        tracing.enable("grader worker")
+    for validator_config in mission_config.get("validators", []):
+        load_validator_class(validator_config["module"], validator_config["class"])
+
+
+def _failed_result(student_id: str, mission_id: str, error: Exception,
+                   start_time: float) -> ValidationResult:
+    """검증기 로딩 실패 등 Grader 밖으로 나온 오류도 결과로 기록"""
+    result = ValidationResult(student_id, mission_id)
+    result.add_result("Grader", {
+        "error": f"채점 실패: {str(error)}",
+        "is_passed": False,
+        "score": 0
+    })
+    result.finalize()
+    result.duration = time.perf_counter() - start_time
+    return result
+
+
+def _run_coroutine(coroutine_function: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    동기 코드에서 코루틴 실행
+
+    현재 스레드에 이벤트 루프가 없으면 asyncio.run(), 이미 돌고 있으면(asyncio.run()은
+    RuntimeError) 전용 스레드의 새 이벤트 루프에서 실행하고 끝날 때까지 기다린다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine_function())
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="grader-loop") as executor:
+        # 전용 스레드에서도 호출한 쪽의 컨텍스트(현재 스코프, 트레이스 등)가 보이도록 복사
+        context = contextvars.copy_context()
+        return executor.submit(context.run, lambda: asyncio.run(coroutine_function())).result()
+
+
+def _submission_config(submission_dir: str) -> Dict[str, Any]:
+    config = dict(_WORKER_STATE["mission_config"])
+    config["submission_dir"] = submission_dir
+    return config
+
+
+def _grade_submission(student_id: str, submission_dir: str) -> ValidationResult:
+    """워커에서 학습자 한 명 채점 (미션 설정은 _init_worker에서 로드된 것 재사용)"""
+    mission_id = _WORKER_STATE["mission_id"]
+    config = _submission_config(submission_dir)
+
+    start_time = time.perf_counter()
+    try:
+        result = Grader(student_id, mission_id, config, cache=_WORKER_STATE["cache"]).execute()
+    except Exception as e:
+        result = _failed_result(student_id, mission_id, e, start_time)
+
+    # 워커 프로세스의 트레이스 이벤트는 결과에 실어 부모 프로세스로 전달
+    if _WORKER_STATE["trace"]:
+        result.trace_events = tracing.drain()
+    return result
+
+
+async def _grade_submission_async(student_id: str, submission_dir: str) -> ValidationResult:
+    """_grade_submission()의 비동기 버전 (트레이스 이벤트는 호출한 쪽에서 수집)"""
+    mission_id = _WORKER_STATE["mission_id"]
+    config = _submission_config(submission_dir)
+
+    start_time = time.perf_counter()
+    try:
+        return await Grader(student_id, mission_id, config,
+                            cache=_WORKER_STATE["cache"]).execute_async()
+    except Exception as e:
+        return _failed_result(student_id, mission_id, e, start_time)
+
+
+def _grade_chunk(chunk: List[Tuple[str, str]]) -> List[ValidationResult]:
+    """
+    워커에서 제출물 묶음 채점
+
+    두 명 이상이면 이벤트 루프 하나에서 동시에 채점한다. 한 제출물이 대기(sleep) 단계에
+    있는 동안 다른 제출물의 실행/AST 검사가 진행된다.
+    """
+    if len(chunk) == 1:
+        return [_grade_submission(*chunk[0])]
+
+    async def grade_all() -> List[ValidationResult]:
+        return list(await asyncio.gather(*(
+            _grade_submission_async(student_id, submission_dir)
+            for student_id, submission_dir in chunk
+        )))
+
+    results = asyncio.run(grade_all())
+    # 묶음의 트레이스 이벤트는 첫 결과에 실어 전달 (부모는 결과마다 합치므로 한 번만)
+    if _WORKER_STATE["trace"]:
+        results[0].trace_events = tracing.drain()
+    return results
+
+
+def _sleep_overlap(mission_config: Dict[str, Any]) -> int:
+    """
+    워커 하나가 동시에 채점할 제출물 수
+
+    sleep_bound를 선언한 비동기 검증기가 있으면 execution.sleep_overlap (기본 16), 없으면 1.
+    """
+    sleep_bound = False
+    for validator_config in mission_config.get("validators", []):
+        validator_class = load_validator_class(validator_config["module"], validator_config["class"])
+        if validator_class.sleep_bound and issubclass(validator_class, AsyncBaseValidator):
+            sleep_bound = True
+    if not sleep_bound:
+        return 1
+    execution = mission_config.get("execution") or {}
+    return max(1, int(execution.get("sleep_overlap") or 16))
+
+
+def grade_many(
+    mission_id: str,
+    mission_config: Dict[str, Any],
+    submissions: Iterable[Tuple[str, str]],
+    workers: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    metrics: Optional[GradingMetrics] = None,
+    fresh_workers: bool = False,
+    preload: Sequence[str] = (),
+) -> Iterator[ValidationResult]:
+    """
+    여러 학습자 제출물을 워커 풀에서 채점하고, 끝나는 순서대로 결과를 반환
+
+    워커마다 미션 설정과 검증기 클래스를 한 번만 로드하여 재사용한다.
+    fresh_workers이면 채점 코어와 preload 모듈을 미리 import한 forkserver에서 작업(제출물 또는
+    묶음)마다 새 워커를 fork하고 작업이 끝나면 버린다. 학생 코드가 워커에 남긴 상태가 다음
+    제출물에 영향을 주지 않으며, 워커 시작 비용은 import 없이 fork 한 번이다
+    (Python 3.11 미만이거나 forkserver가 없으면 워커를 재사용).
+    대기 위주 단계를 선언한(sleep_bound) 검증기가 있는 미션은 제출물을 묶음 단위로
+    워커에 보내고, 워커는 묶음을 이벤트 루프 하나에서 동시에 채점한다 (대기 시간이
+    제출물끼리 겹치므로 처리량은 CPU에 의해 결정됨). 결과는 묶음이 끝날 때 반환된다.
+
+    Args:
+        mission_id: 미션 ID
+        mission_config: 미션 설정 (config.yaml에서 로드)
+        submissions: (학습자 ID, 제출물 디렉토리) 목록
+        workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행 — fresh_workers 제외)
+        cache: 채점 결과 캐시 (워커끼리 같은 캐시 디렉토리를 공유)
+        metrics: 채점 메트릭 레지스트리 (워커가 아닌 호출 프로세스에서 결과마다 기록)
+        fresh_workers: 작업마다 새 워커 프로세스 사용
+        preload: forkserver가 미리 import할 모듈 (예: 모든 미션의 검증기 모듈)
+
+    Yields:
+        ValidationResult 객체 (완료 순서)
+    """
+    submissions = list(submissions)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # 제출물이 적으면 모든 워커가 일하도록 묶음 크기를 줄임
+    overlap = min(_sleep_overlap(mission_config), -(-len(submissions) // workers) or 1)
+    chunks = [submissions[i:i + overlap] for i in range(0, len(submissions), overlap)]
+
+    if workers <= 1 and not fresh_workers:
+        _init_worker(mission_id, mission_config, cache)
+        for chunk in chunks:
+            for result in _grade_chunk(chunk):
+                if metrics is not None:
+                    metrics.record(result)
+                yield result
+        return
+
+    pool_options: Dict[str, Any] = {}
+    if fresh_workers and _FRESH_WORKERS_SUPPORTED:
+        context = multiprocessing.get_context("forkserver")
+        # __main__(run_grading.py 등)도 forkserver에서 한 번만 import (워커마다 다시 실행하지 않음)
+        context.set_forkserver_preload(["__main__", *_FRAMEWORK_MODULES, *preload])
+        pool_options = {"mp_context": context, "max_tasks_per_child": 1}
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(mission_id, mission_config, cache, tracing.is_enabled()),
+        **pool_options,
+    ) as executor:
+        futures = [executor.submit(_grade_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            for result in future.result():
+                tracing.extend(result.trace_events)
+                result.trace_events = []
+                if metrics is not None:
+                    metrics.record(result)
+                yield result
+
+
+async def grade_many_async(
+    mission_id: str,
+    mission_config: Dict[str, Any],
+    submissions: Iterable[Tuple[str, str]],
+    concurrency: int = 64,
+    cache: Optional[ResultCache] = None,
+    metrics: Optional[GradingMetrics] = None,
+) -> AsyncIterator[ValidationResult]:
+    """
+    여러 학습자 제출물을 현재 이벤트 루프에서 동시에 채점하고, 끝나는 순서대로 결과를 반환
+
+    학생 프로그램 실행과 대기(sleep)는 AsyncBaseValidator가 이벤트 루프에서 처리하므로
+    동시 채점 수를 늘려도 스레드/프로세스가 늘지 않는다 (동기 검증기는 기본 스레드 풀 사용).
+
+    Args:
+        mission_id: 미션 ID
+        mission_config: 미션 설정 (config.yaml에서 로드)
+        submissions: (학습자 ID, 제출물 디렉토리) 목록
+        concurrency: 동시에 채점할 최대 제출물 수
+        cache: 채점 결과 캐시
+        metrics: 채점 메트릭 레지스트리 (결과마다 기록)
+
+    Yields:
+        ValidationResult 객체 (완료 순서)
+
+    Example:
+        async for result in grade_many_async(mission_id, config, submissions, concurrency=200):
+            save_result(result, output_dir)
+    """
+    for validator_config in mission_config.get("validators", []):
+        load_validator_class(validator_config["module"], validator_config["class"])
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def grade_one(student_id: str, submission_dir: str) -> ValidationResult:
+        async with semaphore:
+            config = dict(mission_config)
+            config["submission_dir"] = submission_dir
+            start_time = time.perf_counter()
+            try:
+                return await Grader(student_id, mission_id, config, cache=cache).execute_async()
+            except Exception as e:
+                return _failed_result(student_id, mission_id, e, start_time)
+
+    tasks = [asyncio.ensure_future(grade_one(student_id, submission_dir))
+             for student_id, submission_dir in submissions]
+    try:
+        for done in asyncio.as_completed(tasks):
+            result = await done
+            if metrics is not None:
+                metrics.record(result)
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class ThroughputStats:
+    """
+    배치 채점 처리량 집계 (초당 제출물 수, 제출물당 소요 시간 p50/p95)
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.durations: List[float] = []
+
+    def record(self, result: ValidationResult) -> None:
+        """채점 결과 하나의 소요 시간 기록"""
+        self.durations.append(result.duration)
+
+    def summary(self) -> Dict[str, Any]:
+        """처리량 요약 딕셔너리 반환"""
+        elapsed = time.perf_counter() - self.start_time
+        count = len(self.durations)
+        return {
+            "submissions": count,
+            "elapsed": round(elapsed, 3),
+            "submissions_per_sec": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+            "p50": round(_percentile(self.durations, 50), 3),
+            "p95": round(_percentile(self.durations, 95), 3),
+        }
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """nearest-rank 방식 백분위수 (값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(-(-percent * len(ordered) // 100)))
+    return ordered[rank - 1]
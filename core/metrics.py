@@ -0,0 +1,183 @@
+"""
+채점 메트릭 textfile 내보내기
+
+node_exporter textfile collector가 읽는 Prometheus 텍스트 형식으로 카운터/히스토그램을 기록한다.
+값은 모두 ValidationResult에서 계산하므로 배치 채점에서도 부모 프로세스 한 곳에서 집계된다.
+"""
+import bisect
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from .validation_result import ValidationResult
+
+# 히스토그램 버킷 상한 (초) — TTL 검증처럼 sleep이 긴 검증기까지 구분
+_DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+
+
+class GradingMetrics:
+    """
+    채점 메트릭 레지스트리
+
+    record()로 채점 결과를 반영하고, path가 지정되어 있으면 매번 파일을 원자적으로 다시 쓴다
+    (임시 파일 작성 후 os.replace — 수집기가 쓰다 만 파일을 읽지 않음).
+
+    Metrics:
+        grader_submissions_total: 채점한 제출물 수 (mission_id, outcome)
+        grader_cache_hits_total: 결과 캐시 재사용 수 (mission_id, level=submission|validator)
+        grader_timeouts_total: 학생 프로그램 타임아웃 수 (mission_id, validator)
+        grader_check_results_total: 체크 항목 결과 수 (mission_id, validator, check, status)
+        grader_submission_duration_seconds: 제출물당 채점 시간 히스토그램 (mission_id)
+        grader_validator_duration_seconds: 검증기 실행 시간 히스토그램 (mission_id, validator)
+        grader_last_submission_timestamp_seconds: 마지막 채점 완료 시각 (mission_id)
+    """
+
+    _HELP = {
+        "grader_submissions": ("counter", "Graded submissions"),
+        "grader_cache_hits": ("counter", "Results reused from the result cache"),
+        "grader_timeouts": ("counter", "Student program timeouts"),
+        "grader_check_results": ("counter", "Check item results"),
+        "grader_submission_duration_seconds": ("histogram", "Wall time per graded submission"),
+        "grader_validator_duration_seconds": ("histogram", "Wall time per validator run"),
+        "grader_last_submission_timestamp_seconds": ("gauge", "Unix time of the last graded submission"),
+    }
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 메트릭 파일 경로 (예: /var/lib/node_exporter/textfile/grader.prom, None이면 쓰지 않음)
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+
+    def record(self, result: ValidationResult) -> None:
+        """채점 결과 하나를 메트릭에 반영하고 파일 갱신"""
+        mission = (("mission_id", result.mission_id),)
+
+        with self._lock:
+            outcome = "passed" if result.overall_passed else "failed"
+            self._inc("grader_submissions", mission + (("outcome", outcome),))
+            self._observe("grader_submission_duration_seconds", mission, result.duration)
+            self._gauges.setdefault("grader_last_submission_timestamp_seconds", {})[mission] = time.time()
+
+            if result.cache_hit:
+                # 재사용한 결과의 검증기/체크 항목은 다시 집계하지 않음
+                self._inc("grader_cache_hits", mission + (("level", "submission"),))
+            else:
+                for entry in result.results:
+                    self._record_validator(mission, entry["validator"], entry["result"])
+
+        if self.path is not None:
+            self.write()
+
+    def _record_validator(self, mission: Labels, validator: str, result: Dict[str, Any]) -> None:
+        labels = mission + (("validator", validator),)
+        if result.get("cache_hit"):
+            self._inc("grader_cache_hits", mission + (("level", "validator"),))
+            return
+
+        resources = result.get("resources")
+        if resources:
+            self._observe("grader_validator_duration_seconds", labels, resources["wall_ns"] / 1e9)
+            # 0이어도 시계열을 만들어 둠 (증가율 알림용)
+            self._inc("grader_timeouts", labels, resources.get("timeouts", 0))
+
+        for item in result.get("items", []):
+            self._inc("grader_check_results",
+                      labels + (("check", item["id"]), ("status", item["status"])))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 문자열"""
+        lines: List[str] = []
+        with self._lock:
+            for name, (metric_type, help_text) in self._HELP.items():
+                if metric_type == "counter" and name in self._counters:
+                    series = self._counters[name]
+                    lines += _header(f"{name}_total", metric_type, help_text)
+                    lines += [f"{name}_total{_format_labels(l)} {_format_value(v)}"
+                              for l, v in sorted(series.items())]
+                elif metric_type == "gauge" and name in self._gauges:
+                    lines += _header(name, metric_type, help_text)
+                    lines += [f"{name}{_format_labels(l)} {_format_value(v)}"
+                              for l, v in sorted(self._gauges[name].items())]
+                elif metric_type == "histogram" and name in self._histograms:
+                    lines += _header(name, metric_type, help_text)
+                    for labels, histogram in sorted(self._histograms[name].items()):
+                        lines += _histogram_lines(name, labels, histogram)
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """메트릭 파일을 원자적으로 갱신"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.path)
+
+    def _inc(self, name: str, labels: Labels, amount: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + amount
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        if labels not in series:
+            series[labels] = _Histogram(_DURATION_BUCKETS)
+        series[labels].observe(value)
+
+
+def _header(name: str, metric_type: str, help_text: str) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+def _histogram_lines(name: str, labels: Labels, histogram: _Histogram) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        bucket_labels = labels + (("le", _format_value(bound)),)
+        lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.total}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+    lines.append(f"{name}_count{_format_labels(labels)} {histogram.total}")
+    return lines
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    """라벨 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
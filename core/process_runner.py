@@ -0,0 +1,310 @@
+"""
+비동기 학생 프로세스 실행 헬퍼
+
+asyncio 이벤트 루프 하나에서 여러 학생 프로그램을 동시에 실행하기 위한 함수들.
+대기(sleep)와 입출력 대기는 스레드를 점유하지 않는다 (종료 감지만 프로세스마다 스레드 하나).
+프로세스는 core.process_supervisor로 시작/회수하므로 rlimit, 프로세스 그룹 종료, 사용량 기록이 적용된다.
+stdout+stderr가 limits.output_mb를 넘으면 프로세스 그룹을 종료하고 출력 종료(EOF)로 처리한다.
+"""
+import asyncio
+import codecs
+import subprocess
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+from . import process_supervisor, tracing
+from .process_supervisor import ProcessLimits, ProcessUsage
+from .resource_usage import record_timeout
+from .submission_health import note_timeout, program_name
+
+_ENCODING = "utf-8"
+# 파이프에서 한 번에 읽는 크기 (바이트)
+_CHUNK = 65536
+
+
+async def run_process(argv: List[str], input: Optional[str] = None, timeout: float = 10,
+                      cwd: Optional[str] = None,
+                      limits: Optional[ProcessLimits] = None) -> Optional[subprocess.CompletedProcess]:
+    """
+    프로세스를 실행하고 종료까지 기다림 (subprocess.run의 비동기 버전)
+
+    Args:
+        argv: 실행할 명령
+        input: stdin으로 보낼 문자열 (None이면 stdin 닫음)
+        timeout: 제한 시간 (초)
+        cwd: 작업 디렉토리
+        limits: 리소스 제한 (None이면 ProcessLimits 기본값)
+
+    Returns:
+        CompletedProcess (stdout/stderr는 문자열) 또는 None (실행 실패/타임아웃)
+    """
+    process = await InteractiveProcess.start(argv, cwd=cwd, limits=limits)
+    if process is None:
+        return None
+    try:
+        stdout = await process.finish(input or "", timeout=timeout)
+    finally:
+        # 취소(decide-only 등)되어도 학생 프로세스를 남기지 않음
+        await process.kill()
+    if stdout is None:
+        return None
+    return subprocess.CompletedProcess(argv, process.returncode, stdout, process.stderr)
+
+
+class InteractiveProcess:
+    """
+    stdin 입력을 나눠 보내는 대화형 프로세스 (REPL 시나리오용)
+
+    Example:
+        process = await InteractiveProcess.start([sys.executable, "-u", "cli.py"])
+        await process.send("EXPIRE temp 1\\n")
+        await asyncio.sleep(2)
+        stdout = await process.finish("GET temp\\nexit\\n", timeout=5)
+
+    finish() 전에 중단할 수 있으면 try/finally에서 kill()을 호출해 프로세스를 회수한다.
+    출력을 오래 읽는 대화형 세션은 read()로 조각을 받아 직접 처리하면 output에 쌓이지 않는다.
+    """
+
+    def __init__(self, proc: subprocess.Popen, stdin: asyncio.StreamWriter,
+                 stdout: asyncio.StreamReader, stderr: Optional[asyncio.StreamReader],
+                 transports: List[asyncio.BaseTransport], exited: "asyncio.Future",
+                 output_limit: Optional[int] = None):
+        self._proc = proc
+        self._stdin = stdin
+        self._stdout = stdout
+        self._stderr = stderr
+        self._transports = transports
+        # 종료 후 회수까지 끝나면 ProcessUsage로 완료
+        self._exited = exited
+        self._decoder = codecs.getincrementaldecoder(_ENCODING)(errors="replace")
+        # read_until()/finish()로 읽은 stdout 전체
+        self.output = ""
+        self.stderr = ""
+        # stdout+stderr 최대 바이트 (넘으면 프로세스 그룹 종료)
+        self._output_limit = output_limit
+        self._output_size = 0
+        self.output_limited = False
+
+    @classmethod
+    async def start(cls, argv: List[str], cwd: Optional[str] = None,
+                    capture_stderr: bool = True, env: Optional[Dict[str, str]] = None,
+                    pass_fds: Sequence[int] = (),
+                    limits: Optional[ProcessLimits] = None) -> Optional["InteractiveProcess"]:
+        """
+        프로세스 시작 (실행 실패 시 None)
+
+        Args:
+            capture_stderr: False면 stderr를 버림 (오래 유지하는 세션에서 파이프가 가득 차 멈추지 않도록)
+            env: 환경 변수 (None이면 현재 프로세스 환경 상속)
+            pass_fds: 자식 프로세스에 넘길 파일 디스크립터 (제어용 파이프 등)
+            limits: 리소스 제한 (None이면 ProcessLimits 기본값)
+        """
+        try:
+            proc = process_supervisor.spawn(
+                argv, limits,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+                cwd=cwd,
+                env=env,
+                pass_fds=tuple(pass_fds),
+            )
+        except OSError:
+            return None
+
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        threading.Thread(target=_watch_exit, args=(proc, loop, exited), daemon=True,
+                         name=f"exit-watcher-{proc.pid}").start()
+        transports: List[asyncio.BaseTransport] = []
+        try:
+            stdout = await _read_pipe(loop, proc.stdout, transports)
+            stderr = await _read_pipe(loop, proc.stderr, transports) if capture_stderr else None
+            transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, proc.stdin)
+            transports.append(transport)
+        except BaseException:
+            process_supervisor.kill(proc)
+            for transport in transports:
+                transport.close()
+            raise
+        stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+        return cls(proc, stdin, stdout, stderr, transports, exited, (limits or ProcessLimits()).output_bytes)
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._proc.returncode if self._exited.done() else None
+
+    @property
+    def at_eof(self) -> bool:
+        """stdout이 끝났는지 (프로세스가 출력을 닫음 — 보통 종료)"""
+        return self._stdout.at_eof()
+
+    @property
+    def usage(self) -> Optional[ProcessUsage]:
+        """CPU 시간/최대 RSS (종료 후 회수가 끝나기 전이면 None)"""
+        return self._exited.result() if self._exited.done() else None
+
+    async def send(self, text: str) -> bool:
+        """stdin에 쓰기 (프로세스가 이미 종료되어 파이프가 닫혔으면 False)"""
+        try:
+            self._stdin.write(text.encode(_ENCODING))
+            await self._stdin.drain()
+            return True
+        except (BrokenPipeError, ConnectionResetError):
+            return False
+
+    async def read(self, timeout: float) -> Optional[str]:
+        """
+        stdout의 다음 출력 조각 읽기 (output에 쌓지 않음)
+
+        Returns:
+            읽은 텍스트, 출력 종료(EOF/출력 한도 초과) 시 "", 타임아웃 시 None
+            (타임아웃은 기록만 하고 종료하지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not self.output_limited:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._record_timeout()
+                return None
+            try:
+                chunk = await asyncio.wait_for(self._stdout.read(_CHUNK), remaining)
+            except asyncio.TimeoutError:
+                self._record_timeout()
+                return None
+            if not chunk:
+                return self._decoder.decode(b"", final=True)
+            if not self._count_output(len(chunk)):
+                break
+            text = self._decoder.decode(chunk)
+            if text:
+                return text
+        return ""
+
+    async def read_until(self, predicate: Callable[[str], bool], timeout: float) -> bool:
+        """
+        predicate(지금까지의 stdout)가 참이 될 때까지 stdout 읽기
+
+        Returns:
+            조건 충족 여부 (False: 출력 종료(EOF) 또는 타임아웃 — 타임아웃은 기록만 하고 종료하지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not predicate(self.output):
+            text = await self.read(deadline - loop.time())
+            if text is None:
+                return False
+            if not text:
+                return predicate(self.output)
+            self.output += text
+        return True
+
+    async def finish(self, text: str = "", timeout: float = 5) -> Optional[str]:
+        """
+        남은 입력을 보내고 stdin을 닫은 뒤 종료까지 기다림
+
+        Returns:
+            전체 stdout (read_until()로 읽은 부분 포함) 또는 None (타임아웃 — 프로세스는 강제 종료됨)
+        """
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                self._communicate(text.encode(_ENCODING) if text else None), timeout
+            )
+        except asyncio.TimeoutError:
+            self._record_timeout()
+            await self.kill()
+            return None
+        if stderr is not None:
+            self.stderr = stderr.decode(_ENCODING, errors="replace")
+        self.output += self._decoder.decode(stdout or b"", final=True)
+        return self.output
+
+    async def close(self, text: str = "", timeout: float = 2) -> None:
+        """종료 입력(예: "exit\\n")을 보내고 stdin을 닫음, 제한 시간 안에 끝나지 않으면 강제 종료"""
+        try:
+            if text:
+                await self.send(text)
+            self._stdin.close()
+            await asyncio.wait_for(asyncio.shield(self._exited), timeout)
+        except (asyncio.TimeoutError, BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            # 취소되어도 프로세스를 회수 (이벤트 루프 종료 후 남지 않도록)
+            await self.kill()
+
+    async def kill(self) -> None:
+        """프로세스 그룹 강제 종료 후 회수"""
+        if not self._exited.done():
+            process_supervisor.kill(self._proc)
+        try:
+            await asyncio.shield(self._exited)
+        finally:
+            for transport in self._transports:
+                transport.close()
+
+    async def _communicate(self, data: Optional[bytes]):
+        """입력 쓰기 + stdin 닫기, stdout/stderr를 EOF까지 읽고 종료 대기 → (stdout, stderr)"""
+        async def feed() -> None:
+            try:
+                if data:
+                    self._stdin.write(data)
+                    await self._stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            self._stdin.close()
+
+        async def collect(reader: Optional[asyncio.StreamReader]) -> Optional[bytes]:
+            if reader is None:
+                return None
+            collected = bytearray()
+            while True:
+                chunk = await reader.read(_CHUNK)
+                if not chunk or not self._count_output(len(chunk)):
+                    # 출력 한도를 넘으면 그때까지의 출력만 (프로세스 그룹은 종료됨 → 파이프도 곧 닫힘)
+                    return bytes(collected)
+                collected += chunk
+
+        _, stdout, stderr = await asyncio.gather(feed(), collect(self._stdout), collect(self._stderr))
+        await asyncio.shield(self._exited)
+        return stdout, stderr
+
+    def _count_output(self, size: int) -> bool:
+        """읽은 출력 크기 집계 → 한도 안이면 True (처음 넘을 때 프로세스 그룹 종료)"""
+        self._output_size += size
+        if self._output_limit is None or self._output_size <= self._output_limit:
+            return not self.output_limited
+        if not self.output_limited:
+            self.output_limited = True
+            tracing.instant("output limit", cat="process", pid=self._proc.pid, limit=self._output_limit)
+            if not self._exited.done():
+                process_supervisor.kill(self._proc)
+        return False
+
+    def _record_timeout(self) -> None:
+        record_timeout()
+        note_timeout(program_name(self._proc.args))
+
+
+async def _read_pipe(loop: asyncio.AbstractEventLoop, pipe,
+                     transports: List[asyncio.BaseTransport]) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+    transports.append(transport)
+    return reader
+
+
+def _watch_exit(proc: subprocess.Popen, loop: asyncio.AbstractEventLoop, exited: "asyncio.Future") -> None:
+    """종료 감지 스레드: 종료를 기다려 프로세스 그룹을 회수하고 사용량으로 Future 완료"""
+    process_supervisor.wait_exited(proc)
+    usage = process_supervisor.reap(proc)
+
+    def resolve() -> None:
+        if not exited.done():
+            exited.set_result(usage)
+
+    try:
+        loop.call_soon_threadsafe(resolve)
+    except RuntimeError:
+        # 이벤트 루프가 이미 닫힘
+        pass
@@ -0,0 +1,401 @@
+"""
+학생 프로세스 감독
+
+학생 프로그램 실행을 한 곳에서 처리한다.
+
+- rlimit 적용 (CPU 시간, 주소 공간, 열린 파일 수, 쓰는 파일 크기) — fork 후 파이썬 코드를 실행하지 않도록
+  prlimit 명령(없으면 _rlimit_exec.py)으로 감싸 exec 직전에 설정
+- 실행마다 새 세션(프로세스 그룹)으로 시작하고, 종료/타임아웃 시 그룹 전체를 강제 종료
+- 채점 프로세스를 child subreaper로 설정하여(Linux) 고아가 된 손자 프로세스까지 회수
+- 실행마다 CPU 시간/최대 RSS(ProcessUsage)를 트레이스 "process exit" 이벤트로 기록
+- execution.sandbox가 켜져 있으면 네임스페이스 샌드박스(core.sandbox) 안에서 실행
+- 타임아웃을 제출물 상태(core.submission_health)에 기록하고, 한도에 닿은 프로그램은 실행하지 않음
+
+동기 실행은 run(), 비동기 실행은 core.process_runner가 spawn()/reap()을 사용한다.
+"""
+import ctypes
+import locale
+import os
+import resource
+import selectors
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import tracing
+from .resource_usage import record_timeout
+from .sandbox import SandboxOptions, SandboxRun, select as select_sandbox
+from .submission_health import check_launch, note_timeout, program_name
+
+_PR_SET_CHILD_SUBREAPER = 36
+_RLIMIT_SCRIPT = str(Path(__file__).with_name("_rlimit_exec.py"))
+# rlimit 이름 (prlimit 옵션 이름은 소문자)
+_RLIMIT_NAMES = {resource.RLIMIT_CPU: "CPU", resource.RLIMIT_AS: "AS",
+                 resource.RLIMIT_NOFILE: "NOFILE", resource.RLIMIT_FSIZE: "FSIZE"}
+_subreaper_lock = threading.Lock()
+# subreaper를 설정한 프로세스 (fork된 워커는 다시 설정)
+_subreaper_pid = 0
+
+# 종료 대기 중 상태 확인 간격 (초, 점점 늘림)
+_POLL_MIN = 0.001
+_POLL_MAX = 0.05
+
+
+@dataclass(frozen=True)
+class ProcessLimits:
+    """
+    학생 프로세스 리소스 제한 (None이면 제한 없음)
+
+    Attributes:
+        cpu_s: CPU 시간 (초, RLIMIT_CPU — 넘으면 SIGXCPU 후 SIGKILL)
+        memory_mb: 주소 공간 (MB, RLIMIT_AS)
+        open_files: 열린 파일 수 (RLIMIT_NOFILE)
+        file_size_mb: 쓸 수 있는 파일 하나의 크기 (MB, RLIMIT_FSIZE)
+        output_mb: 채점기가 보관하는 stdout+stderr 크기 (MB, 넘으면 프로세스 그룹 종료)
+        sandbox: 네임스페이스 샌드박스 설정 (None이면 샌드박스 없이 실행)
+    """
+
+    cpu_s: Optional[int] = 30
+    memory_mb: Optional[int] = 512
+    open_files: Optional[int] = 256
+    file_size_mb: Optional[int] = 64
+    output_mb: Optional[int] = 16
+    sandbox: Optional[SandboxOptions] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ProcessLimits":
+        """
+        미션 설정의 execution.student_limits 적용 (memory_mb 기본값은 execution.student_memory_mb)
+
+        execution.sandbox가 켜져 있고 이 호스트에서 네임스페이스를 만들 수 있으면 샌드박스도 선택한다.
+        """
+        execution = config.get("execution") or {}
+        values = dict(execution.get("student_limits") or {})
+        values.setdefault("memory_mb", execution.get("student_memory_mb", cls.memory_mb))
+        values["sandbox"] = select_sandbox(config)
+        return cls(**{name: values[name] for name in cls.__dataclass_fields__ if name in values})
+
+    @property
+    def output_bytes(self) -> Optional[int]:
+        return None if self.output_mb is None else int(self.output_mb * 1024 * 1024)
+
+    def rlimits(self) -> List[Tuple[int, int, int]]:
+        """적용할 rlimit [(resource.RLIMIT_*, soft, hard)] (현재 프로세스의 hard 한도 안으로 맞춤)"""
+        megabyte = 1024 * 1024
+        values = []
+        for which, soft, hard in (
+            (resource.RLIMIT_CPU, self.cpu_s, None if self.cpu_s is None else self.cpu_s + 1),
+            (resource.RLIMIT_AS, _scaled(self.memory_mb, megabyte), None),
+            (resource.RLIMIT_NOFILE, self.open_files, None),
+            (resource.RLIMIT_FSIZE, _scaled(self.file_size_mb, megabyte), None),
+        ):
+            if soft is not None:
+                values.append((which, *_clamped(which, int(soft), int(hard if hard is not None else soft))))
+        return values
+
+    def wrap(self, argv: List[str]) -> List[str]:
+        """
+        rlimit을 적용한 뒤 argv를 exec하는 명령
+
+        스레드가 있는 채점 프로세스에서 Popen(preexec_fn=...)은 fork한 자식이 물려받은 락에서 멈출 수 있으므로,
+        새 프로세스(prlimit 명령, 없으면 _rlimit_exec.py)가 setrlimit 후 exec한다.
+        """
+        limits = self.rlimits()
+        if not limits:
+            return list(argv)
+        prlimit = _prlimit_command()
+        if prlimit is not None:
+            options = [f"--{_RLIMIT_NAMES[which].lower()}={soft}:{hard}" for which, soft, hard in limits]
+            return [prlimit, *options, "--", *argv]
+        settings = [f"{_RLIMIT_NAMES[which]}={soft}:{hard}" for which, soft, hard in limits]
+        return [sys.executable, "-I", "-S", _RLIMIT_SCRIPT, *settings, "--", *argv]
+
+
+@dataclass(frozen=True)
+class ProcessUsage:
+    """학생 프로세스 한 번 실행의 사용량 (직접 자식 + 그 자식이 회수한 프로세스)"""
+
+    cpu_s: float = 0.0
+    max_rss_kb: int = 0
+
+    @classmethod
+    def from_rusage(cls, usage) -> "ProcessUsage":
+        divisor = 1024 if sys.platform == "darwin" else 1
+        return cls(round(usage.ru_utime + usage.ru_stime, 6), usage.ru_maxrss // divisor)
+
+
+def spawn(argv: List[str], limits: Optional[ProcessLimits] = None, **popen_kwargs: Any) -> subprocess.Popen:
+    """
+    학생 프로세스 시작 (새 세션 + rlimit, limits.sandbox가 있으면 샌드박스 안에서)
+
+    끝난 프로세스는 반드시 reap()으로 회수한다 (Popen.wait()를 쓰면 사용량을 잃고 샌드박스가 남음).
+
+    Raises:
+        OSError: 실행 실패 (circuit breaker가 열려 실행하지 않으면 CircuitOpenError)
+    """
+    check_launch(program_name(argv))
+    limits = limits or ProcessLimits()
+    _ensure_subreaper()
+    sandbox_run = None
+    if limits.sandbox is not None:
+        sandbox_run = SandboxRun(limits.sandbox, limits.memory_mb)
+        argv = sandbox_run.wrap(argv)
+    try:
+        _require_executable(argv[0], popen_kwargs.get("cwd"), popen_kwargs.get("env"))
+        proc = subprocess.Popen(limits.wrap(argv), start_new_session=True, **popen_kwargs)
+    except BaseException:
+        if sandbox_run is not None:
+            sandbox_run.close()
+        raise
+    proc.sandbox_run = sandbox_run
+    return proc
+
+
+def exited(proc: subprocess.Popen) -> bool:
+    """직접 자식이 종료했는지 (회수하지 않음 — 좀비가 프로세스 그룹 id를 잡아 둠)"""
+    if proc.returncode is not None:
+        return True
+    try:
+        return os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT | os.WNOHANG) is not None
+    except ChildProcessError:
+        return True
+
+
+def wait_exited(proc: subprocess.Popen, timeout: Optional[float] = None) -> bool:
+    """직접 자식이 종료할 때까지 대기 (회수하지 않음) → 제한 시간 안에 종료했는지"""
+    if timeout is None:
+        try:
+            os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+        except ChildProcessError:
+            pass
+        return True
+    deadline = time.monotonic() + timeout
+    interval = _POLL_MIN
+    while not exited(proc):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, _POLL_MAX)
+    return True
+
+
+def kill(proc: subprocess.Popen) -> None:
+    """프로세스 그룹 전체 강제 종료 (회수는 reap())"""
+    if proc.returncode is None:
+        _kill_group(proc.pid)
+
+
+def reap(proc: subprocess.Popen) -> ProcessUsage:
+    """
+    프로세스 그룹 전체 강제 종료 + 직접 자식/고아 회수 → 직접 자식의 사용량
+
+    직접 자식이 정상 종료한 뒤에도 남은 손자 프로세스는 종료한다. 블로킹 호출이다.
+    샌드박스 실행은 cgroup이 있으면 cgroup 단위 사용량(손자 프로세스 포함)을 돌려준다.
+    """
+    sandbox_run = getattr(proc, "sandbox_run", None)
+    proc.sandbox_run = None
+    if proc.returncode is not None:
+        if sandbox_run is not None:
+            sandbox_run.close()
+        return ProcessUsage()
+    _kill_group(proc.pid)
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+        proc.returncode = _returncode(status)
+        usage = ProcessUsage.from_rusage(rusage)
+    except ChildProcessError:
+        # 다른 곳에서 이미 회수함
+        proc.returncode = -signal.SIGKILL
+        usage = ProcessUsage()
+    _reap_group(proc.pid)
+    if sandbox_run is not None:
+        cgroup_usage = sandbox_run.usage()
+        if cgroup_usage is not None:
+            usage = ProcessUsage(*cgroup_usage)
+        sandbox_run.close()
+    tracing.instant("process exit", cat="process", pid=proc.pid, returncode=proc.returncode,
+                    cpu_s=usage.cpu_s, max_rss_kb=usage.max_rss_kb)
+    return usage
+
+
+def run(argv: List[str], input: Optional[str] = None, timeout: float = 10,
+        cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None,
+        limits: Optional[ProcessLimits] = None) -> Optional[subprocess.CompletedProcess]:
+    """
+    학생 프로그램 실행 (subprocess.run(capture_output=True, text=True, timeout=...)에 해당)
+
+    input이 없으면 stdin은 /dev/null이다. stdout+stderr가 limits.output_mb를 넘으면
+    프로세스 그룹을 종료하고 그때까지의 출력을 돌려준다 (returncode는 -SIGKILL).
+
+    Returns:
+        CompletedProcess (usage 속성: ProcessUsage) 또는 None (실행 실패/타임아웃)
+    """
+    limits = limits or ProcessLimits()
+    try:
+        proc = spawn(
+            argv, limits,
+            stdin=subprocess.PIPE if input else subprocess.DEVNULL,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            cwd=cwd, env=env,
+        )
+    except OSError:
+        return None
+
+    deadline = time.monotonic() + timeout
+    try:
+        stdout, stderr, status = _communicate(proc, input, deadline, limits.output_bytes)
+        if status == "eof" and not wait_exited(proc, max(0.0, deadline - time.monotonic())):
+            status = "timeout"
+    finally:
+        usage = reap(proc)
+        for stream in (proc.stdin, proc.stdout, proc.stderr):
+            if stream is not None:
+                stream.close()
+    if status == "timeout":
+        record_timeout()
+        note_timeout(program_name(argv))
+        return None
+    result = subprocess.CompletedProcess(argv, proc.returncode, decode_output(stdout), decode_output(stderr))
+    result.usage = usage
+    return result
+
+
+def decode_output(data: bytes) -> str:
+    """출력 바이트 → 텍스트 (subprocess text=True처럼 로캘 인코딩 + 줄바꿈 통일)"""
+    text = data.decode(locale.getpreferredencoding(False), errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _communicate(proc: subprocess.Popen, input: Optional[str], deadline: float,
+                 output_limit: Optional[int]) -> Tuple[bytes, bytes, str]:
+    """
+    stdin 쓰기 + stdout/stderr를 EOF까지 읽기 → (stdout, stderr, 상태)
+
+    상태: "eof", "timeout", "output_limit"
+    """
+    output = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    total = 0
+    pending = memoryview((input or "").encode())
+    with selectors.DefaultSelector() as selector:
+        for stream in output:
+            selector.register(stream, selectors.EVENT_READ)
+        if proc.stdin is not None:
+            os.set_blocking(proc.stdin.fileno(), False)
+            selector.register(proc.stdin, selectors.EVENT_WRITE)
+
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return bytes(output[proc.stdout]), bytes(output[proc.stderr]), "timeout"
+            for key, _ in selector.select(remaining):
+                stream = key.fileobj
+                if stream is proc.stdin:
+                    try:
+                        pending = pending[os.write(key.fd, pending[:65536]):]
+                    except BlockingIOError:
+                        continue
+                    except BrokenPipeError:
+                        pending = pending[:0]
+                    if not pending:
+                        selector.unregister(stream)
+                        stream.close()
+                    continue
+                data = os.read(key.fd, 65536)
+                if not data:
+                    selector.unregister(stream)
+                    stream.close()
+                    continue
+                output[stream] += data
+                total += len(data)
+                if output_limit is not None and total > output_limit:
+                    tracing.instant("output limit", cat="process", pid=proc.pid, limit=output_limit)
+                    return bytes(output[proc.stdout]), bytes(output[proc.stderr]), "output_limit"
+    return bytes(output[proc.stdout]), bytes(output[proc.stderr]), "eof"
+
+
+def _ensure_subreaper() -> None:
+    """현재 프로세스를 child subreaper로 설정 (학생 프로세스의 고아가 init 대신 이 프로세스로 옴)"""
+    global _subreaper_pid
+    if not sys.platform.startswith("linux") or _subreaper_pid == os.getpid():
+        return
+    with _subreaper_lock:
+        if _subreaper_pid != os.getpid():
+            try:
+                ctypes.CDLL(None, use_errno=True).prctl(_PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0)
+            except (OSError, AttributeError):
+                pass
+            _subreaper_pid = os.getpid()
+
+
+def _kill_group(pgid: int) -> None:
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _reap_group(pgid: int) -> None:
+    """프로세스 그룹에 남은 자식(이 프로세스로 온 고아) 회수"""
+    while True:
+        try:
+            pid, _ = os.waitpid(-pgid, 0)
+        except (ChildProcessError, InterruptedError):
+            return
+        if pid == 0:
+            return
+
+
+def _returncode(status: int) -> int:
+    """wait 상태 → subprocess와 같은 returncode (시그널 종료는 음수)"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _require_executable(program: str, cwd: Optional[str], env: Optional[Dict[str, str]]) -> None:
+    """
+    실행 파일 확인 (없으면 FileNotFoundError)
+
+    rlimit 래퍼 아래에서는 exec 실패가 종료 코드 127로만 보이므로, Popen이 직접 exec할 때처럼
+    spawn()에서 OSError로 알리도록 먼저 찾아 본다.
+    """
+    if os.sep in program:
+        path = os.path.join(cwd, program) if cwd else program
+        found = os.path.isfile(path) and os.access(path, os.X_OK)
+    else:
+        found = shutil.which(program, path=(env if env is not None else os.environ).get("PATH", os.defpath)) is not None
+    if not found:
+        raise FileNotFoundError(f"실행 파일을 찾을 수 없습니다: {program}")
+
+
+def _scaled(value: Optional[float], unit: int) -> Optional[int]:
+    return None if value is None else int(value * unit)
+
+
+def _clamped(which: int, soft: int, hard: int) -> Tuple[int, int]:
+    """rlimit 값을 현재 hard 한도 안으로 제한 (자식은 이 한도를 물려받으므로 올릴 수 없음)"""
+    _, current_hard = resource.getrlimit(which)
+    if current_hard != resource.RLIM_INFINITY:
+        hard = min(hard, current_hard)
+        soft = min(soft, hard)
+    return soft, hard
+
+
+_prlimit_path: Optional[str] = None
+_prlimit_checked = False
+
+
+def _prlimit_command() -> Optional[str]:
+    """util-linux prlimit 명령 경로 (없으면 None, 프로세스당 한 번 찾음)"""
+    global _prlimit_path, _prlimit_checked
+    if not _prlimit_checked:
+        _prlimit_path = shutil.which("prlimit") if sys.platform.startswith("linux") else None
+        _prlimit_checked = True
+    return _prlimit_path
@@ -0,0 +1,132 @@
+"""
+리소스 사용량 측정 (벽시계 시간, CPU 시간, 자식 프로세스, 타임아웃)
+"""
+import contextvars
+import resource
+import sys
+import threading
+import time
+from typing import Dict, Any, Tuple
+
+# 자식 프로세스 생성으로 집계하는 audit 이벤트
+# (subprocess가 내부적으로 쓰는 os.posix_spawn은 subprocess.Popen과 중복되므로 제외)
+_SPAWN_EVENTS = frozenset({"subprocess.Popen", "os.system", "os.fork", "os.forkpty", "os.spawn"})
+
+# 스레드 단위 CPU 시간 (Linux), 지원하지 않으면 프로세스 단위로 대체
+_RUSAGE_THREAD = getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF)
+
+# ru_maxrss 단위: Linux KB, macOS bytes
+_MAXRSS_DIVISOR = 1024 if sys.platform == "darwin" else 1
+
+# 현재 컨텍스트에서 측정 중인 미터 (바깥 → 안쪽 순서)
+# 스레드 풀에 contextvars.copy_context()로 넘기면 풀 스레드의 이벤트도 바깥 미터에 집계됨
+_active_meters: contextvars.ContextVar[Tuple["ResourceMeter", ...]] = contextvars.ContextVar(
+    "active_meters", default=()
+)
+_count_lock = threading.Lock()
+_hook_lock = threading.Lock()
+_hook_installed = False
+
+
+def _audit_hook(event: str, args: tuple) -> None:
+    if event in _SPAWN_EVENTS:
+        _count("spawned_processes")
+
+
+def _install_hook() -> None:
+    """프로세스 생성 감지용 audit hook 설치 (프로세스당 한 번, 제거 불가)"""
+    global _hook_installed
+    with _hook_lock:
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+def _count(name: str) -> None:
+    """현재 컨텍스트의 모든 미터에 이벤트 1회 집계"""
+    meters = _active_meters.get()
+    if meters:
+        with _count_lock:
+            for meter in meters:
+                meter.counts[name] += 1
+
+
+def record_timeout() -> None:
+    """학생 프로그램 타임아웃 발생 기록 (검증기에서 TimeoutExpired 처리 시 호출)"""
+    _count("timeouts")
+
+
+def record_child_usage(cpu_s: float, max_rss_kb: int) -> None:
+    """
+    채점 프로세스가 직접 회수하지 않는 학생 프로세스 1회의 사용량 기록
+
+    다른 프로세스(zygote 등)가 fork/회수한 실행은 audit 이벤트와 RUSAGE_CHILDREN에 잡히지 않으므로
+    회수한 쪽이 알려준 값으로 프로세스 생성 수/자식 CPU 시간/최대 RSS에 더한다.
+    """
+    meters = _active_meters.get()
+    if meters:
+        with _count_lock:
+            for meter in meters:
+                meter.counts["spawned_processes"] += 1
+                meter._remote_cpu_s += cpu_s
+                meter._remote_max_rss_kb = max(meter._remote_max_rss_kb, max_rss_kb)
+
+
+class ResourceMeter:
+    """
+    with 블록 동안의 리소스 사용량 측정
+
+    per_thread=True이면 채점기 CPU 시간을 현재 스레드 기준으로, False이면 프로세스 전체
+    기준으로 측정한다. 프로세스 생성 수와 타임아웃 수는 현재 컨텍스트(및 컨텍스트를
+    물려받은 스레드 풀 작업) 기준이다. 자식 프로세스 CPU 시간/최대 RSS는 종료(reap)된
+    자식 기준의 프로세스 전체 값이므로 병렬 실행 시 다른 작업의 자식이 섞일 수 있다.
+
+    Example:
+        with ResourceMeter(per_thread=True) as meter:
+            run_check()
+        meter.usage  # {"wall_ns": ..., "cpu_s": ..., ...}
+    """
+
+    def __init__(self, per_thread: bool = False):
+        self.per_thread = per_thread
+        self.usage: Dict[str, Any] = {}
+        self.counts = {"spawned_processes": 0, "timeouts": 0}
+        # record_child_usage()로 받은 자식 프로세스 사용량
+        self._remote_cpu_s = 0.0
+        self._remote_max_rss_kb = 0
+        _install_hook()
+
+    def __enter__(self) -> "ResourceMeter":
+        self._self_who = _RUSAGE_THREAD if self.per_thread else resource.RUSAGE_SELF
+        self._self_before = resource.getrusage(self._self_who)
+        self._children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        self._token = _active_meters.set(_active_meters.get() + (self,))
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        wall_ns = time.perf_counter_ns() - self._start_ns
+        _active_meters.reset(self._token)
+        self_after = resource.getrusage(self._self_who)
+        children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        spawned = self.counts["spawned_processes"]
+
+        self.usage = {
+            "wall_ns": wall_ns,
+            "cpu_s": round(_cpu_seconds(self_after) - _cpu_seconds(self._self_before), 6),
+            "children_cpu_s": round(
+                _cpu_seconds(children_after) - _cpu_seconds(self._children_before)
+                + self._remote_cpu_s, 6
+            ),
+            # 최대 RSS는 누적 최댓값이므로 자식을 띄운 경우에만 의미가 있음 (상한값)
+            "children_max_rss_kb": max(
+                children_after.ru_maxrss // _MAXRSS_DIVISOR if spawned > 0 else 0,
+                self._remote_max_rss_kb,
+            ),
+            "spawned_processes": spawned,
+            "timeouts": self.counts["timeouts"],
+        }
+
+
+def _cpu_seconds(usage) -> float:
+    return usage.ru_utime + usage.ru_stime
@@ -0,0 +1,345 @@
+"""
+채점 결과 캐시
+
+제출물 파일 트리 + 미션 설정 + 채점 코드(core/, 검증기 패키지와 검증기가 import하는 프로젝트 모듈) 소스의 해시를 키로
+ValidationResult를 저장한다. 키가 같으면 학생 프로세스를 띄우지 않고 저장된 결과를 재사용한다.
+제출물 전체가 바뀌었어도 검증기가 선언한 입력 파일(input_files, input_modules가 import하는 학생 모듈 파일)이
+그대로면 그 검증기 결과만 재사용한다.
+"""
+import ast
+import functools
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+from .source_check import AST_LOCK, student_module_files
+
+# 결과에 영향을 주지 않는 파일/디렉토리 (해시에서 제외)
+_IGNORED_DIRS = {"__pycache__", ".pytest_cache", ".mypy_cache"}
+_IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+# 결과에 영향을 주지 않는 설정 키 (제출물 위치는 파일 내용 해시로 대체)
+_IGNORED_CONFIG_KEYS = {"submission_dir"}
+
+# 축출 검사 간격 (저장할 때마다 캐시 디렉토리 전체를 훑지 않음)
+_EVICT_INTERVAL_S = 60
+# 마지막 축출 시각을 mtime으로 기록하는 파일 (캐시 디렉토리를 공유하는 워커 프로세스끼리 공유)
+_EVICT_STAMP = ".evicted"
+
+_CORE_DIR = Path(__file__).parent
+_PROJECT_DIR = _CORE_DIR.parent
+
+
+def hash_tree(root: Path, patterns: Optional[Iterable[str]] = None) -> str:
+    """
+    디렉토리 트리의 (상대 경로, 파일 내용) 해시
+
+    Args:
+        root: 제출물 디렉토리
+        patterns: 포함할 glob 패턴 목록 (예: ["**/*.py"], None이면 전체 파일)
+    """
+    if patterns is None:
+        patterns = ["**/*"]
+
+    paths = set()
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            relative = path.relative_to(root)
+            if (path.is_file() and path.suffix not in _IGNORED_SUFFIXES
+                    and not _IGNORED_DIRS.intersection(relative.parts)):
+                paths.add(relative)
+
+    digest = hashlib.sha256()
+    for relative in sorted(paths):
+        _update_file(digest, root / relative, relative.as_posix())
+    return digest.hexdigest()
+
+
+def hash_config(config: Dict[str, Any]) -> str:
+    """미션 설정 해시 (제출물 경로 제외)"""
+    relevant = {k: v for k, v in config.items() if k not in _IGNORED_CONFIG_KEYS}
+    encoded = json.dumps(relevant, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def hash_sources(module_paths: Iterable[str]) -> str:
+    """
+    채점 코드 소스 해시
+
+    core/ 전체, 각 검증기 모듈이 속한 디렉토리, 검증기가 (간접적으로) import하는 프로젝트 모듈의
+    디렉토리(예: ds 검증기가 쓰는 plugins/python/validators의 _ast_facts 등)의 .py 파일을 포함.
+    경로로 실행하는 스크립트(_virtual_clock.py 등)는 같은 디렉토리에 있어 함께 포함된다.
+    """
+    directories = {_CORE_DIR}
+    for module_path in module_paths:
+        spec = importlib.util.find_spec(module_path)
+        if spec is None or spec.origin is None:
+            raise ImportError(f"검증기 모듈을 찾을 수 없습니다: {module_path}")
+        directories.update(path.parent for path in _project_closure(Path(spec.origin), module_path))
+
+    digest = hashlib.sha256()
+    for directory in sorted(directories):
+        for path in sorted(directory.glob("*.py")):
+            _update_file(digest, path, str(path))
+    return digest.hexdigest()
+
+
+def _project_closure(origin: Path, module: str) -> Set[Path]:
+    """모듈 파일과 그 모듈이 직접/간접적으로 import하는 프로젝트 안 모듈 파일 (core/와 외부 패키지 제외)"""
+    found = {origin, *_module_files(module)}
+    queue = [(origin, module)]
+    while queue:
+        path, name = queue.pop()
+        stat = path.stat()
+        for imported in _project_imports(str(path), name, stat.st_mtime_ns, stat.st_size):
+            if imported not in found:
+                found.add(imported)
+                queue.append((imported, _module_name(imported)))
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _project_imports(path: str, module: str, mtime_ns: int, size: int) -> Tuple[Path, ...]:
+    """
+    소스 파일의 import 문이 가리키는 프로젝트 모듈 파일 (import하지 않고 AST와 경로로만 찾음)
+
+    mtime/크기가 바뀌면 다시 파싱한다 (캐시 키에 포함). 병렬 검증기 스레드에서 호출되므로
+    파싱은 AST_LOCK 아래에서 한다.
+    """
+    try:
+        source = Path(path).read_bytes()
+        with AST_LOCK:
+            tree = ast.parse(source, filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return ()
+    package = module if path.endswith("__init__.py") else module.rpartition(".")[0]
+
+    names: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = importlib.util.resolve_name("." * node.level + (node.module or ""), package) \
+                    if node.level else node.module
+            except (ImportError, ValueError):
+                continue
+            if not base:
+                continue
+            names.append(base)
+            # from pkg import submodule
+            names.extend(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+
+    files = []
+    for name in names:
+        for candidate in _module_files(name):
+            if _CORE_DIR not in candidate.parents:
+                files.append(candidate)
+    return tuple(files)
+
+
+def _module_files(name: str) -> List[Path]:
+    """모듈 이름 → 프로젝트 안의 파일 (패키지면 상위 패키지의 __init__.py 포함, 프로젝트 밖이면 빈 리스트)"""
+    files = []
+    directory = _PROJECT_DIR
+    parts = name.split(".")
+    for index, part in enumerate(parts):
+        package = directory / part
+        if (package / "__init__.py").is_file():
+            files.append(package / "__init__.py")
+            directory = package
+        elif index == len(parts) - 1 and (directory / f"{part}.py").is_file():
+            files.append(directory / f"{part}.py")
+        else:
+            break
+    return files
+
+
+def _module_name(path: Path) -> str:
+    relative = path.relative_to(_PROJECT_DIR).with_suffix("")
+    parts = relative.parts[:-1] if relative.name == "__init__" else relative.parts
+    return ".".join(parts)
+
+
+def _input_patterns(submission_dir: str, validator_class: type) -> Optional[List[str]]:
+    """검증기의 입력 파일 glob 패턴 (input_files + input_modules가 import하는 학생 모듈 파일)"""
+    patterns = validator_class.input_files
+    modules = getattr(validator_class, "input_modules", None)
+    if modules is None:
+        return patterns
+    files = student_module_files(submission_dir, modules)
+    module_patterns = ["**/*.py"] if files is None else [glob.escape(path) for path in files]
+    return list(patterns or []) + module_patterns
+
+
+def _update_file(digest, path: Path, name: str) -> None:
+    """이름 + 길이 + 내용을 해시에 반영 (경계 모호성 방지)"""
+    data = path.read_bytes()
+    digest.update(name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(len(data)).encode("ascii"))
+    digest.update(b"\0")
+    digest.update(data)
+
+
+class ResultCache:
+    """
+    디스크 기반 채점 결과 캐시 (항목당 JSON 파일 하나)
+
+    여러 배치 워커 프로세스/스레드가 같은 디렉토리를 공유해도 되도록 쓰기는 원자적으로 수행한다.
+    축출(evict)은 max_age_seconds보다 오래된 항목을 지우고, max_bytes를 넘으면
+    가장 오래 사용되지 않은 항목부터 지운다. 저장 시 축출은 마지막 축출 후
+    _EVICT_INTERVAL_S가 지났거나 이 프로세스가 max_bytes의 1/16 이상을 썼을 때만 한다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = 256 * 1024 * 1024,
+                 max_age_seconds: Optional[float] = 30 * 24 * 3600):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 캐시 전체 크기 상한 (None이면 무제한)
+            max_age_seconds: 마지막 사용 후 보관 기간 (None이면 무제한)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        # 마지막 축출 후 이 프로세스가 저장한 바이트 수
+        self._written = 0
+
+    def submission_key(self, mission_id: str, mission_config: Dict[str, Any]) -> Optional[str]:
+        """
+        제출물 전체 채점 결과의 캐시 키
+
+        Returns:
+            캐시 키 (submission_dir이 없으면 None — 리눅스 미션처럼 시스템 상태를 검사하는 경우)
+        """
+        submission_dir = mission_config.get("submission_dir")
+        if not submission_dir or not Path(submission_dir).is_dir():
+            return None
+
+        module_paths = [v["module"] for v in mission_config.get("validators", [])]
+        parts = [
+            mission_id,
+            hash_config(mission_config),
+            hash_sources(module_paths),
+            hash_tree(Path(submission_dir)),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def validator_key(self, mission_id: str, mission_config: Dict[str, Any],
+                      validator_class: type) -> Optional[str]:
+        """
+        검증기 하나의 결과 캐시 키 (선언된 입력 파일과 입력 모듈 파일만 해시)
+
+        Returns:
+            캐시 키 (submission_dir이 없으면 None)
+        """
+        submission_dir = mission_config.get("submission_dir")
+        if not submission_dir or not Path(submission_dir).is_dir():
+            return None
+
+        parts = [
+            mission_id,
+            f"{validator_class.__module__}.{validator_class.__qualname__}",
+            hash_config(mission_config),
+            hash_sources([validator_class.__module__]),
+            hash_tree(Path(submission_dir), _input_patterns(submission_dir, validator_class)),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # 마지막 사용 시각 갱신 (LRU 축출 기준)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        캐시 저장 (필요하면 예산 초과분 축출)
+
+        Raises:
+            OSError: 저장 실패 (호출한 쪽은 캐시 미사용으로 처리)
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # 같은 키를 여러 스레드/프로세스가 동시에 저장해도 임시 파일은 각자 따로
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+                self._written += f.tell()
+            os.replace(tmp_name, path)
+        except BaseException:
+            self._remove(Path(tmp_name))
+            raise
+        if self._evict_due():
+            self.evict()
+
+    def evict(self) -> None:
+        """보관 기간/크기 예산을 넘는 항목 삭제"""
+        self._written = 0
+        try:
+            (self.cache_dir / _EVICT_STAMP).touch()
+        except OSError:
+            pass
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        now = time.time()
+        kept: List = []
+        for mtime, size, path in entries:
+            if self.max_age_seconds is not None and now - mtime > self.max_age_seconds:
+                self._remove(path)
+            else:
+                kept.append((mtime, size, path))
+
+        if self.max_bytes is None:
+            return
+        total = sum(size for _, size, _ in kept)
+        for _, size, path in kept:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _evict_due(self) -> bool:
+        """저장 후 축출할 차례인지 (마지막 축출 후 시간 또는 이 프로세스가 쓴 크기 기준)"""
+        if self.max_bytes is not None and self._written >= self.max_bytes // 16:
+            return True
+        try:
+            evicted_at = (self.cache_dir / _EVICT_STAMP).stat().st_mtime
+        except OSError:
+            return True
+        return time.time() - evicted_at >= _EVICT_INTERVAL_S
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
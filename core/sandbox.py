@@ -0,0 +1,265 @@
+"""
+네임스페이스 샌드박스 (Docker 데몬 없이 Linux 커널 기능만 사용)
+
+미션 설정의 execution.sandbox가 켜져 있으면 core.process_supervisor가 학생 프로세스를
+_sandbox_init.py 아래에서 실행한다.
+
+- mount/PID/network 네임스페이스 분리: 학생 프로그램은 자기 프로세스 트리만 보고 외부 네트워크가 없음 (lo만 켜짐)
+- 실행마다 새 tmpfs를 TMPDIR/HOME으로 제공하고 실행이 끝나면 버림
+- cgroup v2에 cpu/memory 컨트롤러가 위임되어 있으면 실행마다 하위 cgroup을 만들어
+  cpu.max/memory.max를 적용하고, CPU 시간/최대 메모리를 cgroup 단위로 집계 (손자 프로세스 포함)
+
+    execution:
+      sandbox: true                  # 또는 아래처럼 세부 설정
+      sandbox:
+        network: false               # true면 network 네임스페이스를 나누지 않음
+        tmpfs_mb: 64                 # TMPDIR/HOME tmpfs 크기
+        cpus: 1.0                    # cgroup cpu.max (CPU 개수 단위, null이면 제한 없음)
+        cgroup_root: null            # 하위 cgroup을 만들 위임된 cgroup v2 디렉토리 (null이면 자동 탐지)
+
+커널이 네임스페이스를 허용하지 않으면(권한 부족 등) select()가 None을 돌려 일반 실행으로 채점한다.
+"""
+import ctypes
+import errno
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import tracing
+
+_INIT_SCRIPT = str(Path(__file__).with_name("_sandbox_init.py"))
+
+_CLONE_NEWNS = 0x00020000
+_CLONE_NEWUSER = 0x10000000
+_CLONE_NEWPID = 0x20000000
+_CLONE_NEWNET = 0x40000000
+
+_CGROUP_PERIOD_US = 100000
+_CGROUP_RMDIR_RETRIES = 50
+
+_probe_lock = threading.Lock()
+# 네임스페이스 사용 가능 여부 {(pid, unshare 플래그): 불가 사유 또는 None}
+_probed: Dict[Tuple[int, int], Optional[str]] = {}
+_cgroup_ids = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class SandboxOptions:
+    """
+    샌드박스 설정 (execution.sandbox)
+
+    Attributes:
+        network: True면 호스트 네트워크 사용 (network 네임스페이스를 나누지 않음)
+        tmpfs_mb: TMPDIR/HOME tmpfs 크기 (MB)
+        cpus: cgroup CPU 할당 (CPU 개수 단위, None이면 제한 없음)
+        cgroup_root: 하위 cgroup을 만들 위임된 cgroup v2 디렉토리 (None이면 채점 프로세스의 cgroup)
+    """
+
+    network: bool = False
+    tmpfs_mb: int = 64
+    cpus: Optional[float] = 1.0
+    cgroup_root: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["SandboxOptions"]:
+        """execution.sandbox 설정 (false/없음이면 None)"""
+        value = (config.get("execution") or {}).get("sandbox", False)
+        if not value:
+            return None
+        if not isinstance(value, dict):
+            return cls()
+        return cls(**{name: value[name] for name in cls.__dataclass_fields__ if name in value})
+
+
+def select(config: Dict[str, Any]) -> Optional[SandboxOptions]:
+    """미션 설정에서 샌드박스 선택 (설정이 꺼져 있거나 이 호스트에서 쓸 수 없으면 None)"""
+    options = SandboxOptions.from_config(config)
+    if options is None:
+        return None
+    reason = unavailable_reason(options)
+    if reason is not None:
+        tracing.instant("sandbox unavailable", cat="process", reason=reason)
+        return None
+    return options
+
+
+def unavailable_reason(options: Optional[SandboxOptions] = None) -> Optional[str]:
+    """
+    네임스페이스 샌드박스를 쓸 수 없는 이유 (쓸 수 있으면 None)
+
+    fork한 자식 프로세스에서 unshare를 시도해 보고 결과를 프로세스별로 기억한다.
+    """
+    options = options or SandboxOptions()
+    if not sys.platform.startswith("linux"):
+        return "Linux 전용"
+    key = (os.getpid(), _clone_flags(options.network))
+    with _probe_lock:
+        if key not in _probed:
+            _probed[key] = _probe(key[1])
+        return _probed[key]
+
+
+def cgroup_root(options: SandboxOptions) -> Optional[str]:
+    """
+    실행별 하위 cgroup을 만들 cgroup v2 디렉토리 (cpu/memory 컨트롤러가 위임되지 않았으면 None)
+
+    cgroup v2는 프로세스가 있는 cgroup의 하위에 컨트롤러를 켤 수 없으므로, 지정/탐지한 디렉토리의
+    cgroup.subtree_control에 이미 cpu와 memory가 켜져 있어야 한다 (systemd Delegate=yes 등).
+    """
+    root = options.cgroup_root or _own_cgroup()
+    if root is None:
+        return None
+    try:
+        controllers = Path(root, "cgroup.subtree_control").read_text().split()
+    except OSError:
+        return None
+    if "cpu" not in controllers or "memory" not in controllers or not os.access(root, os.W_OK):
+        return None
+    return root
+
+
+class SandboxRun:
+    """
+    샌드박스 실행 하나의 준비물 (tmpfs 마운트 지점 + cgroup)
+
+    Example:
+        run = SandboxRun(options, memory_mb=512)
+        proc = subprocess.Popen(run.wrap(argv), ...)
+        ... (종료 후)
+        usage = run.usage()   # (cpu_s, max_rss_kb) 또는 None
+        run.close()
+    """
+
+    def __init__(self, options: SandboxOptions, memory_mb: Optional[float] = None):
+        self.options = options
+        # 샌드박스 안에서만 tmpfs가 마운트되는 빈 디렉토리 (밖에서는 빈 채로 남았다가 close()에서 삭제)
+        self.scratch = tempfile.mkdtemp(prefix="grader-sandbox-")
+        self.cgroup = self._create_cgroup(memory_mb)
+
+    def wrap(self, argv: List[str]) -> List[str]:
+        """argv를 샌드박스 안에서 실행하는 명령"""
+        settings = [
+            f"scratch={self.scratch}",
+            f"tmpfs_mb={int(self.options.tmpfs_mb)}",
+            f"network={int(bool(self.options.network))}",
+            f"cgroup={self.cgroup or ''}",
+        ]
+        return [sys.executable, "-I", "-S", _INIT_SCRIPT, *settings, "--", *argv]
+
+    def usage(self) -> Optional[Tuple[float, int]]:
+        """cgroup 단위 사용량 (CPU 초, 최대 메모리 KB) — cgroup이 없으면 None"""
+        if self.cgroup is None:
+            return None
+        try:
+            stat = dict(line.split() for line in Path(self.cgroup, "cpu.stat").read_text().splitlines())
+            cpu_s = int(stat.get("usage_usec", 0)) / 1e6
+        except (OSError, ValueError):
+            return None
+        try:
+            peak_kb = int(Path(self.cgroup, "memory.peak").read_text()) // 1024
+        except (OSError, ValueError):
+            # memory.peak가 없는 커널 (5.19 미만)
+            peak_kb = 0
+        return round(cpu_s, 6), peak_kb
+
+    def close(self) -> None:
+        """cgroup/tmpfs 마운트 지점 삭제 (프로세스가 모두 회수된 뒤 호출)"""
+        if self.cgroup is not None:
+            # PID 네임스페이스의 나머지 프로세스는 init 종료 후 커널이 비동기로 정리하므로 잠시 비어 있지 않을 수 있음
+            for _ in range(_CGROUP_RMDIR_RETRIES):
+                try:
+                    os.rmdir(self.cgroup)
+                    break
+                except OSError as e:
+                    if e.errno != errno.EBUSY:
+                        break
+                    time.sleep(0.01)
+            self.cgroup = None
+        shutil.rmtree(self.scratch, ignore_errors=True)
+
+    def _create_cgroup(self, memory_mb: Optional[float]) -> Optional[str]:
+        root = cgroup_root(self.options)
+        if root is None:
+            return None
+        path = os.path.join(root, f"grader-sandbox-{os.getpid()}-{next(_cgroup_ids)}")
+        try:
+            os.mkdir(path)
+            if memory_mb is not None:
+                _write(os.path.join(path, "memory.max"), str(int(memory_mb * 1024 * 1024)))
+                if os.path.exists(os.path.join(path, "memory.swap.max")):
+                    _write(os.path.join(path, "memory.swap.max"), "0")
+            if self.options.cpus is not None:
+                quota = max(1000, int(self.options.cpus * _CGROUP_PERIOD_US))
+                _write(os.path.join(path, "cpu.max"), f"{quota} {_CGROUP_PERIOD_US}")
+        except OSError:
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+            return None
+        return path
+
+
+def _clone_flags(network: bool) -> int:
+    flags = _CLONE_NEWNS | _CLONE_NEWPID
+    if not network:
+        flags |= _CLONE_NEWNET
+    if os.geteuid() != 0:
+        flags |= _CLONE_NEWUSER
+    return flags
+
+
+def _probe(flags: int) -> Optional[str]:
+    """자식 프로세스에서 unshare 시도 → 실패 사유 (성공 시 None)"""
+    try:
+        unshare = ctypes.CDLL(None, use_errno=True).unshare
+    except (OSError, AttributeError):
+        return "unshare 없음"
+    pid = os.fork()
+    if pid == 0:
+        # fork 후 자식: 미리 찾아 둔 함수만 호출하고 바로 종료
+        error = 0 if unshare(flags) == 0 else ctypes.get_errno()
+        os._exit(min(error, 255))
+    _, status = os.waitpid(pid, 0)
+    error = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+    if error == 0:
+        return None
+    return f"unshare 실패: {os.strerror(error) if error > 0 else status}"
+
+
+def _own_cgroup() -> Optional[str]:
+    """채점 프로세스가 속한 cgroup v2 디렉토리"""
+    try:
+        lines = Path("/proc/self/cgroup").read_text().splitlines()
+    except OSError:
+        return None
+    relative = next((line[3:] for line in lines if line.startswith("0::")), None)
+    mount = _cgroup2_mount()
+    if relative is None or mount is None:
+        return None
+    return os.path.join(mount, relative.lstrip("/"))
+
+
+def _cgroup2_mount() -> Optional[str]:
+    try:
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                fields = line.split()
+                separator = fields.index("-")
+                if fields[separator + 1] == "cgroup2":
+                    return fields[4]
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _write(path: str, text: str) -> None:
+    with open(path, "w") as f:
+        f.write(text)
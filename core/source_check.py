@@ -0,0 +1,153 @@
+"""
+학생 소스 정적 검사 (플러그인 공용)
+
+학생 스크립트를 실행하기 전의 문법 게이트, 학생 모듈의 import 범위(결과 캐시/검증기 입력 파일),
+채점 프로세스 안의 AST 파싱 직렬화용 락.
+같은 채점의 검증기끼리는 SubmissionScope로 결과를 공유하여 제출물당 한 번만 계산한다.
+"""
+import ast
+import glob
+import sys
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from .submission_scope import current_scope
+
+# ast.parse()/compile(AST) 직렬화용
+# CPython 3.11은 AST 변환 재귀 깊이를 인터프리터 전역으로 관리하므로, 병렬 검증기/비동기
+# 채점에서 여러 스레드가 동시에 파싱하면 SystemError(recursion depth mismatch)가 발생할 수 있음
+AST_LOCK = threading.Lock()
+
+# import하면 실행 중에 어떤 모듈이든 불러올 수 있는 모듈 (student_module_files()가 범위를 정하지 않음)
+_DYNAMIC_IMPORT_MODULES = {"importlib", "runpy", "imp"}
+
+
+def entry_compiles(submission_dir: str, entry: str) -> bool:
+    """
+    학생 실행 스크립트의 정적 게이트 (프로세스 실행 전 문법 검사)
+
+    entry 스크립트와, 그 스크립트가 모듈 최상위에서 import하는 제출물 내
+    모듈(.py)을 compile()로 검사한다. py_compile과 같은 검사지만
+    __pycache__를 제출물 디렉토리에 만들지 않는다.
+
+    Args:
+        submission_dir: 제출물 디렉토리 경로
+        entry: 실행 스크립트 파일명 (예: "cli.py")
+
+    Returns:
+        entry가 존재하고 관련 파일이 모두 컴파일되면 True
+    """
+    entry_path = Path(submission_dir) / entry
+    scope = current_scope()
+    if scope is None:
+        return _entry_compiles(entry_path)
+    return scope.get(f"core.entry_compiles:{entry_path}", lambda: _entry_compiles(entry_path))
+
+
+def _entry_compiles(entry_path: Path) -> bool:
+    tree = _compile(entry_path)
+    if tree is None:
+        return False
+
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name.split(".")[0] for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module.split(".")[0]]
+        else:
+            continue
+        for name in names:
+            if name in sys.builtin_module_names:
+                continue
+            module_path = entry_path.parent / f"{name}.py"
+            if module_path.is_file() and _compile(module_path) is None:
+                return False
+    return True
+
+
+def _compile(path: Path) -> Optional[ast.Module]:
+    """파일 파싱 + 컴파일 → AST (파일 없음/디코딩 실패/문법 오류 시 None)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        with AST_LOCK:
+            tree = ast.parse(source, filename=str(path))
+            compile(tree, str(path), "exec", dont_inherit=True)
+    except (OSError, SyntaxError, ValueError):
+        return None
+    return tree
+
+
+def student_module_files(submission_dir: str, modules: Iterable[str]) -> Optional[List[str]]:
+    """
+    학생 모듈과 그 모듈이 직접/간접적으로 import하는 제출물 안 모듈의 파일
+
+    import 문만 따라가며 학생 코드를 실행하지 않는다. 제출물 최상위의 name.py와 패키지 디렉토리
+    (패키지면 안의 .py 전체)를 모듈로 보며, 표준 라이브러리와 이름이 같은 파일도 스크립트 실행 시
+    먼저 import되므로 포함한다.
+
+    Args:
+        submission_dir: 제출물 디렉토리 경로
+        modules: 시작 모듈 이름 (예: ["models"])
+
+    Returns:
+        submission_dir 기준 상대 경로 목록 (정렬). 파싱할 수 없는 파일이나 동적 import
+        (importlib, __import__)가 있어 읽는 파일을 알 수 없으면 None
+    """
+    modules = sorted(modules)
+    root = Path(submission_dir)
+    scope = current_scope()
+    if scope is None:
+        return _student_module_files(root, modules)
+    key = f"core.student_module_files:{root}:{','.join(modules)}"
+    return scope.get(key, lambda: _student_module_files(root, modules))
+
+
+def _student_module_files(root: Path, modules: List[str]) -> Optional[List[str]]:
+    found: Set[Path] = set()
+    queue = [path for name in modules for path in _module_paths(root, name)]
+    while queue:
+        path = queue.pop()
+        if path in found:
+            continue
+        found.add(path)
+        names = _imported_names(path)
+        if names is None:
+            return None
+        for name in names:
+            queue.extend(_module_paths(root, name))
+    return sorted(path.relative_to(root).as_posix() for path in found)
+
+
+def _module_paths(root: Path, name: str) -> List[Path]:
+    """최상위 모듈 이름 → 제출물 안의 파일 (없으면 빈 리스트)"""
+    module_file = root / f"{name}.py"
+    if module_file.is_file():
+        return [module_file]
+    package = root / name
+    if package.is_dir():
+        return [Path(path) for path in glob.glob(f"{glob.escape(str(package))}/**/*.py", recursive=True)]
+    return []
+
+
+def _imported_names(path: Path) -> Optional[Set[str]]:
+    """파일이 import하는 최상위 모듈 이름 (파싱 실패/동적 import면 None)"""
+    try:
+        source = path.read_bytes()
+        with AST_LOCK:
+            tree = ast.parse(source, filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+        elif isinstance(node, ast.Name) and node.id == "__import__":
+            return None
+    if names & _DYNAMIC_IMPORT_MODULES:
+        return None
+    return names
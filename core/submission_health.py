@@ -0,0 +1,142 @@
+"""
+제출물 단위 학생 프로그램 상태 (circuit breaker)
+
+멈추거나 시작하자마자 죽는 학생 프로그램을 검증기마다 다시 실행하면 실행마다 제한 시간을 모두 기다린다.
+Grader는 제출물마다 SubmissionHealth 하나를 SubmissionScope에 두고, 학생 프로그램 실행 경로
+(core.process_supervisor, core.process_runner, CLI zygote, REPL 세션)가 프로그램(스크립트 이름)별로
+타임아웃/시작 실패를 기록한다. core.supervised_executor는 학생 모듈 import 타임아웃을 모듈 파일 이름(models.py 등)으로 기록한다. 기록이 execution.circuit_breaker의 한도에 닿으면 그 프로그램의 이후 실행은
+시작하지 않고 바로 실패한다 (이미 실행 중인 실행과 다른 프로그램은 그대로 둔다).
+중단 사유는 채점 결과(circuit_breaker)와 트레이스에 남는다.
+
+    execution:
+      circuit_breaker:
+        max_timeouts: 1            # 이 횟수만큼 타임아웃이 나면 이후 실행 중단 (null이면 제한 없음)
+        max_startup_errors: 1      # 첫 프롬프트 전 종료 등 시작 실패 허용 횟수
+      circuit_breaker: false       # 끄기
+
+Grader 밖에서 검증기를 직접 실행하면 상태를 공유하지 않는다 (current_health()가 None).
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from . import tracing
+from .submission_scope import current_scope
+
+SCOPE_KEY = "core.submission_health"
+
+
+class CircuitOpenError(OSError):
+    """circuit breaker가 열려 학생 프로그램을 실행하지 않음 (실행 실패와 같이 처리됨)"""
+
+
+class SubmissionHealth:
+    """
+    제출물 하나의 학생 프로그램별 타임아웃/시작 실패 집계
+
+    Attributes:
+        reasons: 실행을 중단한 프로그램 → 사유
+        refused: 프로그램 → 중단 후 실행하지 않은 횟수
+    """
+
+    def __init__(self, max_timeouts: Optional[int] = 1, max_startup_errors: Optional[int] = 1):
+        self.max_timeouts = max_timeouts
+        self.max_startup_errors = max_startup_errors
+        self.timeouts: Dict[str, int] = {}
+        self.startup_errors: Dict[str, List[str]] = {}
+        self.reasons: Dict[str, str] = {}
+        self.refused: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["SubmissionHealth"]:
+        """execution.circuit_breaker 설정 (false면 None)"""
+        value = (config.get("execution") or {}).get("circuit_breaker", True)
+        if not value:
+            return None
+        if not isinstance(value, dict):
+            return cls()
+        return cls(**{name: value[name] for name in ("max_timeouts", "max_startup_errors") if name in value})
+
+    def record_timeout(self, program: str) -> None:
+        """학생 프로그램 타임아웃 기록"""
+        with self._lock:
+            count = self.timeouts[program] = self.timeouts.get(program, 0) + 1
+            if _reached(count, self.max_timeouts):
+                self._open(program, f"타임아웃 {count}회")
+
+    def record_startup_error(self, program: str, detail: str) -> None:
+        """학생 프로그램 시작 실패 기록 (예: 첫 프롬프트 전에 종료)"""
+        with self._lock:
+            errors = self.startup_errors.setdefault(program, [])
+            errors.append(detail)
+            if _reached(len(errors), self.max_startup_errors):
+                self._open(program, f"시작 실패 {len(errors)}회 ({detail})")
+
+    def check(self, program: str) -> None:
+        """
+        program을 새로 실행하기 전 호출
+
+        Raises:
+            CircuitOpenError: 이미 한도에 닿아 실행하지 않음
+        """
+        with self._lock:
+            reason = self.reasons.get(program)
+            if reason is None:
+                return
+            self.refused[program] = self.refused.get(program, 0) + 1
+        raise CircuitOpenError(f"학생 프로그램 실행 중단: {program}: {reason}")
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        """채점 결과에 남길 중단 기록 {프로그램: {reason, refused}} (중단한 프로그램이 없으면 None)"""
+        with self._lock:
+            if not self.reasons:
+                return None
+            return {
+                program: {"reason": reason, "refused": self.refused.get(program, 0)}
+                for program, reason in self.reasons.items()
+            }
+
+    def _open(self, program: str, reason: str) -> None:
+        if program not in self.reasons:
+            self.reasons[program] = reason
+            tracing.instant("circuit open", cat="process", program=program, reason=reason)
+
+
+def current_health() -> Optional[SubmissionHealth]:
+    """현재 채점 중인 제출물의 상태 (Grader 밖이거나 circuit_breaker가 꺼져 있으면 None)"""
+    scope = current_scope()
+    if scope is None:
+        return None
+    return scope.get(SCOPE_KEY, lambda: None)
+
+
+def check_launch(program: str) -> None:
+    """학생 프로그램 실행 전 확인 (CircuitOpenError: 실행 중단)"""
+    health = current_health()
+    if health is not None:
+        health.check(program)
+
+
+def note_timeout(program: str) -> None:
+    """학생 프로그램 타임아웃을 현재 제출물 상태에 기록 (program: 사유에 남길 이름, 예: program_name(argv))"""
+    health = current_health()
+    if health is not None:
+        health.record_timeout(program)
+
+
+def note_startup_error(program: str, detail: str) -> None:
+    """학생 프로그램 시작 실패를 현재 제출물 상태에 기록"""
+    health = current_health()
+    if health is not None:
+        health.record_startup_error(program, detail)
+
+
+def program_name(argv: Sequence[str]) -> str:
+    """실행 명령에서 학생 스크립트 이름 (샌드박스/가상 시계로 감싼 명령이면 마지막 .py)"""
+    scripts = [arg for arg in argv if str(arg).endswith(".py")]
+    return os.path.basename(str(scripts[-1] if scripts else argv[0]))
+
+
+def _reached(count: int, limit: Optional[int]) -> bool:
+    return limit is not None and count >= limit
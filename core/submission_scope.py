@@ -0,0 +1,93 @@
+"""
+제출물 단위 공유 자원
+
+Grader가 제출물 하나를 채점하는 동안 검증기끼리 공유하는 자원(학생 프로그램 세션 등)을 보관한다.
+현재 스코프는 contextvars로 전달되므로 같은 채점 안의 비동기 태스크와 스레드 풀 작업에서 조회할 수 있다.
+"""
+import contextlib
+import contextvars
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_current_scope: "contextvars.ContextVar[Optional[SubmissionScope]]" = contextvars.ContextVar(
+    "submission_scope", default=None
+)
+
+
+class SubmissionScope:
+    """
+    채점 한 번 동안 유지되는 공유 자원 저장소
+
+    자원은 get()으로 처음 요청될 때 만들어지며, 채점이 끝나면 aclose()/close()가
+    있는 자원을 생성 역순으로 정리한다 (동기 채점은 close()).
+
+    Example:
+        scope = current_scope()
+        session = scope.get("ds.repl_session", lambda: ReplSessionManager(...))
+    """
+
+    def __init__(self):
+        self._resources: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, factory: Callable[[], Any]) -> Any:
+        """key에 해당하는 자원 반환 (없으면 factory()로 생성)"""
+        with self._lock:
+            if key not in self._resources:
+                self._resources[key] = factory()
+            return self._resources[key]
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["SubmissionScope"]:
+        """with 블록 동안 현재 컨텍스트의 스코프로 지정"""
+        token = _current_scope.set(self)
+        try:
+            yield self
+        finally:
+            _current_scope.reset(token)
+
+    def close(self) -> None:
+        """
+        보관 중인 자원 정리 (동기 채점용, close()가 있는 자원만)
+
+        한 자원의 정리가 실패해도 나머지 자원은 모두 정리하고, 첫 번째 예외를 다시 발생시킨다.
+        """
+        errors: List[BaseException] = []
+        for resource in reversed(self._pop_all()):
+            if hasattr(resource, "close"):
+                try:
+                    resource.close()
+                except Exception as e:
+                    errors.append(e)
+        _raise_first(errors)
+
+    async def aclose(self) -> None:
+        """보관 중인 자원 정리 (비동기 자원은 await, 예외 처리는 close()와 같음)"""
+        errors: List[BaseException] = []
+        for resource in reversed(self._pop_all()):
+            try:
+                aclose = getattr(resource, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                elif hasattr(resource, "close"):
+                    resource.close()
+            except Exception as e:
+                errors.append(e)
+        _raise_first(errors)
+
+    def _pop_all(self) -> List[Any]:
+        with self._lock:
+            resources = list(self._resources.values())
+            self._resources.clear()
+        return resources
+
+
+def _raise_first(errors: List[BaseException]) -> None:
+    """정리 중 발생한 예외 중 첫 번째를 다시 발생"""
+    if errors:
+        raise errors[0]
+
+
+def current_scope() -> Optional[SubmissionScope]:
+    """현재 채점 중인 제출물의 스코프 (Grader 밖에서 검증기를 직접 실행하면 None)"""
+    return _current_scope.get()
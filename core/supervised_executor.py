@@ -0,0 +1,341 @@
+"""
+감시 실행기 (학생 코드를 채점 프로세스 밖에서 실행)
+
+검증기 인스턴스의 사본을 받은 자식 프로세스에서 학생 모듈을 import하고, 검증 함수를
+이름으로 호출하여 결과만 돌려받는다. 호출마다 제한 시간을 두고, 자식 프로세스의
+메모리를 제한하므로 학생 코드의 무한 루프/메모리 폭주가 채점 프로세스를 멈추지 않는다.
+
+자식 프로세스는 채점 프로세스를 직접 fork하지 않고 multiprocessing forkserver(검증기 모듈을 미리
+import한 단일 스레드 프로세스)에서 fork한다. 채점 프로세스는 검증기/체크 항목/비동기 채점 스레드가 도는
+멀티스레드 프로세스라서, 직접 fork하면 다른 스레드가 잡고 있던 락(logging, import, tracing 등)을 물려받은
+자식이 prepare에서 멈출 수 있고 그 멈춤이 학생 모듈 import 타임아웃으로 기록된다.
+
+prepare 중 자식 프로세스는 report_progress()로 지금 import하는 학생 모듈을 알린다. 부모는 그 모듈에
+circuit breaker(core.submission_health)가 열려 있으면 자식 프로세스를 멈추고, prepare가 제한 시간을
+넘기면 마지막으로 알린 모듈에 타임아웃을 기록한다. 그래서 import 중 멈추는 models.py는 처음 한 번만
+제한 시간을 기다리고, 같은 모듈을 import하는 이후 검증기는 바로 실패한다.
+"""
+import io
+import multiprocessing
+import os
+import pickle
+import resource
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .checklist import Checklist
+from .resource_usage import record_timeout
+from .submission_health import CircuitOpenError, check_launch, note_timeout
+
+# forkserver를 지원하지 않는 플랫폼에서는 현재 프로세스에서 직접 실행
+_FORKSERVER_AVAILABLE = "forkserver" in multiprocessing.get_all_start_methods()
+
+# 학생 코드를 자식 프로세스에서 실행하는지 (False면 채점 프로세스에서 직접 실행하므로
+# 학생 모듈 import가 sys.meta_path/sys.modules 등 프로세스 전역 상태를 바꿈)
+ISOLATED = _FORKSERVER_AVAILABLE
+
+# forkserver가 미리 import할 모듈 (자식 프로세스마다 다시 import하지 않음)
+_PRELOAD = ("__main__", "core.supervised_executor")
+_preload_lock = threading.Lock()
+_preload_set = False
+
+# 대상 객체를 자식 프로세스에 넘길 때 빼는 객체 (자식 프로세스에서 쓰지 않고 pickle할 수 없음)
+_OMITTED = "omitted"
+
+_READY = "ready"
+_PROGRESS = "progress"
+_CLOSE = None
+
+# 자식 프로세스에서 부모와 연결된 파이프 (prepare 중에만 설정)
+_progress_conn = None
+
+
+class SupervisedExecutor:
+    """
+    자식 프로세스에서 대상 객체의 메서드 실행
+
+    자식 프로세스는 첫 호출 때 만들어지며, 대상 객체의 사본을 받아 prepare 메서드(학생 모듈 import 등)를
+    실행한 뒤 호출을 차례로 처리한다. 자식 프로세스의 상태(import한 모듈, 속성 변경)는 호출 사이에 유지되고
+    채점 프로세스에는 반영되지 않는다. 대상 객체(체크리스트와 감시 실행기 속성은 빼고 보냄)와
+    반환값은 pickle 가능해야 한다.
+
+    제한 시간 초과/자식 프로세스 종료 시 해당 호출은 예외로 끝나고, 다음 호출은 새 자식
+    프로세스에서 실행된다. prepare 단계에서 제한 시간을 넘기면 이후 호출은 바로 실패한다.
+
+    Example:
+        self.student = SupervisedExecutor.from_config(self, self.config, prepare="_import_modules")
+        CheckItem(..., validator=self.student.wrap(self._check_fields))
+        ...
+        self.student.close()  # teardown
+    """
+
+    def __init__(self, target: Any, prepare: Optional[str] = None,
+                 timeout: float = 10, memory_mb: Optional[int] = 512,
+                 preload: Sequence[str] = ()):
+        """
+        Args:
+            target: 자식 프로세스에서 메서드를 호출할 객체 (보통 검증기 자신)
+            prepare: 자식 프로세스 시작 시 호출할 메서드 이름
+            timeout: 호출당 제한 시간 (초, prepare 포함)
+            memory_mb: 자식 프로세스가 추가로 쓸 수 있는 가상 메모리 (MB, None이면 제한 없음)
+            preload: forkserver가 미리 import할 모듈 (대상 객체의 모듈은 항상 포함,
+                프로세스에서 forkserver를 처음 시작할 때만 반영)
+        """
+        self.target = target
+        self.prepare = prepare
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.preload = [type(target).__module__, *preload]
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn = None
+        self._lock = threading.Lock()
+        # prepare 실패 사유 (설정되면 이후 호출은 바로 실패)
+        self._broken: Optional[str] = None
+        self._prepared_inline = False
+
+    @classmethod
+    def from_config(cls, target: Any, config: Dict[str, Any],
+                    prepare: Optional[str] = None) -> "SupervisedExecutor":
+        """
+        미션 설정의 execution.student_call_timeout / execution.student_memory_mb 적용
+
+        forkserver는 미션의 검증기 모듈을 모두 미리 import한다.
+        """
+        execution = config.get("execution") or {}
+        return cls(
+            target,
+            prepare=prepare,
+            timeout=execution.get("student_call_timeout", 10),
+            memory_mb=execution.get("student_memory_mb", 512),
+            preload=[v["module"] for v in config.get("validators", []) if "module" in v],
+        )
+
+    def wrap(self, method: Callable[[], Any]) -> Callable[[], Any]:
+        """대상 객체의 메서드를 자식 프로세스에서 실행하는 검증 함수로 변환 (CheckItem.validator용)"""
+        name = method.__name__
+
+        def run() -> Any:
+            return self.call(name)
+
+        run.__name__ = name
+        return run
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        자식 프로세스에서 target.name(*args, **kwargs) 실행
+
+        Raises:
+            subprocess.TimeoutExpired: 제한 시간 초과 (자식 프로세스는 종료됨)
+            RuntimeError: 메서드에서 예외 발생, 자식 프로세스 비정상 종료, prepare 실패
+        """
+        if not ISOLATED:
+            return self._call_inline(name, args, kwargs)
+
+        with self._lock:
+            if self._broken is not None:
+                raise RuntimeError(self._broken)
+            if self._process is None:
+                self._start()
+                if self._broken is not None:
+                    raise RuntimeError(self._broken)
+
+            self._conn.send((name, args, kwargs))
+            if not self._conn.poll(self.timeout):
+                self._stop()
+                raise subprocess.TimeoutExpired(f"{type(self.target).__name__}.{name}", self.timeout)
+            try:
+                status, value = self._conn.recv()
+            except (EOFError, OSError):
+                exitcode = self._stop()
+                raise RuntimeError(f"학생 코드 실행 중 프로세스 종료 (exit code {exitcode})")
+
+        if status == "error":
+            raise RuntimeError(value)
+        return value
+
+    def close(self) -> None:
+        """자식 프로세스 종료"""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._conn.send(_CLOSE)
+            except (OSError, ValueError):
+                pass
+            self._process.join(1)
+            self._stop()
+
+    def _start(self) -> None:
+        """자식 프로세스 시작 (forkserver에서 fork) + prepare 완료 대기"""
+        context = _forkserver_context(self.preload)
+        try:
+            target = _dump_target(self.target)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self._broken = f"검증기를 자식 프로세스로 보낼 수 없습니다: {type(e).__name__}: {e}"
+            return
+        parent_conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(child_conn, target, self.prepare, self.memory_mb),
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+        # 자식 프로세스가 마지막으로 알린 준비 단계 (import 중인 학생 모듈)
+        step: Optional[str] = None
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if not parent_conn.poll(max(0.0, deadline - time.monotonic())):
+                self._stop()
+                record_timeout()
+                if step is not None:
+                    note_timeout(step)
+                self._broken = f"학생 모듈 준비 시간 초과 ({self.timeout}초)"
+                return
+            try:
+                status, value = parent_conn.recv()
+            except (EOFError, OSError):
+                self._broken = f"학생 모듈 준비 중 프로세스 종료 (exit code {self._stop()})"
+                return
+            if status != _PROGRESS:
+                break
+            step = value
+            try:
+                check_launch(step)
+            except CircuitOpenError as e:
+                self._stop()
+                self._broken = str(e)
+                return
+        if status != _READY:
+            self._stop()
+            self._broken = value
+
+    def _stop(self) -> Optional[int]:
+        """자식 프로세스 강제 종료 + 회수 → 종료 코드"""
+        process, self._process = self._process, None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if process is None:
+            return None
+        if process.is_alive():
+            process.kill()
+        process.join()
+        exitcode = process.exitcode
+        process.close()
+        return exitcode
+
+    def _call_inline(self, name: str, args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            if self.prepare and not self._prepared_inline:
+                getattr(self.target, self.prepare)()
+                self._prepared_inline = True
+        return getattr(self.target, name)(*args, **kwargs)
+
+
+def report_progress(step: str) -> None:
+    """
+    prepare 중 지금 실행하는 단계를 부모 프로세스에 알림 (SupervisedExecutor 자식 프로세스 밖에서는 무시)
+
+    Args:
+        step: circuit breaker에 기록할 이름 (예: import하는 학생 모듈 "models.py")
+    """
+    if _progress_conn is not None:
+        _progress_conn.send((_PROGRESS, step))
+
+
+def _forkserver_context(preload: Sequence[str]) -> multiprocessing.context.BaseContext:
+    """forkserver 컨텍스트 (이 프로세스에서 처음 쓸 때 미리 import할 모듈 지정)"""
+    global _preload_set
+    context = multiprocessing.get_context("forkserver")
+    with _preload_lock:
+        if not _preload_set:
+            context.set_forkserver_preload(list(dict.fromkeys([*_PRELOAD, *preload])))
+            _preload_set = True
+    return context
+
+
+class _TargetPickler(pickle.Pickler):
+    """대상 객체 직렬화 (체크리스트와 감시 실행기는 자식 프로세스에서 None)"""
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if isinstance(obj, (SupervisedExecutor, Checklist)):
+            return _OMITTED
+        return None
+
+
+class _TargetUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: str) -> Any:
+        return None
+
+
+def _dump_target(target: Any) -> bytes:
+    buffer = io.BytesIO()
+    _TargetPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(target)
+    return buffer.getvalue()
+
+
+def _serve(conn, target: bytes, prepare: Optional[str], memory_mb: Optional[int]) -> None:
+    """자식 프로세스: prepare 후 (메서드 이름, args, kwargs) 요청을 차례로 처리"""
+    global _progress_conn
+    if memory_mb:
+        _limit_memory(memory_mb)
+
+    try:
+        target = _TargetUnpickler(io.BytesIO(target)).load()
+    except BaseException as e:
+        conn.send(("error", f"검증기 복원 실패: {type(e).__name__}: {e}"))
+        return
+
+    try:
+        if prepare:
+            _progress_conn = conn
+            try:
+                getattr(target, prepare)()
+            finally:
+                _progress_conn = None
+        conn.send((_READY, None))
+    except BaseException as e:
+        conn.send(("error", f"학생 모듈 준비 실패: {type(e).__name__}: {e}"))
+        return
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is _CLOSE:
+            return
+        name, args, kwargs = request
+        try:
+            response = ("ok", getattr(target, name)(*args, **kwargs))
+        except BaseException as e:
+            response = ("error", f"{type(e).__name__}: {e}")
+        try:
+            conn.send(response)
+        except Exception as e:
+            # 반환값 pickle 실패
+            conn.send(("error", f"결과 전달 실패: {type(e).__name__}: {e}"))
+
+
+def _limit_memory(memory_mb: int) -> None:
+    """
+    현재 가상 메모리 + memory_mb로 주소 공간 제한
+
+    자식 프로세스는 단일 스레드인 forkserver에서 fork되므로 현재 크기는 forkserver(미리 import한
+    검증기 모듈)와 거의 같고, 채점 프로세스의 다른 스레드 스택/메모리 arena는 포함되지 않는다.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            current = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return
+    limit = current + memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
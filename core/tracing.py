@@ -0,0 +1,139 @@
+"""
+채점 파이프라인 트레이스 (Chrome trace-event 형식)
+
+enable() 후 span()으로 감싼 구간과 학생 프로세스 실행 시점을 기록하고, write()로
+Perfetto(ui.perfetto.dev) / about://tracing에서 열 수 있는 JSON 파일을 만든다.
+시각은 시스템 전역 단조 시계(time.monotonic_ns)를 쓰므로 배치 워커 프로세스의 이벤트를
+부모 프로세스에서 그대로 합칠 수 있다.
+"""
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+_enabled = False
+_owner_pid = 0
+_events: List[Dict[str, Any]] = []
+_named_threads = set()
+_lock = threading.Lock()
+_hook_installed = False
+
+# 학생 프로세스 실행으로 기록하는 audit 이벤트
+_SPAWN_EVENTS = frozenset({"subprocess.Popen", "os.system"})
+
+
+def enable(process_name: str = "grader") -> None:
+    """현재 프로세스에서 트레이스 기록 시작"""
+    global _enabled, _owner_pid, _hook_installed
+    with _lock:
+        if _owner_pid != os.getpid():
+            # fork로 물려받은 부모 프로세스 이벤트는 버림 (부모에서 중복 기록됨)
+            _events.clear()
+            _named_threads.clear()
+            _owner_pid = os.getpid()
+        _enabled = True
+        _events.append(_metadata("process_name", {"name": f"{process_name} ({os.getpid()})"}))
+        if not _hook_installed:
+            sys.addaudithook(_audit_hook)
+            _hook_installed = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextlib.contextmanager
+def span(name: str, cat: str = "grader", **args: Any) -> Iterator[None]:
+    """
+    구간 기록 (트레이스가 꺼져 있으면 아무것도 하지 않음)
+
+    Example:
+        with tracing.span("setup", cat="validator", validator="LRUValidator"):
+            validator.setup()
+    """
+    if not _enabled:
+        yield
+        return
+
+    start_ns = time.monotonic_ns()
+    try:
+        yield
+    finally:
+        end_ns = time.monotonic_ns()
+        _append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start_ns / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+
+def instant(name: str, cat: str = "grader", **args: Any) -> None:
+    """시점 이벤트 기록"""
+    if not _enabled:
+        return
+    _append({
+        "name": name,
+        "cat": cat,
+        "ph": "i",
+        "s": "t",
+        "ts": time.monotonic_ns() / 1000,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": args,
+    })
+
+
+def drain() -> List[Dict[str, Any]]:
+    """지금까지 기록된 이벤트를 꺼내고 비움 (배치 워커 → 부모 전달용)"""
+    with _lock:
+        events = list(_events)
+        _events.clear()
+        return events
+
+
+def extend(events: Iterable[Dict[str, Any]]) -> None:
+    """다른 프로세스에서 기록된 이벤트 합치기"""
+    with _lock:
+        _events.extend(events)
+
+
+def write(path: str) -> None:
+    """지금까지 기록된 이벤트를 Chrome trace-event JSON 파일로 저장"""
+    with _lock:
+        data = {"traceEvents": list(_events), "displayTimeUnit": "ms"}
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def _append(event: Dict[str, Any]) -> None:
+    with _lock:
+        key = (event["pid"], event["tid"])
+        if key not in _named_threads:
+            _named_threads.add(key)
+            _events.append(_metadata("thread_name", {"name": threading.current_thread().name},
+                                     tid=event["tid"]))
+        _events.append(event)
+
+
+def _metadata(name: str, args: Dict[str, Any], tid: int = 0) -> Dict[str, Any]:
+    return {"name": name, "ph": "M", "pid": os.getpid(), "tid": tid, "args": args}
+
+
+def _audit_hook(event: str, args: tuple) -> None:
+    if _enabled and event in _SPAWN_EVENTS:
+        # subprocess.Popen: (executable, args, cwd, env), os.system: (command,)
+        command = args[1] if event == "subprocess.Popen" else args[0]
+        if isinstance(command, (list, tuple)):
+            command = " ".join(str(part) for part in command)
+        instant("spawn", cat="process", command=str(command)[:200])
@@ -1,10 +1,19 @@
 """
 검증 결과 클래스
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
 
+# 리포트의 "가장 느린 체크" 항목 수
+_SLOWEST_CHECKS = 5
+
+# 체크 항목 상태별 리포트 표시
+_STATUS_EMOJI = {
+    "passed": "✅",
+    "skipped": "⏭️",
+}
+
 
 class ValidationResult:
     """
@@ -18,6 +27,16 @@ class ValidationResult:
         self.results: List[Dict[str, Any]] = []
         self.overall_passed = False
         self.overall_score = 0.0
+        # 채점 소요 시간 (초, Grader.execute에서 기록)
+        self.duration = 0.0
+        # decide-only 모드 여부 (True면 합격/불합격만 유효, 점수는 부분 집계)
+        self.decide_only = False
+        # 결과 캐시에서 재사용한 결과인지 여부
+        self.cache_hit = False
+        # 학생 프로그램별 실행 중단 기록 {프로그램: {reason, refused}} (core.submission_health, 없으면 None)
+        self.circuit_breaker: Optional[Dict[str, Any]] = None
+        # 배치 워커에서 기록한 트레이스 이벤트 (부모 프로세스 전달용, 저장하지 않음)
+        self.trace_events: List[Dict[str, Any]] = []
 
     def add_result(self, validator_name: str, result: Dict[str, Any]) -> None:
         """검증기 결과 추가"""
@@ -40,16 +59,38 @@ class ValidationResult:
         total_score = sum(r["result"].get("score", 0) for r in self.results)
         self.overall_score = total_score / len(self.results)
 
-    def to_json(self) -> str:
-        """JSON 형식으로 변환"""
-        return json.dumps({
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
             "student_id": self.student_id,
             "mission_id": self.mission_id,
             "timestamp": self.timestamp,
             "overall_passed": self.overall_passed,
             "overall_score": round(self.overall_score, 2),
+            "duration": round(self.duration, 3),
+            "decide_only": self.decide_only,
+            "cache_hit": self.cache_hit,
+            "circuit_breaker": self.circuit_breaker,
             "results": self.results
-        }, indent=2, ensure_ascii=False)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
+        """to_dict() 결과로부터 복원 (합격 여부/점수는 검증기 결과로 다시 계산)"""
+        result = cls(data["student_id"], data["mission_id"])
+        result.timestamp = data.get("timestamp", result.timestamp)
+        result.duration = data.get("duration", 0.0)
+        result.decide_only = data.get("decide_only", False)
+        result.cache_hit = data.get("cache_hit", False)
+        result.circuit_breaker = data.get("circuit_breaker")
+        for entry in data.get("results", []):
+            result.add_result(entry["validator"], entry["result"])
+        result.finalize()
+        return result
+
+    def to_json(self) -> str:
+        """JSON 형식으로 변환"""
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
 
     def to_markdown(self) -> str:
         """Markdown 리포트 생성"""
@@ -58,7 +99,14 @@ class ValidationResult:
         md += f"- **미션 ID**: {self.mission_id}\n"
         md += f"- **채점 시각**: {self.timestamp}\n"
         md += f"- **최종 결과**: {'✅ PASS' if self.overall_passed else '❌ FAIL'}\n"
-        md += f"- **종합 점수**: {round(self.overall_score, 2)}점\n\n"
+        md += f"- **종합 점수**: {round(self.overall_score, 2)}점\n"
+        if self.cache_hit:
+            md += "- **캐시**: 동일 제출물의 이전 채점 결과 재사용\n"
+        if self.decide_only:
+            md += "- **채점 모드**: decide-only (합격/불합격만 유효, 점수는 부분 집계)\n"
+        for program, record in (self.circuit_breaker or {}).items():
+            md += f"- **학생 프로그램 실행 중단**: {program} — {record['reason']} (이후 실행 {record['refused']}회 생략)\n"
+        md += "\n"
 
         md += "---\n\n"
 
@@ -69,13 +117,22 @@ class ValidationResult:
             md += f"## {idx}. {validator}\n\n"
             md += f"- **결과**: {'✅ 통과' if result.get('is_passed') else '❌ 실패'}\n"
             md += f"- **점수**: {result.get('earned_points', 0)} / {result.get('total_points', 0)}\n"
-            md += f"- **통과율**: {result.get('passed_items', 0)} / {result.get('total_items', 0)}\n\n"
+            md += f"- **통과율**: {result.get('passed_items', 0)} / {result.get('total_items', 0)}\n"
+            if result.get("skip_reason"):
+                md += f"- **건너뜀**: {result['skip_reason']}\n"
+            if result.get("cache_hit"):
+                md += "- **캐시**: 입력 파일 변경 없음, 이전 결과 재사용\n"
+            if result.get("resources"):
+                md += f"- **리소스**: {_format_resources(result['resources'])}\n"
+            md += "\n"
 
             md += "### 세부 체크리스트\n\n"
             for item in result.get("items", []):
-                status_emoji = "✅" if item["status"] == "passed" else "❌"
+                status_emoji = _STATUS_EMOJI.get(item["status"], "❌")
                 md += f"{status_emoji} **[{item['points']}점]** {item['description']}\n"
 
+                if item.get("skip_reason"):
+                    md += f"   - 건너뜀: {item['skip_reason']}\n"
                 if item.get("error_message"):
                     md += f"   - 오류: `{item['error_message']}`\n"
                 if item.get("hint") and item["status"] != "passed":
@@ -83,4 +140,39 @@ class ValidationResult:
 
             md += "\n---\n\n"
 
+        md += self._slowest_checks_markdown()
+        return md
+
+    def _slowest_checks_markdown(self) -> str:
+        """실행된 체크 중 소요 시간 상위 항목 표"""
+        executed = [
+            (result_item["validator"], item)
+            for result_item in self.results
+            for item in result_item["result"].get("items", [])
+            if item.get("resources")
+        ]
+        if not executed:
+            return ""
+
+        executed.sort(key=lambda pair: pair[1]["resources"]["wall_ns"], reverse=True)
+
+        md = "## 가장 느린 체크\n\n"
+        md += "| 검증기 | 체크 항목 | 소요 시간 | 채점기 CPU | 자식 CPU | 자식 프로세스 | 자식 최대 RSS |\n"
+        md += "|---|---|---|---|---|---|---|\n"
+        for validator, item in executed[:_SLOWEST_CHECKS]:
+            res = item["resources"]
+            md += (f"| {validator} | {item['id']} | {res['wall_ns'] / 1e9:.3f}s "
+                   f"| {res['cpu_s']:.3f}s | {res['children_cpu_s']:.3f}s "
+                   f"| {res['spawned_processes']} | {res['children_max_rss_kb']} KB |\n")
+        md += "\n"
         return md
+
+
+def _format_resources(res: Dict[str, Any]) -> str:
+    """검증기 리소스 사용량 한 줄 요약"""
+    summary = (f"{res['wall_ns'] / 1e9:.3f}s "
+               f"(채점기 CPU {res['cpu_s']:.3f}s, 자식 CPU {res['children_cpu_s']:.3f}s, "
+               f"자식 프로세스 {res['spawned_processes']}개")
+    if res.get("timeouts"):
+        summary += f", 타임아웃 {res['timeouts']}회"
+    return summary + ")"
@@ -0,0 +1,153 @@
+"""
+제출물 작업 사본 (검증기별 private workspace)
+
+학생 프로그램을 실행하는 검증기는 제출물 디렉토리 대신 작업 사본을 작업 디렉토리로 쓴다.
+학생 프로그램이 쓰는 데이터 파일(add 후 books.json 등)은 작업 사본에만 생기고 close()에서 버려지므로
+검증기끼리 서로의 파일을 보지 않고, 채점이 제출물을 바꾸지 않는다 (재채점 결과가 같음).
+
+파일은 다음 순서로 가장 싼 방법으로 만든다.
+- reflink (FICLONE, btrfs/xfs 등 같은 파일 시스템): 블록을 공유하고 쓰기 시 복사
+- hardlink (같은 파일 시스템, .py/.pyc만): 프로그램이 제자리에서 고쳐 쓰지 않는 소스 파일
+- 복사 (mtime 유지 — __pycache__의 .pyc가 그대로 유효)
+
+작업 사본 위치는 execution.workspace_root (기본: tmpfs인 /dev/shm, 없으면 임시 디렉토리)이다.
+제출물과 같은 파일 시스템에 두면 소스 파일은 복사 없이 링크된다.
+
+    workspace = Workspace.from_config(config)
+    try:
+        subprocess.run([sys.executable, "cli.py", "add", ...], cwd=workspace.path)
+    finally:
+        workspace.close()
+"""
+import fcntl
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+
+from . import tracing
+
+# 작업 사본에 넣지 않는 디렉토리
+_SKIP_DIRS = frozenset({".git", ".hg", ".svn"})
+# hardlink해도 되는 파일 (학생 프로그램이 제자리에서 고쳐 쓰지 않음 — .pyc는 임시 파일 후 교체로 갱신됨)
+_LINK_SUFFIXES = frozenset({".py", ".pyc"})
+_FICLONE = 0x40049409
+_TMPFS_ROOT = "/dev/shm"
+
+
+class Workspace:
+    """
+    제출물 하나의 작업 사본
+
+    만들 수 없으면(공간 부족 등) path가 제출물 디렉토리 자체가 된다 (isolated=False).
+    """
+
+    def __init__(self, submission_dir: str, root: Optional[str] = None):
+        """
+        Args:
+            submission_dir: 제출물 디렉토리
+            root: 작업 사본을 만들 디렉토리 (None이면 /dev/shm 또는 임시 디렉토리)
+        """
+        self.submission_dir = os.path.abspath(submission_dir)
+        self.path = self.submission_dir
+        self.isolated = False
+        self._base: Optional[str] = None
+        # 생성 방법별 파일 수
+        self.counts = {"reflink": 0, "hardlink": 0, "copy": 0}
+
+        if not os.path.isdir(self.submission_dir):
+            return
+        with tracing.span("create workspace", cat="workspace", submission=self.submission_dir):
+            for candidate in _roots(root):
+                try:
+                    self._base = tempfile.mkdtemp(prefix="grader-workspace-", dir=candidate)
+                    path = os.path.join(self._base, os.path.basename(self.submission_dir) or "submission")
+                    _clone_tree(self.submission_dir, path, os.stat(self.submission_dir).st_dev, self.counts)
+                except OSError:
+                    self._discard_base()
+                    self.counts = dict.fromkeys(self.counts, 0)
+                    continue
+                self.path = path
+                self.isolated = True
+                break
+        if self.isolated:
+            tracing.instant("workspace", cat="workspace", path=self.path, **self.counts)
+        else:
+            tracing.instant("workspace unavailable", cat="workspace", submission=self.submission_dir)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "Workspace":
+        """미션 설정의 submission_dir / execution.workspace_root로 작업 사본 생성"""
+        execution = config.get("execution") or {}
+        return cls(config.get("submission_dir", ""), root=execution.get("workspace_root"))
+
+    def file(self, *parts: str) -> str:
+        """작업 사본 안의 경로 (예: workspace.file("cli.py"))"""
+        return os.path.join(self.path, *parts)
+
+    def close(self) -> None:
+        """작업 사본 삭제 (학생 프로그램이 쓴 파일 포함)"""
+        self._discard_base()
+        self.path = self.submission_dir
+        self.isolated = False
+
+    def _discard_base(self) -> None:
+        if self._base is not None:
+            shutil.rmtree(self._base, ignore_errors=True)
+            self._base = None
+
+
+def _roots(root: Optional[str]):
+    """작업 사본을 만들어 볼 디렉토리 (앞의 것이 실패하면 다음 것)"""
+    if root:
+        yield root
+    elif os.path.isdir(_TMPFS_ROOT) and os.access(_TMPFS_ROOT, os.W_OK):
+        yield _TMPFS_ROOT
+    yield tempfile.gettempdir()
+
+
+def _clone_tree(source: str, target: str, device: int, counts: Dict[str, int]) -> None:
+    """source 트리를 target에 재현 (디렉토리 생성 + 파일 reflink/hardlink/복사, 심볼릭 링크는 그대로)"""
+    os.mkdir(target)
+    same_device = os.stat(target).st_dev == device
+    with os.scandir(source) as entries:
+        for entry in entries:
+            destination = os.path.join(target, entry.name)
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), destination)
+            elif entry.is_dir():
+                if entry.name not in _SKIP_DIRS:
+                    _clone_tree(entry.path, destination, device, counts)
+            elif entry.is_file():
+                counts[_clone_file(entry.path, destination, same_device)] += 1
+    shutil.copystat(source, target)
+
+
+def _clone_file(source: str, target: str, same_device: bool) -> str:
+    """파일 하나 재현 → 사용한 방법"""
+    if same_device:
+        if _reflink(source, target):
+            return "reflink"
+        if os.path.splitext(source)[1] in _LINK_SUFFIXES:
+            try:
+                os.link(source, target)
+                return "hardlink"
+            except OSError:
+                pass
+    shutil.copy2(source, target)
+    return "copy"
+
+
+def _reflink(source: str, target: str) -> bool:
+    """FICLONE으로 블록 공유 사본 생성 (지원하지 않는 파일 시스템이면 False)"""
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(source, target)
+    return True
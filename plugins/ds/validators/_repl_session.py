@@ -0,0 +1,525 @@
+"""
+mini-redis REPL 세션 공유
+
+제출물 하나의 cli.py를 대화형 프로세스 하나로 띄워 여러 검증기의 시나리오를 이어서 실행하고,
+시나리오별 응답만 잘라서 돌려준다. 빈 키 공간이 필요한 시나리오(fresh)나 세션 상태를
+바꾸는 시나리오(isolated)만 새 프로세스에서 실행하므로 제출물당 cli.py 실행이 1~2회로 줄어든다.
+
+검증기는 repl_scenarios 클래스 속성으로 시나리오를 선언하고 run_scenario()로 응답을 받는다.
+
+execution.virtual_clock이 true(기본)이면 cli.py를 가상 시계(_virtual_clock.py) 아래에서 실행하여
+시나리오의 대기 단계를 실제로 기다리지 않고 시계만 앞당긴다. 앞당긴 뒤 학생 코드가 그 시계를
+읽지 않았으면(datetime 사용 등) 해당 시나리오만 실제 대기로 다시 실행한다.
+
+cli.py 프로세스마다 제출물의 작업 사본(core.workspace)을 작업 디렉토리로 쓰므로 학생 코드가 저장한
+파일(스냅샷 등)은 다음 프로세스에 남지 않는다 (fresh 시나리오는 빈 키 공간에서 시작).
+
+stdout은 읽는 대로 ResponseParser로 응답을 추출하고 전체 출력을 보관하지 않는다. 시나리오 하나의 출력이
+SCENARIO_OUTPUT_LIMIT를 넘으면(반복 출력 등) 프로세스를 종료하고 그 시나리오를 실패(None)로 처리한다.
+"""
+import asyncio
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from core import tracing
+from core.base_validator import BaseValidator
+from core.process_runner import InteractiveProcess
+from core.process_supervisor import ProcessLimits
+from core.submission_health import note_startup_error
+from core.submission_scope import current_scope
+from core.workspace import Workspace
+
+PROMPT = "mini-redis>"
+
+# 프롬프트가 처음 나올 때까지 기다리는 시간 (초)
+STARTUP_TIMEOUT = 5
+# 시나리오 하나의 응답을 기다리는 시간 (초, 대기 단계 제외)
+SCENARIO_TIMEOUT = 10
+# 시나리오 하나(시작 시에는 첫 프롬프트까지)에서 읽는 출력 최대 크기 (문자)
+SCENARIO_OUTPUT_LIMIT = 256 * 1024
+
+_SCOPE_KEY = "ds.repl_session"
+_CLOCK_SCRIPT = str(Path(__file__).with_name("_virtual_clock.py"))
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    REPL 시나리오
+
+    Attributes:
+        name: 시나리오 이름 (제출물 안에서 고유)
+        steps: 명령어(str)와 대기 시간(float, 초)의 나열. 대기 전에 앞선 명령의 응답을 모두 받는다.
+            가상 시계를 쓰면 대기 대신 학생 프로세스의 시계를 앞당긴다.
+        fresh: 빈 키 공간(새로 시작한 프로세스)이 필요하면 True (예: DBSIZE 절대값 검사)
+        isolated: 실행 후 세션 상태를 다른 시나리오가 쓸 수 없으면 True (예: CONFIG SET maxmemory)
+    """
+    name: str
+    steps: Tuple[Union[str, float], ...]
+    fresh: bool = False
+    isolated: bool = False
+
+
+async def run_scenario(validator: BaseValidator, scenario: Scenario) -> Optional[List[str]]:
+    """
+    시나리오 응답 리스트 (실행 실패/프롬프트 없음/타임아웃 시 None)
+
+    Grader 안에서는 같은 제출물의 검증기끼리 세션을 공유하고,
+    검증기를 직접 실행하면 그 검증기의 시나리오만으로 세션을 만든다.
+
+    Example:
+        responses = await run_scenario(self, LRU_SCENARIO)
+    """
+    return await _session_for(validator).run(scenario)
+
+
+def _session_for(validator: BaseValidator) -> "ReplSessionManager":
+    config = validator.config
+    execution = config.get("execution") or {}
+    virtual_clock = execution.get("virtual_clock", True)
+    limits = ProcessLimits.from_config(config)
+    workspace_root = execution.get("workspace_root")
+    scope = current_scope()
+    if scope is not None:
+        return scope.get(_SCOPE_KEY, lambda: ReplSessionManager(
+            config.get("submission_dir", ""), _configured_scenarios(config), virtual_clock, limits, workspace_root
+        ))
+
+    session = getattr(validator, "_repl_session", None)
+    if session is None:
+        session = ReplSessionManager(config.get("submission_dir", ""),
+                                     getattr(validator, "repl_scenarios", ()), virtual_clock, limits,
+                                     workspace_root)
+        validator._repl_session = session
+    return session
+
+
+def _configured_scenarios(config: Dict[str, Any]) -> List[Scenario]:
+    """미션 설정에 등록된 검증기들이 선언한 시나리오 (설정 순서)"""
+    from core.grader import load_validator_class
+
+    scenarios = []
+    for validator_config in config.get("validators", []):
+        validator_class = load_validator_class(validator_config["module"], validator_config["class"])
+        scenarios.extend(getattr(validator_class, "repl_scenarios", ()))
+    return scenarios
+
+
+class ReplSessionManager:
+    """
+    제출물 하나의 cli.py 세션 관리
+
+    처음 시나리오를 요청받으면 선언된 시나리오 전체를 세션 단위로 나눠 실행을 시작하고,
+    시나리오가 끝나는 대로 응답을 돌려준다. 세션끼리는 동시에 실행된다.
+    세션 도중 프로세스가 종료/타임아웃되면 남은 시나리오는 새 프로세스에서 이어서 실행한다.
+    """
+
+    def __init__(self, submission_dir: str, scenarios: Sequence[Scenario],
+                 virtual_clock: bool = True, limits: Optional[ProcessLimits] = None,
+                 workspace_root: Optional[str] = None):
+        self.submission_dir = submission_dir
+        self.cli_path = Path(submission_dir) / "cli.py"
+        self.virtual_clock = virtual_clock
+        self.limits = limits
+        self.workspace_root = workspace_root
+        self._scenarios = list(scenarios)
+        self._results: Dict[str, "asyncio.Future"] = {}
+        self._task: Optional["asyncio.Task"] = None
+
+    async def run(self, scenario: Scenario) -> Optional[List[str]]:
+        """시나리오 응답 리스트 (실행 실패/프롬프트 없음/타임아웃 시 None)"""
+        if self._task is None:
+            loop = asyncio.get_running_loop()
+            self._results = {s.name: loop.create_future() for s in self._scenarios}
+            self._task = asyncio.ensure_future(self._run_sessions(plan_sessions(self._scenarios)))
+        if scenario.name not in self._results:
+            # 선언되지 않은 시나리오는 단독 세션으로 실행
+            self._results[scenario.name] = asyncio.get_running_loop().create_future()
+            asyncio.ensure_future(self._run_session([scenario]))
+        # 한 검증기가 취소되어도 다른 검증기가 기다리는 세션은 계속 실행
+        return await asyncio.shield(self._results[scenario.name])
+
+    async def aclose(self) -> None:
+        """세션 종료 대기 (decide-only 취소 등으로 남은 시나리오가 있으면 중단)"""
+        if self._task is None:
+            return
+        if not all(future.done() for future in self._results.values()):
+            self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run_sessions(self, sessions: List[List[Scenario]]) -> None:
+        await asyncio.gather(*(self._run_session(session) for session in sessions))
+
+    async def _run_session(self, scenarios: List[Scenario]) -> None:
+        pending = list(scenarios)
+        try:
+            while pending:
+                session = await self._start()
+                if session is None:
+                    # 실행 실패/프롬프트 없음: 새 프로세스로도 같은 결과이므로 남은 시나리오 모두 실패
+                    break
+                try:
+                    while pending:
+                        scenario = pending.pop(0)
+                        responses, alive, honored = await _play(session, scenario, session.clock)
+                        if alive and not honored:
+                            # 학생 코드가 가상 시계를 읽지 않음: 실제 대기로 다시 실행
+                            tracing.instant("real sleep fallback", cat="clock", scenario=scenario.name)
+                            responses, alive, _ = await _play(session, scenario, None)
+                        self._resolve(scenario, responses)
+                        if not alive:
+                            break
+                finally:
+                    await session.close()
+        finally:
+            for scenario in pending:
+                self._resolve(scenario, None)
+
+    async def _start(self) -> Optional["_SessionProcess"]:
+        """cli.py 실행 후 첫 프롬프트까지 대기 (실패 시 None)"""
+        if not self.cli_path.is_file():
+            return None
+
+        workspace = Workspace(self.submission_dir, root=self.workspace_root)
+        cli_path = workspace.file(self.cli_path.name)
+        if self.virtual_clock:
+            clock = VirtualClock()
+            process = await InteractiveProcess.start(
+                [sys.executable, "-u", _CLOCK_SCRIPT, cli_path],
+                cwd=workspace.path, capture_stderr=False,
+                env=clock.child_env(), pass_fds=clock.child_fds, limits=self.limits,
+            )
+            clock.detach_child()
+        else:
+            clock = None
+            process = await InteractiveProcess.start([sys.executable, "-u", cli_path],
+                                                     cwd=workspace.path, capture_stderr=False,
+                                                     limits=self.limits)
+
+        parser = ResponseParser(SCENARIO_OUTPUT_LIMIT)
+        if process is None or not await _read_prompts(process, parser, 1, STARTUP_TIMEOUT):
+            if process is not None:
+                exited = process.at_eof
+                await process.kill()
+                if exited:
+                    # 첫 프롬프트 전에 종료 (import 오류 등): 다시 실행해도 같은 결과
+                    note_startup_error(self.cli_path.name, f"첫 프롬프트 전에 종료 (returncode {process.returncode})")
+            if clock is not None:
+                clock.close()
+            workspace.close()
+            return None
+        return _SessionProcess(process, parser, clock, workspace)
+
+    def _resolve(self, scenario: Scenario, responses: Optional[List[str]]) -> None:
+        future = self._results.get(scenario.name)
+        if future is not None and not future.done():
+            future.set_result(responses)
+
+
+def plan_sessions(scenarios: Sequence[Scenario]) -> List[List[Scenario]]:
+    """
+    시나리오를 세션(프로세스)별로 배치
+
+    fresh 시나리오는 아직 아무것도 실행하지 않은 세션에, 나머지는 isolated 시나리오가
+    실행되지 않은 첫 세션에 순서대로 붙인다 (fresh 시나리오를 먼저 배치).
+    """
+    sessions: List[List[Scenario]] = []
+    tainted: List[bool] = []
+    ordered = [s for s in scenarios if s.fresh] + [s for s in scenarios if not s.fresh]
+    for scenario in ordered:
+        if scenario.fresh:
+            candidates = [i for i, session in enumerate(sessions) if not session]
+        else:
+            candidates = [i for i in range(len(sessions)) if not tainted[i]]
+        if candidates:
+            index = candidates[0]
+        else:
+            sessions.append([])
+            tainted.append(False)
+            index = len(sessions) - 1
+        sessions[index].append(scenario)
+        tainted[index] = tainted[index] or scenario.isolated
+    return sessions
+
+
+class VirtualClock:
+    """
+    학생 프로세스 가상 시계의 채점기 쪽 제어 채널 (_virtual_clock.py 참고)
+
+    Example:
+        clock = VirtualClock()
+        process = await InteractiveProcess.start([...], env=clock.child_env(), pass_fds=clock.child_fds)
+        clock.detach_child()
+        clock.advance(2.0)   # 이후 학생 프로세스의 time.time()이 2초 앞당겨짐
+    """
+
+    def __init__(self):
+        self._control_r, self._control_w = os.pipe()
+        self._ack_r, self._ack_w = os.pipe()
+        os.set_blocking(self._ack_r, False)
+        self._advanced = False
+
+    @property
+    def child_fds(self) -> Tuple[int, int]:
+        return (self._control_r, self._ack_w)
+
+    def child_env(self) -> Dict[str, str]:
+        return {**os.environ, "GRADER_CLOCK_FDS": f"{self._control_r},{self._ack_w}"}
+
+    def detach_child(self) -> None:
+        """자식 프로세스에 넘긴 파이프 끝 닫기 (시작 직후 호출)"""
+        for fd in self.child_fds:
+            os.close(fd)
+        self._control_r = self._ack_w = -1
+
+    def advance(self, seconds: float) -> None:
+        """시계를 seconds만큼 앞당김 (이전 확인 신호는 버림)"""
+        self._read_acks()
+        try:
+            os.write(self._control_w, f"{seconds}\n".encode())
+            self._advanced = True
+        except OSError:
+            pass
+
+    def honored(self) -> bool:
+        """마지막 앞당김 이후 학생 코드가 가상 시계를 읽었는지 (앞당긴 적이 없으면 True)"""
+        if not self._advanced:
+            return True
+        self._advanced = False
+        return self._read_acks()
+
+    def close(self) -> None:
+        for fd in (self._control_r, self._control_w, self._ack_r, self._ack_w):
+            if fd >= 0:
+                os.close(fd)
+        self._control_r = self._control_w = self._ack_r = self._ack_w = -1
+
+    def _read_acks(self) -> bool:
+        received = False
+        while True:
+            try:
+                data = os.read(self._ack_r, 4096)
+            except BlockingIOError:
+                return received
+            if not data:
+                return received
+            received = True
+
+
+@dataclass
+class _SessionProcess:
+    """세션에서 실행 중인 cli.py 하나 (프로세스 + 출력 파서 + 가상 시계 + 작업 사본)"""
+    process: InteractiveProcess
+    parser: "ResponseParser"
+    clock: Optional[VirtualClock]
+    workspace: Workspace
+
+    async def close(self) -> None:
+        await self.process.close("exit\n")
+        if self.clock is not None:
+            self.clock.close()
+        self.workspace.close()
+
+
+async def _play(session: _SessionProcess, scenario: Scenario,
+                clock: Optional[VirtualClock]) -> Tuple[Optional[List[str]], bool, bool]:
+    """
+    세션에서 시나리오 실행 → (응답 리스트, 세션을 계속 쓸 수 있는지, 가상 시계가 반영되었는지)
+
+    명령마다 프롬프트가 하나씩 다시 출력되는 것으로 응답 경계를 판단한다.
+    clock이 있으면 대기 단계에서 실제로 기다리지 않고 시계를 앞당긴다.
+    응답을 기다리다 타임아웃되거나 출력 한도를 넘으면 응답 리스트는 None이다
+    (시나리오 실패 — 받은 일부 응답으로 채점하지 않음).
+    프로세스가 중간에 종료하면 그때까지의 응답을 돌려준다 (한 번에 입력하던 실행과 같음).
+    """
+    process, parser = session.process, session.parser
+    # 응답은 직전 프롬프트부터 (이전 시나리오의 출력은 버림)
+    parser.restart()
+    expected = parser.prompts
+    budget = float(SCENARIO_TIMEOUT)
+    alive = True
+
+    for step in scenario.steps + (None,):
+        if isinstance(step, str):
+            if not await process.send(step + "\n"):
+                alive = False
+                break
+            expected += 1
+            continue
+
+        # 대기 단계 또는 시나리오 끝: 앞선 명령의 응답을 모두 받음
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        if not await _read_prompts(process, parser, expected, budget):
+            if parser.overflowed or process.output_limited or not process.at_eof:
+                # 출력 한도 초과 또는 타임아웃 (프로세스가 아직 응답 중)
+                return None, False, clock is None or clock.honored()
+            alive = False
+            break
+        budget -= loop.time() - started
+        if step is None:
+            pass
+        elif clock is not None:
+            clock.advance(step)
+        else:
+            await asyncio.sleep(step)
+
+    honored = clock is None or clock.honored()
+    return parser.result(), alive, honored
+
+
+async def _read_prompts(process: InteractiveProcess, parser: "ResponseParser",
+                        target: int, timeout: float) -> bool:
+    """
+    프롬프트가 모두 target개 출력될 때까지 stdout을 읽어 parser에 넣음
+
+    Returns:
+        성공 여부 (False: 출력 종료, 타임아웃, 출력 한도 초과 — 한도를 넘으면 프로세스를 종료함)
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while parser.prompts < target:
+        text = await process.read(deadline - loop.time())
+        if not text:
+            return False
+        parser.feed(text)
+        if parser.overflowed:
+            tracing.instant("scenario output limit", cat="process", limit=parser.limit)
+            await process.kill()
+            return False
+    return True
+
+
+class ResponseParser:
+    """
+    REPL stdout에서 응답을 점진적으로 추출 (parse_responses()의 스트리밍 버전)
+
+    출력 조각을 feed()로 받아 줄 단위로 처리하고, 완성된 응답과 아직 끝나지 않은 마지막 줄만 보관한다.
+    응답 하나는 프롬프트부터 다음 프롬프트 전까지이며 다음 프롬프트가 출력되는 즉시 responses에 추가된다.
+    restart() 이후 받은 출력이 limit(문자)를 넘으면 overflowed가 되고 이후 출력은 버린다.
+
+    Example:
+        parser = ResponseParser(limit=256 * 1024)
+        parser.feed("mini-redis> ")
+        parser.feed("OK\nmini-redis> ")
+        parser.prompts      # 2
+        parser.result()     # ["OK"]
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        # 완성된 줄에 있던 프롬프트 수
+        self._completed_prompts = 0
+        # 완성된 응답 (restart() 이후)
+        self.responses: List[str] = []
+        self.overflowed = False
+        # 진행 중인 응답의 줄 (프롬프트 뒤 텍스트 + 이어지는 줄)
+        self._lines: List[str] = []
+        # 진행 중인 응답을 시작한 프롬프트 줄의 마지막 프롬프트 뒤 텍스트 (restart()용)
+        self._head: Optional[str] = None
+        self._head_lines = 0
+        # 아직 줄바꿈이 오지 않은 마지막 줄
+        self._partial = ""
+        # 마지막 줄에 프롬프트가 있어 이전 응답을 이미 완성했는지
+        self._partial_flushed = False
+        self._received = 0
+
+    def feed(self, text: str) -> List[str]:
+        """출력 조각 추가 → 이번에 완성된 응답"""
+        if self.overflowed:
+            return []
+        self._received += len(text)
+        if self.limit is not None and self._received > self.limit:
+            self.overflowed = True
+            return []
+        completed = len(self.responses)
+        *lines, partial = (self._partial + text).split("\n")
+        for line in lines:
+            self._completed_prompts += line.count(PROMPT)
+            self._line(line)
+        self._partial = partial
+        if PROMPT in partial and not self._partial_flushed:
+            # 프롬프트가 나오면 앞 응답은 끝난 것 (줄이 끝나기를 기다리지 않음)
+            self._flush()
+            self._partial_flushed = True
+        return self.responses[completed:]
+
+    @property
+    def prompts(self) -> int:
+        """지금까지 출력된 프롬프트 수"""
+        return self._completed_prompts + self._partial.count(PROMPT)
+
+    def restart(self) -> None:
+        """
+        응답 수집을 마지막 프롬프트부터 다시 시작 (시나리오 시작 시)
+
+        이전 응답과 마지막 프롬프트 앞의 출력은 버리고, 보관한 출력 크기도 다시 센다.
+        """
+        self.responses = []
+        self.overflowed = False
+        self._received = 0
+        index = self._partial.rfind(PROMPT)
+        if index >= 0:
+            self._completed_prompts += self._partial[:index].count(PROMPT)
+            self._partial = self._partial[index:]
+            self._lines = []
+            self._head = None
+        elif self._head is not None:
+            # 마지막 프롬프트가 완성된 줄에 있음: 그 줄의 마지막 프롬프트부터 다시 읽은 것처럼
+            self._lines = ([self._head] if self._head else []) + self._lines[self._head_lines:]
+            self._head_lines = 1 if self._head else 0
+        else:
+            self._lines = []
+
+    def result(self) -> List[str]:
+        """지금까지의 응답 (마지막 줄과 진행 중인 응답 포함, 상태는 바꾸지 않음)"""
+        responses = list(self.responses)
+        lines = list(self._lines)
+        if PROMPT in self._partial:
+            if lines and not self._partial_flushed:
+                responses.append("\n".join(lines))
+                lines = []
+            after_prompt = self._partial.split(PROMPT, 1)[1].strip()
+            if after_prompt:
+                lines.append(after_prompt)
+        elif self._partial.strip():
+            lines.append(self._partial.strip())
+        if lines:
+            responses.append("\n".join(lines))
+        return responses
+
+    def _line(self, line: str) -> None:
+        if PROMPT in line:
+            if not self._partial_flushed:
+                self._flush()
+            # 프롬프트 이후 텍스트 추출
+            after_prompt = line.split(PROMPT, 1)[1].strip()
+            if after_prompt:
+                self._lines.append(after_prompt)
+            self._head = line.rsplit(PROMPT, 1)[1].strip()
+            self._head_lines = len(self._lines)
+        elif line.strip():
+            # 프롬프트 없는 줄 (멀티라인 응답의 일부)
+            self._lines.append(line.strip())
+        self._partial_flushed = False
+
+    def _flush(self) -> None:
+        if self._lines:
+            self.responses.append("\n".join(self._lines))
+            self._lines = []
+        self._head = None
+
+
+def parse_responses(stdout: str) -> List[str]:
+    """REPL stdout에서 프롬프트를 제거하고 응답만 추출
+
+    "mini-redis> OK" → "OK"
+    "mini-redis> \"Alice\"" → "\"Alice\""
+    여러 줄 응답(INFO memory 등)은 하나로 합침
+    """
+    parser = ResponseParser()
+    parser.feed(stdout)
+    return parser.result()
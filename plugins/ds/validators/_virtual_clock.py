@@ -0,0 +1,74 @@
+"""
+가상 시계 부트스트랩 (학생 cli.py 실행용)
+
+    python -u _virtual_clock.py cli.py
+
+time.time/time.monotonic(및 _ns 버전)을 채점기가 앞당길 수 있는 시계로 바꾼 뒤 cli.py를
+__main__으로 실행한다. 채점기는 GRADER_CLOCK_FDS="제어 fd,확인 fd"로 파이프 두 개를 넘긴다.
+
+- 제어 파이프: 채점기가 "초\\n"을 쓰면 이후 시계가 그만큼 앞당겨짐
+- 확인 파이프: 앞당긴 뒤 학생 코드가 시계를 처음 읽으면 1바이트를 씀
+  (채점기는 확인이 없으면 학생 코드가 이 시계를 쓰지 않는 것으로 보고 실제 대기로 다시 검사)
+
+채점 코드(core 등)를 import하지 않는 독립 스크립트이다.
+"""
+import os
+import runpy
+import sys
+import threading
+import time
+
+_real_time = time.time
+_real_time_ns = time.time_ns
+_real_monotonic = time.monotonic
+_real_monotonic_ns = time.monotonic_ns
+
+_lock = threading.Lock()
+_offset_ns = 0
+_unacked = False
+
+
+def _install(control_fd: int, ack_fd: int) -> None:
+    os.set_blocking(control_fd, False)
+
+    def offset_ns() -> int:
+        """제어 파이프에 쌓인 앞당김을 반영한 오프셋 (나노초)"""
+        global _offset_ns, _unacked
+        with _lock:
+            try:
+                data = os.read(control_fd, 4096)
+            except BlockingIOError:
+                data = b""
+            for line in data.split(b"\n"):
+                if line.strip():
+                    _offset_ns += int(float(line) * 1e9)
+                    _unacked = True
+            if _unacked:
+                _unacked = False
+                try:
+                    os.write(ack_fd, b".")
+                except OSError:
+                    pass
+            return _offset_ns
+
+    time.time = lambda: _real_time() + offset_ns() / 1e9
+    time.time_ns = lambda: _real_time_ns() + offset_ns()
+    time.monotonic = lambda: _real_monotonic() + offset_ns() / 1e9
+    time.monotonic_ns = lambda: _real_monotonic_ns() + offset_ns()
+
+
+def main() -> None:
+    script = os.path.abspath(sys.argv[1])
+    fds = os.environ.pop("GRADER_CLOCK_FDS", "")
+    if fds:
+        control_fd, ack_fd = (int(fd) for fd in fds.split(","))
+        _install(control_fd, ack_fd)
+
+    # python cli.py로 실행한 것과 같은 sys.argv/sys.path
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(script)
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,57 @@
 """
 LRU 동작 검증 플러그인 (30점)
 
-subprocess.run + stdin pipe로 LRU 제거, GET 접근 시 LRU 갱신,
+제출물 공유 REPL 세션(_repl_session)에서 LRU 제거, GET 접근 시 LRU 갱신,
 INFO memory 통계를 검증.
 
 AI 트랩: GET 시 LRU 순서 미갱신
 """
 import os
-import subprocess
-import sys
 from typing import Dict, Any, Optional, List
 
-from core.base_validator import BaseValidator
+from core.async_validator import AsyncBaseValidator
 from core.check_item import CheckItem
-
-
-class LRUValidator(BaseValidator):
+from core.source_check import entry_compiles
+from ._repl_session import Scenario, run_scenario
+
+# LRU GET 갱신 핵심 테스트 시나리오
+# (빈 키 공간 필요, maxmemory 설정이 남으므로 이후 다른 시나리오와 세션을 공유하지 않음)
+LRU_SCENARIO = Scenario("lru.eviction", (
+    "CONFIG SET maxmemory 3",
+    "SET k1 v1",
+    "SET k2 v2",
+    "SET k3 v3",
+    "GET k1",
+    "SET k4 v4",
+    "GET k2",
+    "GET k1",
+    "GET k4",
+    "INFO memory",
+    "DBSIZE",
+), fresh=True, isolated=True)
+
+
+class LRUValidator(AsyncBaseValidator):
     """LRU 동작 검증 (maxmemory, 제거, GET 갱신, INFO memory)"""
 
+    # cli.py와 cli.py가 import하는 모듈
+    input_files = ["**/*.py"]
+    repl_scenarios = (LRU_SCENARIO,)
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.cli_path: Optional[str] = None
         self._lru_responses: Optional[List[str]] = None
 
-    def setup(self) -> None:
+    async def setup_async(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
-
-        # LRU GET 갱신 핵심 테스트 시나리오
-        commands = (
-            "CONFIG SET maxmemory 3\n"
-            "SET k1 v1\n"
-            "SET k2 v2\n"
-            "SET k3 v3\n"
-            "GET k1\n"
-            "SET k4 v4\n"
-            "GET k2\n"
-            "GET k1\n"
-            "GET k4\n"
-            "INFO memory\n"
-            "DBSIZE\n"
-            "exit\n"
-        )
-        self._lru_responses = self._run_repl(commands)
+        # 정적 게이트: 컴파일되지 않는 cli.py는 실행하지 않음 (시나리오 전체 즉시 실패)
+        if entry_compiles(self.submission_dir, "cli.py"):
+            self.cli_path = os.path.join(self.submission_dir, "cli.py")
+
+        if self.cli_path:
+            self._lru_responses = await run_scenario(self, LRU_SCENARIO)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -81,28 +87,6 @@ class LRUValidator(BaseValidator):
             hint="INFO memory 출력에 used_memory:N, maxmemory:N, evicted_keys:N 포함",
         ))
 
-    def teardown(self) -> None:
-        pass
-
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 실행하고 응답 리스트를 반환"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return _parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
     # -- 검증 함수 --
 
     def _check_config_maxmemory(self) -> bool:
@@ -162,26 +146,3 @@ class LRUValidator(BaseValidator):
 
         return has_used and has_max and has_evicted
 
-
-def _parse_responses(stdout: str) -> List[str]:
-    """REPL stdout에서 프롬프트를 제거하고 응답만 추출"""
-    responses = []
-    lines = stdout.split("\n")
-    current_response_lines = []
-
-    for line in lines:
-        if "mini-redis>" in line:
-            if current_response_lines:
-                responses.append("\n".join(current_response_lines))
-                current_response_lines = []
-
-            after_prompt = line.split("mini-redis>", 1)[1].strip()
-            if after_prompt:
-                current_response_lines.append(after_prompt)
-        elif line.strip():
-            current_response_lines.append(line.strip())
-
-    if current_response_lines:
-        responses.append("\n".join(current_response_lines))
-
-    return responses
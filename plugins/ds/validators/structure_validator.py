@@ -6,29 +6,28 @@ OrderedDict/deque/functools.lru_cache를 사용하지 않았는지 검증.
 
 AI 트랩: OrderedDict/deque 사용
 """
-import ast
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
-from plugins.python.validators._helpers import (
-    collect_py_files,
-    parse_all_files,
-)
+from plugins.python.validators._ast_facts import FactTable
+from plugins.python.validators._source_index import submission_index
 
 
 class StructureValidator(BaseValidator):
     """LRU 캐시 코드 구조 검증 (Node 클래스, 금지 import, 연결 리스트 메서드)"""
 
+    # Node/연결 리스트 구조를 모든 .py 파일에서 탐색
+    input_files = ["**/*.py"]
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[FactTable] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
+        self.facts = submission_index(self.submission_dir, config=self.config).facts()
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -62,62 +61,28 @@ class StructureValidator(BaseValidator):
     # -- 검증 함수 --
 
     def _check_node_class(self) -> bool:
-        """AST에서 Node 클래스의 __init__에 prev/next/key/value 할당 확인"""
+        """Node 클래스의 __init__에 prev/next/key/value 할당(self.attr = ... / self.attr: type = ...) 확인"""
         required_attrs = {"prev", "next", "key", "value"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not (isinstance(node, ast.ClassDef) and node.name == "Node"):
-                    continue
-
-                # __init__ 메서드 찾기
-                found_attrs = set()
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef) and item.name == "__init__":
-                        for stmt in ast.walk(item):
-                            # self.attr = ... 패턴 탐색
-                            if isinstance(stmt, ast.Assign):
-                                for target in stmt.targets:
-                                    if (isinstance(target, ast.Attribute)
-                                            and isinstance(target.value, ast.Name)
-                                            and target.value.id == "self"):
-                                        found_attrs.add(target.attr)
-                            # self.attr: type = ... (AnnAssign)
-                            if isinstance(stmt, ast.AnnAssign):
-                                if (isinstance(stmt.target, ast.Attribute)
-                                        and isinstance(stmt.target.value, ast.Name)
-                                        and stmt.target.value.id == "self"):
-                                    found_attrs.add(stmt.target.attr)
-
-                if required_attrs.issubset(found_attrs):
-                    return True
-
-        return False
+        return any(
+            cls.name == "Node" and required_attrs.issubset(cls.init_attrs)
+            for cls in self.facts.classes
+        )
 
     def _check_no_builtin_cache(self) -> bool:
-        """AST에서 OrderedDict/deque/functools.lru_cache import 탐지"""
+        """OrderedDict/deque/functools.lru_cache import 탐지"""
         forbidden_names = {"OrderedDict", "deque", "lru_cache"}
         forbidden_modules = {"collections", "functools"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                # import collections / import functools
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name in forbidden_modules:
-                            return False
-
-                # from collections import OrderedDict / from collections import deque
-                if isinstance(node, ast.ImportFrom):
-                    if node.module in forbidden_modules:
-                        for alias in node.names:
-                            if alias.name in forbidden_names:
-                                return False
-                    # from functools import lru_cache
-                    if node.module == "functools":
-                        for alias in node.names:
-                            if alias.name == "lru_cache":
-                                return False
+        for imp in self.facts.imports:
+            if imp.module not in forbidden_modules:
+                continue
+            # import collections / import functools
+            if imp.name is None:
+                return False
+            # from collections import OrderedDict, deque / from functools import lru_cache
+            if imp.name in forbidden_names:
+                return False
 
         return True
 
@@ -134,13 +99,10 @@ class StructureValidator(BaseValidator):
             "remove_tail", "remove_last", "push_front", "pop_back",
         }
 
-        found_methods = set()
-
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if node.name in linked_list_methods:
-                        found_methods.add(node.name)
+        found_methods = {
+            func.name for func in self.facts.functions
+            if not func.is_async and func.name in linked_list_methods
+        }
 
         # 최소 2개 이상의 연결 리스트 메서드가 있어야 함
         return len(found_methods) >= 2
@@ -1,24 +1,55 @@
 """
 TTL 검증 플러그인 (20점)
 
-subprocess.Popen + time.sleep로 TTL 만료, lazy deletion,
+제출물 공유 REPL 세션(_repl_session)에서 TTL 만료, lazy deletion,
 미존재/미설정 키의 TTL 반환값을 검증.
 
 AI 트랩: 만료 키 lazy deletion 미구현
 """
+import asyncio
 import os
-import subprocess
-import sys
-import time
 from typing import Dict, Any, Optional, List
 
-from core.base_validator import BaseValidator
+from core.async_validator import AsyncBaseValidator
 from core.check_item import CheckItem
-
-
-class TTLValidator(BaseValidator):
+from core.source_check import entry_compiles
+from ._repl_session import Scenario, run_scenario
+
+# Phase 1: EXPIRE/TTL 기본
+BASIC_SCENARIO = Scenario("ttl.basic", (
+    "SET session abc",
+    "EXPIRE session 100",
+    "TTL session",
+))
+
+# Phase 2: Lazy deletion (EXPIRE 1초 → 2초 대기 → GET)
+# DBSIZE는 대기 전후 차이로 검사하므로 다른 시나리오가 남긴 키가 있어도 됨
+LAZY_SCENARIO = Scenario("ttl.lazy_deletion", (
+    "SET temp val",
+    "EXPIRE temp 1",
+    "DBSIZE",
+    2.0,
+    "GET temp",
+    "DBSIZE",
+))
+
+# Phase 3: 미존재/미설정 키
+EDGE_SCENARIO = Scenario("ttl.edge", (
+    "TTL nonexist",
+    "SET noexpire val",
+    "TTL noexpire",
+))
+
+
+class TTLValidator(AsyncBaseValidator):
     """TTL 동작 검증 (EXPIRE/TTL 기본, lazy deletion, 미존재/미설정 키)"""
 
+    # cli.py와 cli.py가 import하는 모듈
+    input_files = ["**/*.py"]
+    repl_scenarios = (BASIC_SCENARIO, LAZY_SCENARIO, EDGE_SCENARIO)
+    # 가상 시계를 쓰지 않는 제출물은 Phase 2에서 실제로 2초 대기
+    sleep_bound = True
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
@@ -30,32 +61,24 @@ class TTLValidator(BaseValidator):
         # Phase 3: 미존재/미설정 키 테스트 결과
         self._edge_responses: Optional[List[str]] = None
 
-    def setup(self) -> None:
+    async def setup_async(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
-        cli_file = os.path.join(self.submission_dir, "cli.py")
-        if os.path.isfile(cli_file):
-            self.cli_path = cli_file
-
-        # Phase 1: EXPIRE/TTL 기본
-        basic_commands = (
-            "SET session abc\n"
-            "EXPIRE session 100\n"
-            "TTL session\n"
-            "exit\n"
-        )
-        self._basic_responses = self._run_repl(basic_commands)
+        # 정적 게이트: 컴파일되지 않는 cli.py는 실행하지 않음 (시나리오 전체 즉시 실패)
+        if entry_compiles(self.submission_dir, "cli.py"):
+            self.cli_path = os.path.join(self.submission_dir, "cli.py")
 
-        # Phase 2: Lazy deletion (Popen + sleep)
-        self._lazy_responses = self._run_lazy_deletion_test()
-
-        # Phase 3: 미존재/미설정 키
-        edge_commands = (
-            "TTL nonexist\n"
-            "SET noexpire val\n"
-            "TTL noexpire\n"
-            "exit\n"
+        if not self.cli_path:
+            return
+
+        (
+            self._basic_responses,
+            self._lazy_responses,
+            self._edge_responses,
+        ) = await asyncio.gather(
+            run_scenario(self, BASIC_SCENARIO),
+            run_scenario(self, LAZY_SCENARIO),
+            run_scenario(self, EDGE_SCENARIO),
         )
-        self._edge_responses = self._run_repl(edge_commands)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -83,69 +106,6 @@ class TTLValidator(BaseValidator):
             hint="TTL: 키 없으면 -2, 키 있지만 TTL 미설정이면 -1",
         ))
 
-    def teardown(self) -> None:
-        pass
-
-    # -- REPL 실행 헬퍼 --
-
-    def _run_repl(self, commands: str, timeout: int = 10) -> Optional[List[str]]:
-        """cli.py REPL을 subprocess.run으로 실행"""
-        if not self.cli_path:
-            return None
-        try:
-            result = subprocess.run(
-                [sys.executable, self.cli_path],
-                input=commands,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-            return _parse_responses(result.stdout)
-        except (subprocess.TimeoutExpired, OSError):
-            return None
-
-    def _run_lazy_deletion_test(self) -> Optional[List[str]]:
-        """Popen으로 REPL 실행 → EXPIRE 1초 설정 → sleep(2) → GET 확인"""
-        if not self.cli_path:
-            return None
-
-        try:
-            proc = subprocess.Popen(
-                [sys.executable, "-u", self.cli_path],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.submission_dir,
-            )
-
-            # Phase 1: SET + EXPIRE 1초
-            proc.stdin.write("SET temp val\n")
-            proc.stdin.write("EXPIRE temp 1\n")
-            proc.stdin.write("DBSIZE\n")
-            proc.stdin.flush()
-
-            # 2초 대기 (TTL 만료)
-            time.sleep(2)
-
-            # Phase 2: 만료 확인
-            proc.stdin.write("GET temp\n")
-            proc.stdin.write("DBSIZE\n")
-            proc.stdin.write("exit\n")
-            proc.stdin.flush()
-
-            stdout, _ = proc.communicate(timeout=5)
-            return _parse_responses(stdout)
-
-        except (subprocess.TimeoutExpired, OSError, BrokenPipeError):
-            try:
-                proc.kill()
-                proc.wait(timeout=2)
-            except Exception:
-                pass
-            return None
-
     # -- 검증 함수 --
 
     def _check_expire_ttl_basic(self) -> bool:
@@ -171,24 +131,28 @@ class TTLValidator(BaseValidator):
         return 90 <= ttl_val <= 100
 
     def _check_ttl_expired_get(self) -> bool:
-        """만료 후 GET temp → (nil), DBSIZE → (integer) 0"""
+        """만료 후 GET temp → (nil), DBSIZE가 만료 전보다 1 감소"""
         if not self._lazy_responses or len(self._lazy_responses) < 5:
             return False
 
         # responses[0] = SET temp val → "OK"
         # responses[1] = EXPIRE temp 1 → "(integer) 1"
-        # responses[2] = DBSIZE → "(integer) 1" (만료 전)
-        # --- sleep(2) ---
+        # responses[2] = DBSIZE → "(integer) N+1" (만료 전)
+        # --- 2초 대기 ---
         # responses[3] = GET temp → "(nil)" (만료!)
-        # responses[4] = DBSIZE → "(integer) 0" (lazy deletion)
+        # responses[4] = DBSIZE → "(integer) N" (lazy deletion)
 
         get_resp = self._lazy_responses[3].strip()
-        dbsize_resp = self._lazy_responses[4].strip()
+        dbsize_before = _extract_integer(self._lazy_responses[2])
+        dbsize_after = _extract_integer(self._lazy_responses[4])
 
         get_nil = "(nil)" in get_resp
-        dbsize_zero = "(integer) 0" in dbsize_resp
+        dbsize_decreased = (
+            dbsize_before is not None and dbsize_after is not None
+            and dbsize_after == dbsize_before - 1
+        )
 
-        return get_nil and dbsize_zero
+        return get_nil and dbsize_decreased
 
     def _check_ttl_nonexistent(self) -> bool:
         """TTL nonexist → (integer) -2, TTL noexpire → (integer) -1"""
@@ -205,30 +169,6 @@ class TTLValidator(BaseValidator):
         return "(integer) -2" in ttl_nonexist and "(integer) -1" in ttl_noexpire
 
 
-def _parse_responses(stdout: str) -> List[str]:
-    """REPL stdout에서 프롬프트를 제거하고 응답만 추출"""
-    responses = []
-    lines = stdout.split("\n")
-    current_response_lines = []
-
-    for line in lines:
-        if "mini-redis>" in line:
-            if current_response_lines:
-                responses.append("\n".join(current_response_lines))
-                current_response_lines = []
-
-            after_prompt = line.split("mini-redis>", 1)[1].strip()
-            if after_prompt:
-                current_response_lines.append(after_prompt)
-        elif line.strip():
-            current_response_lines.append(line.strip())
-
-    if current_response_lines:
-        responses.append("\n".join(current_response_lines))
-
-    return responses
-
-
 def _extract_integer(response: str) -> Optional[int]:
     """'(integer) N' 형식에서 N 추출"""
     response = response.strip()
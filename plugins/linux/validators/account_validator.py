@@ -3,7 +3,7 @@
 """
 import subprocess
 from core.base_validator import BaseValidator
-from core.check_item import CheckItem
+from core.check_item import CheckItem, ConcurrencyClass
 
 
 class AccountValidator(BaseValidator):
@@ -27,7 +27,8 @@ class AccountValidator(BaseValidator):
             description="agent-admin 계정이 존재하는지 확인",
             points=7,
             validator=lambda: self._check_user_exists("agent-admin"),
-            hint="sudo useradd -m -s /bin/bash agent-admin"
+            hint="sudo useradd -m -s /bin/bash agent-admin",
+            concurrency=ConcurrencyClass.PARALLEL
         ))
 
         # 체크 2: agent-dev 계정 존재
@@ -36,7 +37,8 @@ class AccountValidator(BaseValidator):
             description="agent-dev 계정이 존재하는지 확인",
             points=7,
             validator=lambda: self._check_user_exists("agent-dev"),
-            hint="sudo useradd -m -s /bin/bash agent-dev"
+            hint="sudo useradd -m -s /bin/bash agent-dev",
+            concurrency=ConcurrencyClass.PARALLEL
         ))
 
         # 체크 3: agent-admin이 agent-common 그룹에 속함
@@ -45,7 +47,8 @@ class AccountValidator(BaseValidator):
             description="agent-admin이 agent-common 그룹에 속해 있는지 확인",
             points=3,
             validator=lambda: self._check_user_in_group("agent-admin", "agent-common"),
-            hint="sudo usermod -aG agent-common agent-admin"
+            hint="sudo usermod -aG agent-common agent-admin",
+            concurrency=ConcurrencyClass.PARALLEL
         ))
 
         # 체크 4: agent-dev가 agent-common 그룹에 속함
@@ -54,7 +57,8 @@ class AccountValidator(BaseValidator):
             description="agent-dev가 agent-common 그룹에 속해 있는지 확인",
             points=3,
             validator=lambda: self._check_user_in_group("agent-dev", "agent-common"),
-            hint="sudo usermod -aG agent-common agent-dev"
+            hint="sudo usermod -aG agent-common agent-dev",
+            concurrency=ConcurrencyClass.PARALLEL
         ))
 
     def teardown(self) -> None:
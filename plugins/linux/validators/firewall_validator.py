@@ -3,7 +3,7 @@
 """
 import subprocess
 from core.base_validator import BaseValidator
-from core.check_item import CheckItem
+from core.check_item import CheckItem, ConcurrencyClass
 
 
 class FirewallValidator(BaseValidator):
@@ -26,7 +26,8 @@ class FirewallValidator(BaseValidator):
             description="UFW 방화벽이 활성화되어 있는지 확인",
             points=5,
             validator=self._check_ufw_enabled,
-            hint="sudo ufw enable 명령으로 활성화하세요"
+            hint="sudo ufw enable 명령으로 활성화하세요",
+            concurrency=ConcurrencyClass.PARALLEL
         ))
 
         # 체크 2-4: 필수 포트 허용
@@ -42,7 +43,8 @@ class FirewallValidator(BaseValidator):
                 description=description,
                 points=5,
                 validator=lambda p=port: self._check_port_allowed(p),
-                hint=hint
+                hint=hint,
+                concurrency=ConcurrencyClass.PARALLEL
             ))
 
     def teardown(self) -> None:
@@ -9,13 +9,15 @@ AI 트랩: PermitRootLogin prohibit-password 오판, Telnet 포트 미탐지,
 """
 import os
 import re
-import subprocess
 import sys
 import tempfile
 from typing import Dict, Any, Optional
 
+from core import process_supervisor
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.process_supervisor import ProcessLimits
+from core.workspace import Workspace
 
 # ── 트랩 입력 파일 6개 (모듈 레벨 상수) ──
 
@@ -106,19 +108,20 @@ class LinuxAuditorValidator(BaseValidator):
 
         report_path = os.path.join(tmp_path, "report.txt")
 
-        # subprocess로 학생 코드 실행
+        # 학생 코드 실행 (리소스 제한 + 프로세스 그룹 정리, 타임아웃은 process_supervisor가 기록)
+        # 작업 사본에서 실행하여 학생 코드가 만든 파일이 제출물에 남지 않게 함
+        workspace = Workspace.from_config(self.config)
         try:
-            subprocess.run(
-                [sys.executable, script_path,
+            process_supervisor.run(
+                [sys.executable, workspace.file("auditor.py"),
                  "--config-dir", tmp_path,
                  "--output", report_path],
-                capture_output=True,
-                text=True,
                 timeout=10,
-                cwd=self.submission_dir,
+                cwd=workspace.path,
+                limits=ProcessLimits.from_config(self.config),
             )
-        except (subprocess.TimeoutExpired, OSError):
-            pass
+        finally:
+            workspace.close()
 
         # report.txt 읽기
         if os.path.isfile(report_path):
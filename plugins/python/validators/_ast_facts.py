@@ -0,0 +1,251 @@
+"""
+AST 사실(fact) 추출
+
+파일마다 AST를 한 번만 순회하면서 노드 종류별로 등록된 추출기를 호출하여 사실 테이블
+(import, 클래스, 함수, 사용된 이름 등)을 만든다. 정적 검사는 트리를 다시 순회하지 않고
+테이블을 조회한다.
+
+    facts = submission_index(submission_dir).facts()
+    any(f.name == "search_books" and f.has_yield for f in facts.functions)
+
+검증기 전용 사실이 필요하면 모듈 최상위에서 register_fact()로 추출기를 등록한다.
+"""
+import ast
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# 순회 중 스코프로 추적하는 노드 (FactContext.scopes)
+_SCOPE_TYPES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+Extractor = Callable[[ast.AST, "FactContext"], Iterable[Any]]
+
+# 노드 타입 → [(사실 이름, 추출기)]
+_EXTRACTORS: Dict[type, List[Tuple[str, Extractor]]] = defaultdict(list)
+
+
+def register_fact(name: str, node_types: Tuple[type, ...], extract: Extractor) -> None:
+    """
+    사실 추출기 등록
+
+    순회 중 node_types 노드를 만날 때마다 extract(node, context)를 호출하고,
+    반환한 값들을 사실 테이블의 name 목록에 추가한다.
+
+    Args:
+        name: 사실 이름 (FactTable.get(name)으로 조회)
+        node_types: 추출기를 호출할 AST 노드 타입
+        extract: (노드, FactContext) → 사실 목록 (없으면 빈 튜플)
+
+    Example:
+        register_fact("global_calls", (ast.Call,), lambda node, ctx: [] if ctx.scopes else [node])
+    """
+    for node_type in node_types:
+        _EXTRACTORS[node_type].append((name, extract))
+
+
+@dataclass
+class ImportFact:
+    """import 한 건 (import a.b → module="a.b", from a import b → module="a", name="b")"""
+
+    filepath: str
+    module: Optional[str]
+    name: Optional[str] = None
+    level: int = 0
+
+
+@dataclass
+class ClassFact:
+    """
+    클래스 정의
+
+    Attributes:
+        decorators: 데코레이터 이름 (@dataclass(frozen=True) → "dataclass")
+        fields: 클래스 본문에서 annotation된 이름 (isbn: str)
+        init_attrs: 클래스 본문의 __init__에서 할당한 self 속성 (self.prev = None)
+    """
+
+    filepath: str
+    name: str
+    node: ast.ClassDef = field(repr=False)
+    decorators: List[str] = field(default_factory=list)
+    fields: Set[str] = field(default_factory=set)
+    init_attrs: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class FunctionFact:
+    """
+    함수/메서드 정의
+
+    Attributes:
+        annotations: 매개변수 annotation (위치/키워드 전용 매개변수 중 annotation이 있는 것)
+        has_yield: 함수 본문(중첩 함수 포함)에 yield/yield from이 있는지
+    """
+
+    filepath: str
+    name: str
+    node: ast.AST = field(repr=False)
+    is_async: bool = False
+    decorators: List[str] = field(default_factory=list)
+    returns: Optional[ast.expr] = field(default=None, repr=False)
+    annotations: List[ast.expr] = field(default_factory=list, repr=False)
+    has_yield: bool = False
+
+
+class FactContext:
+    """추출기에 전달되는 순회 상태"""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        # 현재 노드를 감싸는 클래스/함수 노드 (바깥쪽부터)
+        self.scopes: List[ast.AST] = []
+        self._bound: Dict[int, Any] = {}
+
+    def bind(self, node: ast.AST, fact: Any) -> None:
+        """스코프 노드에 사실 연결 (안쪽 노드의 추출기가 fact_for()로 갱신)"""
+        self._bound[id(node)] = fact
+
+    def fact_for(self, node: ast.AST) -> Any:
+        return self._bound.get(id(node))
+
+
+class FactTable:
+    """사실 이름별 목록 (여러 파일의 테이블은 merge()로 합침)"""
+
+    def __init__(self):
+        self._facts: Dict[str, List[Any]] = defaultdict(list)
+
+    def add(self, name: str, fact: Any) -> None:
+        self._facts[name].append(fact)
+
+    def get(self, name: str) -> List[Any]:
+        return self._facts.get(name, [])
+
+    def merge(self, other: "FactTable") -> None:
+        for name, facts in other._facts.items():
+            self._facts[name].extend(facts)
+
+    @property
+    def imports(self) -> List[ImportFact]:
+        return self.get("imports")
+
+    @property
+    def classes(self) -> List[ClassFact]:
+        return self.get("classes")
+
+    @property
+    def functions(self) -> List[FunctionFact]:
+        return self.get("functions")
+
+    @property
+    def names(self) -> Set[str]:
+        """사용된 이름 (ast.Name)"""
+        return set(self.get("names"))
+
+    @property
+    def attributes(self) -> Set[str]:
+        """사용된 속성 이름 (ast.Attribute, obj.attr → "attr")"""
+        return set(self.get("attributes"))
+
+
+def extract_facts(tree: ast.AST, filepath: str) -> FactTable:
+    """AST를 한 번 순회하여 사실 테이블 생성 (깊은 트리도 재귀 없이 처리)"""
+    table = FactTable()
+    context = FactContext(filepath)
+    # (노드, 스코프 종료 표시)
+    stack: List[Tuple[ast.AST, bool]] = [(tree, False)]
+    while stack:
+        node, leaving = stack.pop()
+        if leaving:
+            context.scopes.pop()
+            continue
+
+        for name, extract in _EXTRACTORS.get(type(node), ()):
+            for fact in extract(node, context):
+                table.add(name, fact)
+
+        if isinstance(node, _SCOPE_TYPES):
+            context.scopes.append(node)
+            stack.append((node, True))
+        stack.extend((child, False) for child in reversed(list(ast.iter_child_nodes(node))))
+    return table
+
+
+def decorator_name(deco: ast.expr) -> str:
+    """데코레이터 노드에서 이름 추출 (@a.b(...) → "b")"""
+    if isinstance(deco, ast.Name):
+        return deco.id
+    if isinstance(deco, ast.Call):
+        return decorator_name(deco.func)
+    if isinstance(deco, ast.Attribute):
+        return deco.attr
+    return ""
+
+
+# -- 기본 추출기 --
+
+def _imports(node: ast.AST, context: FactContext) -> Iterable[ImportFact]:
+    if isinstance(node, ast.Import):
+        return [ImportFact(context.filepath, alias.name) for alias in node.names]
+    return [ImportFact(context.filepath, node.module, alias.name, node.level) for alias in node.names]
+
+
+def _classes(node: ast.ClassDef, context: FactContext) -> Iterable[ClassFact]:
+    fact = ClassFact(
+        context.filepath, node.name, node,
+        decorators=[decorator_name(deco) for deco in node.decorator_list],
+        fields={
+            item.target.id for item in node.body
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name)
+        },
+    )
+    context.bind(node, fact)
+    return [fact]
+
+
+def _functions(node: ast.AST, context: FactContext) -> Iterable[FunctionFact]:
+    args = node.args.args + node.args.kwonlyargs
+    fact = FunctionFact(
+        context.filepath, node.name, node,
+        is_async=isinstance(node, ast.AsyncFunctionDef),
+        decorators=[decorator_name(deco) for deco in node.decorator_list],
+        returns=node.returns,
+        annotations=[arg.annotation for arg in args if arg.annotation],
+    )
+    context.bind(node, fact)
+    return [fact]
+
+
+def _yields(node: ast.AST, context: FactContext) -> Iterable[Any]:
+    # 감싸는 함수 모두에 표시 (ast.walk(함수)로 찾던 것과 같은 범위)
+    for scope in context.scopes:
+        if isinstance(scope, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            context.fact_for(scope).has_yield = True
+    return ()
+
+
+def _init_attrs(node: ast.AST, context: FactContext) -> Iterable[Any]:
+    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+    attrs = [
+        target.attr for target in targets
+        if isinstance(target, ast.Attribute)
+        and isinstance(target.value, ast.Name)
+        and target.value.id == "self"
+    ]
+    if not attrs:
+        return ()
+    # 클래스 본문에 바로 정의된 __init__ 안의 할당 (중첩 블록 포함)
+    for parent, scope in zip(context.scopes, context.scopes[1:]):
+        if (isinstance(parent, ast.ClassDef) and isinstance(scope, ast.FunctionDef)
+                and scope.name == "__init__" and scope in parent.body):
+            context.fact_for(parent).init_attrs.update(attrs)
+    return ()
+
+
+register_fact("imports", (ast.Import, ast.ImportFrom), _imports)
+register_fact("classes", (ast.ClassDef,), _classes)
+register_fact("functions", (ast.FunctionDef, ast.AsyncFunctionDef), _functions)
+register_fact("yields", (ast.Yield, ast.YieldFrom), _yields)
+register_fact("init_attrs", (ast.Assign, ast.AnnAssign), _init_attrs)
+register_fact("names", (ast.Name,), lambda node, context: (node.id,))
+register_fact("attributes", (ast.Attribute,), lambda node, context: (node.attr,))
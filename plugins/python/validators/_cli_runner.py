@@ -0,0 +1,379 @@
+"""
+학생 cli.py 실행기
+
+`python cli.py ...` 실행을 zygote(_cli_zygote.py) 하나로 처리한다. zygote는 제출물당 한 번 시작하여
+cli.py가 쓰는 표준 라이브러리 모듈과 import만으로 부작용이 없는 학생 모듈을 미리 import하고,
+실행마다 fork한 자식 프로세스에서 cli.py를 __main__으로 실행한다.
+
+미리 import하는 학생 모듈은 최상위 문장이 import/def/class/상수 할당뿐인 모듈로 한정한다
+(데이터 파일을 읽거나 출력하는 모듈을 미리 import하면 실행마다 새 프로세스와 결과가 달라짐).
+그 밖의 모듈은 자식 프로세스에서 새로 import되므로 각 실행은 새 프로세스와 같게 동작한다.
+
+fork를 지원하지 않거나 zygote 시작에 실패하면 매번 새 프로세스로 실행한다. 어느 쪽이든
+core.process_supervisor의 리소스 제한(ProcessLimits)을 적용한다 (zygote는 rlimit을 fork한 자식에 물려줌).
+
+workdir(core.workspace의 작업 사본)을 주면 cli.py를 그 안에서 실행한다. 미리 import할 모듈 분석은
+원본 제출물의 SourceIndex를 그대로 쓴다 (작업 사본은 같은 내용).
+"""
+import ast
+import base64
+import itertools
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from core import process_supervisor, tracing
+from core.process_supervisor import ProcessLimits
+from core.resource_usage import record_child_usage, record_timeout
+from core.submission_health import CircuitOpenError, check_launch, note_timeout, program_name
+from plugins.python.validators._ast_facts import decorator_name
+from plugins.python.validators._source_index import submission_index
+from plugins.python.validators._student_import import _STDLIB_NAMES, _top_level_names
+
+_ZYGOTE_SCRIPT = str(Path(__file__).with_name("_cli_zygote.py"))
+_ZYGOTE_AVAILABLE = hasattr(os, "fork")
+
+# zygote 준비(미리 import) 제한 시간 (초)
+STARTUP_TIMEOUT = 10
+# 응답 대기 여유 시간 (초, 이 시간이 지나도 응답이 없으면 zygote가 멈춘 것으로 봄)
+_RESPONSE_GRACE = 5
+
+# import만으로 출력/화면이 바뀌는 표준 라이브러리 모듈 (미리 import하지 않음)
+_NO_PRELOAD = frozenset({"this", "antigravity", "__main__", "idlelib", "turtle", "turtledemo", "tkinter"})
+
+# 모듈 최상위에서 호출해도 부작용이 없는 것으로 보는 함수/클래스 이름
+_PURE_CALLS = frozenset({
+    "field", "dataclass", "namedtuple", "NamedTuple", "TypedDict", "TypeVar", "NewType",
+    "Enum", "IntEnum", "auto", "compile", "getLogger", "Path", "PurePath",
+    "frozenset", "set", "dict", "list", "tuple", "str", "int", "float", "bool", "bytes", "object",
+    "defaultdict", "OrderedDict", "Counter", "deque", "Decimal", "Fraction", "timedelta",
+    "Lock", "RLock", "partial", "range",
+})
+# 부작용이 없는 것으로 보는 데코레이터 이름
+_PURE_DECORATORS = _PURE_CALLS | frozenset({
+    "staticmethod", "classmethod", "property", "abstractmethod", "total_ordering",
+    "lru_cache", "cache", "cached_property", "wraps", "contextmanager", "asynccontextmanager",
+    "unique", "overload", "final", "runtime_checkable", "singledispatch",
+    "setter", "getter", "deleter",
+})
+
+
+class CLIRunner:
+    """
+    제출물 하나의 cli.py 실행기
+
+    Example:
+        runner = CLIRunner(submission_dir, cli_path)
+        result = runner.run(["--help"])  # subprocess.CompletedProcess 또는 None
+        ...
+        runner.close()  # teardown
+    """
+
+    def __init__(self, submission_dir: str, cli_path: str, use_zygote: bool = True,
+                 startup_timeout: float = STARTUP_TIMEOUT, limits: Optional[ProcessLimits] = None,
+                 workdir: Optional[str] = None):
+        """
+        Args:
+            submission_dir: 제출물 디렉토리
+            cli_path: cli.py 경로 (submission_dir 안)
+            use_zygote: False면 매번 새 프로세스로 실행
+            startup_timeout: zygote 준비 제한 시간 (초)
+            limits: 리소스 제한 (None이면 ProcessLimits 기본값)
+            workdir: cli.py 실행 작업 디렉토리 (submission_dir의 작업 사본, None이면 submission_dir)
+        """
+        self.submission_dir = submission_dir
+        self.cli_path = cli_path
+        self.workdir = workdir or submission_dir
+        # 실제로 실행하는 cli.py (작업 사본 안의 같은 파일)
+        self.run_path = os.path.join(self.workdir, os.path.relpath(cli_path, submission_dir)) if workdir else cli_path
+        self.startup_timeout = startup_timeout
+        self.limits = limits or ProcessLimits()
+        # zygote를 쓸 수 없으면 False (이후 실행은 모두 새 프로세스)
+        self._use_zygote = use_zygote and _ZYGOTE_AVAILABLE
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+
+    def run(self, args: List[str], timeout: float = 10) -> Optional[subprocess.CompletedProcess]:
+        """
+        python cli.py *args 실행 (subprocess.run(capture_output=True, text=True)와 같은 결과, stdin은 /dev/null)
+
+        Returns:
+            CompletedProcess 또는 None (실행 실패/타임아웃)
+        """
+        argv = [sys.executable, self.run_path] + list(args)
+        try:
+            check_launch(program_name(argv))
+        except CircuitOpenError:
+            return None
+        proc = self._zygote()
+        if proc is None:
+            return self._run_cold(argv, timeout)
+
+        request_id = next(self._ids)
+        future: Future = Future()
+        self._pending[request_id] = future
+        try:
+            with self._write_lock:
+                proc.stdin.write((json.dumps({"id": request_id, "args": list(args), "timeout": timeout}) + "\n").encode())
+                proc.stdin.flush()
+            response = future.result(timeout + _RESPONSE_GRACE)
+        except (BrokenPipeError, OSError, ValueError, EOFError):
+            # zygote 종료 → 이번 실행부터 새 프로세스로
+            self._discard(proc)
+            return self._run_cold(argv, timeout)
+        except FutureTimeoutError:
+            self._discard(proc)
+            record_timeout()
+            note_timeout(program_name(argv))
+            return None
+        finally:
+            self._pending.pop(request_id, None)
+
+        record_child_usage(response.get("cpu_s", 0.0), response.get("max_rss_kb", 0))
+        if response.get("timeout"):
+            record_timeout()
+            note_timeout(program_name(argv))
+            return None
+        return subprocess.CompletedProcess(
+            argv, response["returncode"], _decode(response["stdout"]), _decode(response["stderr"]),
+        )
+
+    def close(self) -> None:
+        """zygote 종료 (실행 중인 cli.py 포함)"""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        process_supervisor.wait_exited(proc, 2)
+        _stop(proc)
+
+    def _zygote(self) -> Optional[subprocess.Popen]:
+        """준비된 zygote (처음 호출 시 시작, 쓸 수 없으면 None)"""
+        with self._lock:
+            if self._proc is None and self._use_zygote:
+                self._proc = self._start()
+                if self._proc is None:
+                    self._use_zygote = False
+            return self._proc
+
+    def _start(self) -> Optional[subprocess.Popen]:
+        preload = zygote_preload(self.submission_dir, self.cli_path)
+        preload["output_limit"] = self.limits.output_bytes
+        with tracing.span("start cli zygote", cat="process", preload=len(preload["student"]) + len(preload["stdlib"])):
+            try:
+                proc = process_supervisor.spawn(
+                    [sys.executable, _ZYGOTE_SCRIPT, self.run_path, json.dumps(preload)],
+                    self.limits,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=self.workdir,
+                )
+            except OSError:
+                return None
+            ready: Future = Future()
+            threading.Thread(target=self._read_responses, args=(proc, ready), daemon=True).start()
+            try:
+                ready.result(self.startup_timeout)
+            except (FutureTimeoutError, EOFError):
+                _stop(proc)
+                return None
+            return proc
+
+    def _read_responses(self, proc: subprocess.Popen, ready: Future) -> None:
+        """zygote 응답을 요청 id별 Future로 전달 (zygote가 끝나면 남은 요청은 EOFError)"""
+        with proc.stdout:
+            for line in proc.stdout:
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue
+                if message.get("ready"):
+                    ready.set_result(True)
+                    continue
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        if not ready.done():
+            ready.set_exception(EOFError())
+        for future in list(self._pending.values()):
+            if not future.done():
+                future.set_exception(EOFError())
+
+    def _discard(self, proc: subprocess.Popen) -> None:
+        """응답하지 않는/종료된 zygote 정리, 이후 실행은 새 프로세스로"""
+        with self._lock:
+            if self._proc is proc:
+                self._proc = None
+            self._use_zygote = False
+        _stop(proc)
+
+    def _run_cold(self, argv: List[str], timeout: float) -> Optional[subprocess.CompletedProcess]:
+        return process_supervisor.run(argv, timeout=timeout, cwd=self.workdir, limits=self.limits)
+
+
+def zygote_preload(submission_dir: str, cli_path: str) -> Dict[str, List[str]]:
+    """
+    zygote가 미리 import할 모듈 (_cli_zygote.py 인자 형식)
+
+    cli.py에서 import를 따라가며 만나는 학생 모듈 중 미리 import해도 되는 것과,
+    그 모듈들이 import하는 표준 라이브러리 모듈 (학생 파일과 이름이 겹치는 것은 제외)
+    """
+    root = str(Path(submission_dir).resolve())
+    names = _top_level_names(root)
+    index = submission_index(submission_dir)
+
+    def tree_of(name: str) -> Optional[ast.Module]:
+        source_file = index.get(os.path.join(root, f"{name}.py"))
+        return source_file.tree if source_file is not None else None
+
+    # cli.py에서 도달하는 학생 모듈 + 그 파일들의 import
+    imported: Set[str] = set()
+    visited: Set[str] = set()
+    entry = index.get(cli_path)
+    queue = [entry.tree] if entry is not None and entry.tree is not None else []
+    while queue:
+        tree = queue.pop()
+        for module in _imported_modules(tree):
+            imported.add(module)
+            top = module.split(".", 1)[0]
+            if top in names and top not in visited:
+                visited.add(top)
+                student_tree = tree_of(top)
+                if student_tree is not None:
+                    queue.append(student_tree)
+
+    entry_name = Path(cli_path).stem
+    preloadable: Dict[str, bool] = {}
+
+    def is_preloadable(name: str) -> bool:
+        if name not in preloadable:
+            # 순환 import는 일단 가능한 것으로 보고 판단
+            preloadable[name] = True
+            tree = tree_of(name)
+            preloadable[name] = (
+                name != entry_name
+                and name not in _STDLIB_NAMES
+                and tree is not None
+                and _pure_module(tree)
+                and all(is_preloadable(dep) for dep in _top_level_imports(tree) if dep in names)
+            )
+        return preloadable[name]
+
+    return {
+        "stdlib": sorted(
+            module for module in imported
+            if module.split(".", 1)[0] in _STDLIB_NAMES
+            and module.split(".", 1)[0] not in names | _NO_PRELOAD
+        ),
+        "student": sorted(name for name in visited if is_preloadable(name)),
+        "names": sorted(names),
+    }
+
+
+def _imported_modules(tree: ast.Module) -> Set[str]:
+    """파일 안의 모든 절대 import 모듈 이름 (함수 안의 import 포함)"""
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module)
+    return modules
+
+
+def _top_level_imports(tree: ast.Module) -> Set[str]:
+    """모듈 import 시 실행되는 import의 최상위 이름"""
+    modules = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split(".", 1)[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.add(node.module.split(".", 1)[0])
+    return modules
+
+
+def _pure_module(tree: ast.Module) -> bool:
+    """import만으로 부작용이 없는 모듈인지 (최상위 문장이 import/def/class/상수 할당뿐)"""
+    return all(_pure_statement(node, module_level=True) for node in tree.body)
+
+
+def _pure_statement(node: ast.stmt, module_level: bool = False) -> bool:
+    if isinstance(node, ast.Import):
+        return True
+    if isinstance(node, ast.ImportFrom):
+        return node.level == 0
+    if isinstance(node, ast.Pass):
+        return True
+    if isinstance(node, ast.Expr):
+        # docstring
+        return isinstance(node.value, ast.Constant)
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return (_pure_decorators(node.decorator_list)
+                and all(_pure_expr(default) for default in node.args.defaults + node.args.kw_defaults if default))
+    if isinstance(node, ast.ClassDef):
+        return (_pure_decorators(node.decorator_list)
+                and all(_pure_expr(base) for base in node.bases)
+                and all(keyword.arg != "metaclass" and _pure_expr(keyword.value) for keyword in node.keywords)
+                and all(_pure_statement(item) for item in node.body))
+    if isinstance(node, ast.Assign):
+        return _pure_expr(node.value)
+    if isinstance(node, ast.AnnAssign):
+        return _pure_expr(node.annotation) and (node.value is None or _pure_expr(node.value))
+    if module_level and isinstance(node, ast.If):
+        # if __name__ == "__main__": 블록은 import 시 실행되지 않음
+        return _is_main_guard(node.test) and all(_pure_statement(item, True) for item in node.orelse)
+    return False
+
+
+def _pure_decorators(decorators: List[ast.expr]) -> bool:
+    return all(
+        decorator_name(deco) in _PURE_DECORATORS
+        and (not isinstance(deco, ast.Call) or _pure_expr(deco))
+        for deco in decorators
+    )
+
+
+def _pure_expr(node: ast.expr) -> bool:
+    """호출이 없거나 _PURE_CALLS만 호출하는 식"""
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Await, ast.Yield, ast.YieldFrom, ast.NamedExpr)):
+            return False
+        if isinstance(child, ast.Call) and decorator_name(child.func) not in _PURE_CALLS:
+            return False
+    return True
+
+
+def _is_main_guard(test: ast.expr) -> bool:
+    return (
+        isinstance(test, ast.Compare)
+        and isinstance(test.left, ast.Name) and test.left.id == "__name__"
+        and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq)
+        and isinstance(test.comparators[0], ast.Constant) and test.comparators[0].value == "__main__"
+    )
+
+
+def _decode(data: str) -> str:
+    """base64 출력 → 텍스트 (subprocess text=True처럼 로캘 인코딩 + 줄바꿈 통일)"""
+    return process_supervisor.decode_output(base64.b64decode(data))
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    """zygote 강제 종료 후 회수 (fork된 cli.py는 zygote 종료 시 함께 종료, stdout은 응답 스레드가 닫음)"""
+    process_supervisor.reap(proc)
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
@@ -0,0 +1,340 @@
+"""
+cli.py 실행 zygote (학생 cli.py 실행용)
+
+    python _cli_zygote.py cli.py '{"stdlib": [...], "student": [...], "names": [...]}'
+
+제출물 디렉토리를 작업 디렉토리로 한 번 시작하여 표준 라이브러리 모듈과 import만으로 부작용이 없는
+학생 모듈(models, storage 등)을 미리 import하고 cli.py를 컴파일해 둔다. 이후 요청마다 fork한 자식
+프로세스에서 sys.argv/표준 입출력을 바꾸고 cli.py를 __main__으로 실행하므로, 실행 한 번의 비용이
+인터프리터 시작 대신 fork 한 번이 된다.
+
+- stdlib: 미리 import할 표준 라이브러리 모듈
+- student: 미리 import할 학생 모듈 (import 시 부작용이 없는 것만, 채점기가 AST로 판단)
+- names: 제출물 최상위 모듈 이름 전체 (이 스크립트가 import한 모듈과 이름이 겹치면 자식에서 지움)
+- output_limit: 실행 하나의 stdout+stderr 최대 바이트 (넘으면 그때까지의 출력과 returncode -9로 응답)
+
+자식 프로세스는 각각 새 프로세스 그룹으로 실행하며, 끝나거나 제한 시간을 넘기면 그룹 전체를 종료한다.
+zygote가 죽으면 자식 프로세스도 함께 종료되고(PR_SET_PDEATHSIG), 고아가 된 손자 프로세스는
+zygote가 회수한다(PR_SET_CHILD_SUBREAPER). rlimit은 zygote를 시작한 채점기가 설정한 것을 물려받는다.
+
+프로토콜 (stdin/stdout, 한 줄에 JSON 하나):
+- 준비가 끝나면 {"ready": true}
+- 요청: {"id": 1, "args": ["--help"], "timeout": 10}
+- 응답: {"id": 1, "returncode": 0, "stdout": base64, "stderr": base64, "cpu_s": 0.01, "max_rss_kb": 9000}
+  제한 시간을 넘기면 자식 프로세스를 종료하고 {"id": 1, "timeout": true, "cpu_s": ..., "max_rss_kb": ...}
+요청은 동시에 여러 개 처리하며, stdin이 닫히면 실행 중인 자식 프로세스를 모두 종료하고 끝낸다.
+
+채점 코드(core 등)를 import하지 않는 독립 스크립트이다.
+"""
+import sys
+
+# 인터프리터 시작 시점에 이미 import된 모듈 (python cli.py에서도 학생 파일이 가리지 못하는 이름)
+_STARTUP_MODULES = frozenset(sys.modules)
+
+import atexit
+import base64
+import builtins
+import ctypes
+import importlib
+import json
+import os
+import selectors
+import signal
+import threading
+import time
+import traceback
+import types
+
+# stdout/stderr를 모두 닫았지만 아직 끝나지 않은 자식 프로세스를 확인하는 간격 (초)
+_REAP_INTERVAL = 0.01
+
+_PR_SET_PDEATHSIG = 1
+_PR_SET_CHILD_SUBREAPER = 36
+
+
+class _Run:
+    """실행 중인 자식 프로세스 하나"""
+
+    def __init__(self, request_id, pid: int, deadline: float):
+        self.request_id = request_id
+        self.pid = pid
+        self.deadline = deadline
+        self.output = {"stdout": bytearray(), "stderr": bytearray()}
+        self.open_streams = 2
+        self.output_size = 0
+
+
+def main() -> None:
+    script = sys.argv[1]
+    preload = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+
+    # python cli.py로 실행한 것과 같은 sys.path
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    preloaded = _preload(preload.get("stdlib", []), preload.get("student", []))
+    # 이 스크립트가 import한 모듈 중 학생 파일 이름과 겹치는 것 (자식에서 학생 파일로 다시 import되도록)
+    shadowed = set(preload.get("names", [])) - preloaded - _STARTUP_MODULES
+
+    try:
+        with open(script, "rb") as f:
+            code, error = compile(f.read(), script, "exec", dont_inherit=True), None
+    except (SyntaxError, ValueError, OSError) as e:
+        code, error = None, e
+
+    _prctl(_PR_SET_CHILD_SUBREAPER, 1)
+    _send({"ready": True})
+    _serve(lambda args: _run_main(script, code, error, args, shadowed), preload.get("output_limit"))
+
+
+def _preload(stdlib: list, student: list) -> set:
+    """모듈 미리 import (실패는 무시) → import된 학생 모듈 이름"""
+    # 미리 import 중 출력이 생겨도 응답 채널(stdout)을 더럽히지 않도록
+    stdout, sys.stdout = sys.stdout, sys.stderr
+    try:
+        for name in stdlib:
+            try:
+                importlib.import_module(name)
+            except BaseException:
+                pass
+        loaded = set()
+        for name in student:
+            try:
+                importlib.import_module(name)
+                loaded.add(name)
+            except BaseException:
+                pass
+        return loaded
+    finally:
+        sys.stdout = stdout
+
+
+def _serve(run_main, output_limit) -> None:
+    selector = selectors.DefaultSelector()
+    selector.register(0, selectors.EVENT_READ)
+    runs = {}
+    pending = b""
+    while True:
+        now = time.monotonic()
+        timeout = None
+        if runs:
+            timeout = max(0.0, min(run.deadline for run in runs.values()) - now)
+            if any(run.open_streams == 0 for run in runs.values()):
+                timeout = min(timeout, _REAP_INTERVAL)
+
+        for key, _ in selector.select(timeout):
+            if key.data is None:
+                data = os.read(0, 65536)
+                if not data:
+                    for run in runs.values():
+                        _kill(run.pid)
+                    return
+                pending += data
+                while b"\n" in pending:
+                    line, pending = pending.split(b"\n", 1)
+                    if line.strip():
+                        run = _start(json.loads(line), run_main, selector)
+                        runs[run.pid] = run
+                continue
+            run, stream = key.data
+            chunk = os.read(key.fd, 65536)
+            if chunk:
+                run.output[stream] += chunk
+                run.output_size += len(chunk)
+            else:
+                selector.unregister(key.fd)
+                os.close(key.fd)
+                run.open_streams -= 1
+
+        now = time.monotonic()
+        for pid, run in list(runs.items()):
+            if run.deadline <= now:
+                _close_streams(run, selector)
+                del runs[pid]
+                _send({"id": run.request_id, "timeout": True, **_usage(_kill(pid)[1])})
+            elif output_limit is not None and run.output_size > output_limit:
+                # 출력 폭주: 그때까지의 출력으로 응답 (subprocess 쪽 제한과 같이 SIGKILL 종료로 기록)
+                _close_streams(run, selector)
+                del runs[pid]
+                _send(_response(run, -signal.SIGKILL, _kill(pid)[1]))
+            elif run.open_streams == 0 and _exited(pid):
+                del runs[pid]
+                _send(_response(run, *_kill(pid)))
+        _reap_orphans(runs)
+
+
+def _response(run: _Run, returncode: int, usage) -> dict:
+    return {
+        "id": run.request_id,
+        "returncode": returncode,
+        "stdout": base64.b64encode(run.output["stdout"]).decode("ascii"),
+        "stderr": base64.b64encode(run.output["stderr"]).decode("ascii"),
+        **_usage(usage),
+    }
+
+
+def _start(request: dict, run_main, selector) -> _Run:
+    """자식 프로세스 fork → 실행 정보"""
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.setpgid(0, 0)
+            _prctl(_PR_SET_PDEATHSIG, signal.SIGKILL)
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.dup2(stdout_w, 1)
+            os.dup2(stderr_w, 2)
+            os.closerange(3, os.sysconf("SC_OPEN_MAX"))
+            status = run_main(request.get("args", []))
+        finally:
+            os._exit(status)
+
+    try:
+        # 자식이 setpgid하기 전에 그룹 종료가 필요할 수 있으므로 부모에서도 설정
+        os.setpgid(pid, pid)
+    except OSError:
+        pass
+    os.close(stdout_w)
+    os.close(stderr_w)
+    run = _Run(request.get("id"), pid, time.monotonic() + float(request.get("timeout", 10)))
+    selector.register(stdout_r, selectors.EVENT_READ, (run, "stdout"))
+    selector.register(stderr_r, selectors.EVENT_READ, (run, "stderr"))
+    return run
+
+
+def _run_main(script: str, code, error, args: list, shadowed: set) -> int:
+    """자식 프로세스: cli.py를 __main__으로 실행 → 종료 코드 (python cli.py와 같은 규칙)"""
+    for name in list(sys.modules):
+        if name.split(".", 1)[0] in shadowed:
+            del sys.modules[name]
+    # 미리 import한 random의 상태는 모든 자식이 같으므로 새 프로세스처럼 다시 seed
+    random = sys.modules.get("random")
+    if random is not None and hasattr(random, "seed"):
+        random.seed()
+
+    sys.argv = [script, *args]
+    module = types.ModuleType("__main__")
+    module.__file__ = script
+    module.__cached__ = None
+    module.__builtins__ = builtins
+    sys.modules["__main__"] = module
+
+    if isinstance(error, OSError):
+        print(f"python: can't open file {script!r}: [Errno {error.errno}] {error.strerror}", file=sys.stderr)
+        status = 2
+    elif error is not None:
+        # 컴파일 오류는 python과 같이 Traceback 머리말 없이 출력
+        traceback.print_exception(type(error), error, None)
+        status = 1
+    else:
+        try:
+            exec(code, module.__dict__)
+            status = 0
+        except SystemExit as e:
+            status = _exit_status(e.code)
+        except BaseException as e:
+            _print_uncaught(e, script)
+            status = 1
+
+    # 인터프리터 종료 순서: non-daemon 스레드 대기 → atexit → 표준 출력 flush
+    try:
+        threading._shutdown()
+    except Exception:
+        pass
+    atexit._run_exitfuncs()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            status = 120
+    return status
+
+
+def _print_uncaught(e: BaseException, script: str) -> None:
+    """처리되지 않은 예외 출력 (이 스크립트의 프레임은 빼고 cli.py부터)"""
+    tb = e.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename != script:
+        tb = tb.tb_next
+    sys.excepthook(type(e), e.with_traceback(tb), tb)
+
+
+def _exit_status(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code & 0xFF
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _returncode(status: int) -> int:
+    """waitpid 상태 → subprocess와 같은 returncode (시그널 종료는 음수)"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _close_streams(run: _Run, selector) -> None:
+    for key in list(selector.get_map().values()):
+        if key.data is not None and key.data[0] is run:
+            selector.unregister(key.fd)
+            os.close(key.fd)
+
+
+def _exited(pid: int) -> bool:
+    """자식 프로세스가 종료했는지 (회수하지 않음 — 좀비가 프로세스 그룹 id를 잡아 둠)"""
+    return os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT | os.WNOHANG) is not None
+
+
+def _kill(pid: int):
+    """자식 프로세스 그룹 강제 종료 + 회수 → (returncode, rusage)"""
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    _, status, usage = os.wait4(pid, 0)
+    # 그룹에 남아 zygote로 온 손자 프로세스
+    while True:
+        try:
+            if os.waitpid(-pid, 0)[0] == 0:
+                break
+        except ChildProcessError:
+            break
+    return _returncode(status), usage
+
+
+def _reap_orphans(runs: dict) -> None:
+    """다른 프로세스 그룹으로 빠져나간 뒤 종료한 고아 프로세스 회수 (실행 중인 자식은 건드리지 않음)"""
+    while True:
+        try:
+            info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT | os.WNOHANG)
+        except ChildProcessError:
+            return
+        if info is None or info.si_pid in runs:
+            return
+        os.waitpid(info.si_pid, 0)
+
+
+def _prctl(option: int, value: int) -> None:
+    """Linux prctl (다른 플랫폼/실패는 무시)"""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        ctypes.CDLL(None, use_errno=True).prctl(option, value, 0, 0, 0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _usage(usage) -> dict:
+    """자식 프로세스 rusage → 응답 필드 (채점기 리소스 집계용)"""
+    return {"cpu_s": usage.ru_utime + usage.ru_stime, "max_rss_kb": usage.ru_maxrss}
+
+
+def _send(message: dict) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,23 +6,32 @@ Python 검증 공통 유틸리티
 """
 import ast
 import glob
-import importlib
-import sys
-from pathlib import Path
 from typing import List, Optional, Tuple
 
 # 모듈 타입 힌트 (importlib에서 반환)
 from types import ModuleType
 
+from core.source_check import AST_LOCK
+from plugins.python.validators._student_import import (
+    release_student_modules,
+    student_namespace,
+)
+
+# ast.parse()/compile(AST) 직렬화용 (다른 플러그인의 파싱과 같은 프로세스 전역 락)
+_AST_LOCK = AST_LOCK
+
 
 def import_student_module(submission_dir: str, module_name: str) -> Optional[ModuleType]:
     """
     학생 제출 코드를 안전하게 import
 
-    1. submission_dir을 sys.path 선두에 추가
-    2. 이미 캐시된 모듈 제거 (재채점 대비)
-    3. importlib.import_module 실행
-    4. 실패 시 None 반환
+    1. submission_dir의 import 네임스페이스 활성화 (다른 학습자의 네임스페이스는 해제)
+    2. 이미 import된 같은 모듈은 다시 실행 (재채점 대비)
+    3. 실패 시 None 반환
+
+    sys.path는 변경하지 않는다. 보통 감시 실행기(core.supervised_executor)의 자식 프로세스에서
+    호출하며, 채점 프로세스에서 직접 import했다면(fork 없는 플랫폼) 호출한 검증기는 teardown에서
+    release_student_modules()로 학생 모듈을 정리해야 한다.
 
     Args:
         submission_dir: 제출물 디렉토리 절대 경로
@@ -31,20 +40,7 @@ def import_student_module(submission_dir: str, module_name: str) -> Optional[Mod
     Returns:
         import된 모듈 객체 또는 None
     """
-    resolved = str(Path(submission_dir).resolve())
-
-    # sys.path 선두에 추가 (중복 방지)
-    if resolved not in sys.path:
-        sys.path.insert(0, resolved)
-
-    # 캐시된 모듈 제거 → 재채점 시 최신 코드 반영
-    if module_name in sys.modules:
-        del sys.modules[module_name]
-
-    try:
-        return importlib.import_module(module_name)
-    except Exception:
-        return None
+    return student_namespace(submission_dir).import_module(module_name)
 
 
 def collect_py_files(submission_dir: str) -> List[str]:
@@ -77,7 +73,8 @@ def parse_all_files(py_files: List[str]) -> List[Tuple[str, ast.Module]]:
         try:
             with open(filepath, "r", encoding="utf-8") as f:
                 source = f.read()
-            tree = ast.parse(source, filename=filepath)
+            with _AST_LOCK:
+                tree = ast.parse(source, filename=filepath)
             results.append((filepath, tree))
         except (SyntaxError, UnicodeDecodeError):
             continue
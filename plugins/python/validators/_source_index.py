@@ -0,0 +1,202 @@
+"""
+제출물 소스 인덱스
+
+제출물의 .py 파일을 한 번만 수집/읽기/파싱하여 같은 채점의 검증기들이 공유한다.
+Grader가 연 SubmissionScope에 보관되므로 채점 한 번에 제출물당 하나만 만들어진다.
+"""
+import ast
+import bisect
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core import tracing
+from core.source_check import student_module_files
+from core.submission_scope import current_scope
+from plugins.python.validators._ast_facts import FactTable, extract_facts
+from plugins.python.validators._helpers import _AST_LOCK, collect_py_files
+
+# 프로세스 풀 파싱은 파일이 이보다 많을 때만 (작은 제출물은 프로세스 시작 비용이 더 큼)
+_POOL_MIN_FILES = 32
+
+
+@dataclass
+class SourceFile:
+    """
+    제출물 .py 파일 하나
+
+    Attributes:
+        path: 파일 경로 (collect_py_files()와 같은 형식)
+        source: 소스 텍스트 (UTF-8 디코딩 실패 시 None)
+        tree: AST (문법 오류/디코딩 실패 시 None)
+    """
+
+    path: str
+    source: Optional[str]
+    tree: Optional[ast.Module] = None
+    _line_offsets: Optional[List[int]] = field(default=None, repr=False)
+    _compiles: Optional[bool] = field(default=None, repr=False)
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """각 줄의 시작 위치 (문자 단위, 0번째 = 1번 줄)"""
+        if self._line_offsets is None:
+            offsets = [0]
+            for line in (self.source or "").splitlines(keepends=True):
+                offsets.append(offsets[-1] + len(line))
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def offset(self, lineno: int, col_offset: int = 0) -> int:
+        """AST 노드 위치(lineno, col_offset) → 소스 텍스트 위치"""
+        return self.line_offsets[lineno - 1] + col_offset
+
+    def lineno(self, offset: int) -> int:
+        """소스 텍스트 위치 → 줄 번호 (1부터)"""
+        return bisect.bisect_right(self.line_offsets, offset)
+
+
+class SourceIndex:
+    """
+    제출물 .py 파일 인덱스 (수집/읽기/파싱 각 1회)
+
+    Example:
+        index = submission_index(submission_dir)
+        for filepath, tree in index.parsed():
+            ...
+        facts = index.facts()
+        model_facts = index.module_facts(["models"])  # models.py와 그 모듈이 import하는 파일만
+    """
+
+    def __init__(self, submission_dir: str, parse_workers: int = 0):
+        """
+        Args:
+            submission_dir: 제출물 루트 디렉토리
+            parse_workers: 2 이상이면 파일이 많을 때 프로세스 풀에서 파싱
+        """
+        self.submission_dir = submission_dir
+        self.files: Dict[str, SourceFile] = {}
+        self._facts: Optional[FactTable] = None
+        # 파일별 사실 테이블 (module_facts()용)
+        self._file_facts: Dict[str, FactTable] = {}
+        self._facts_lock = threading.Lock()
+        with tracing.span("index sources", cat="ast", submission_dir=submission_dir):
+            for filepath in collect_py_files(submission_dir):
+                self.files[_normalize(filepath)] = SourceFile(filepath, _read_source(filepath))
+            self._parse(parse_workers)
+
+    def parsed(self) -> List[Tuple[str, ast.Module]]:
+        """파싱에 성공한 (파일 경로, AST) 목록 (parse_all_files()와 같은 형식)"""
+        return [(f.path, f.tree) for f in self.files.values() if f.tree is not None]
+
+    def facts(self) -> FactTable:
+        """전체 파일의 AST 사실 테이블 (처음 호출할 때 파일마다 한 번 순회)"""
+        with self._facts_lock:
+            if self._facts is None:
+                self._facts = self._merged_facts(self.files)
+            return self._facts
+
+    def module_facts(self, modules: Iterable[str]) -> FactTable:
+        """
+        학생 모듈과 그 모듈이 (간접적으로) import하는 제출물 파일의 AST 사실 테이블
+
+        검증기의 input_modules와 같은 범위라서 결과 캐시가 재사용 여부를 판단한 파일만 본다.
+        import 범위를 알 수 없으면(동적 import 등) facts()와 같다.
+        """
+        files = student_module_files(self.submission_dir, modules)
+        if files is None:
+            return self.facts()
+        with self._facts_lock:
+            return self._merged_facts(_normalize(os.path.join(self.submission_dir, f)) for f in files)
+
+    def _merged_facts(self, paths: Iterable[str]) -> FactTable:
+        """파일별 사실 테이블을 합침 (_facts_lock 안에서 호출)"""
+        table = FactTable()
+        with tracing.span("extract facts", cat="ast", submission_dir=self.submission_dir):
+            for path in paths:
+                source_file = self.files.get(path)
+                if source_file is None or source_file.tree is None:
+                    continue
+                if path not in self._file_facts:
+                    self._file_facts[path] = extract_facts(source_file.tree, source_file.path)
+                table.merge(self._file_facts[path])
+        return table
+
+    def get(self, filepath: str) -> Optional[SourceFile]:
+        """경로에 해당하는 파일 (인덱스에 없으면 None)"""
+        return self.files.get(_normalize(filepath))
+
+    def compiles(self, filepath: str) -> bool:
+        """파일이 compile()되는지 (결과는 파일별로 캐시)"""
+        source_file = self.get(filepath)
+        if source_file is None or source_file.tree is None:
+            return False
+        if source_file._compiles is None:
+            try:
+                with _AST_LOCK:
+                    compile(source_file.tree, source_file.path, "exec", dont_inherit=True)
+                source_file._compiles = True
+            except (SyntaxError, ValueError):
+                source_file._compiles = False
+        return source_file._compiles
+
+    def _parse(self, parse_workers: int) -> None:
+        pending = [f for f in self.files.values() if f.source is not None]
+        if parse_workers > 1 and len(pending) >= _POOL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+                trees = list(executor.map(
+                    _parse_source, [f.source for f in pending], [f.path for f in pending],
+                    chunksize=8,
+                ))
+        else:
+            trees = [_parse_source(f.source, f.path) for f in pending]
+        for source_file, tree in zip(pending, trees):
+            source_file.tree = tree
+
+
+def submission_index(submission_dir: str, parse_workers: Optional[int] = None,
+                     config: Optional[Dict] = None) -> SourceIndex:
+    """
+    현재 채점의 제출물 소스 인덱스 (없으면 생성)
+
+    Grader 밖에서 검증기를 직접 실행하면(스코프 없음) 매번 새로 만든다.
+
+    Args:
+        submission_dir: 제출물 루트 디렉토리
+        parse_workers: 프로세스 풀 파싱 워커 수 (None이면 config의 execution.parse_workers, 기본 0)
+        config: 미션 설정
+    """
+    if parse_workers is None:
+        execution = (config or {}).get("execution") or {}
+        parse_workers = int(execution.get("parse_workers") or 0)
+
+    def build() -> SourceIndex:
+        return SourceIndex(submission_dir, parse_workers)
+
+    scope = current_scope()
+    if scope is None:
+        return build()
+    return scope.get(f"python.source_index:{_normalize(submission_dir)}", build)
+
+
+def _normalize(filepath: str) -> str:
+    return os.path.normpath(os.path.abspath(filepath))
+
+
+def _read_source(filepath: str) -> Optional[str]:
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            return f.read()
+    except (UnicodeDecodeError, OSError):
+        return None
+
+
+def _parse_source(source: str, filepath: str) -> Optional[ast.Module]:
+    """소스 → AST (문법 오류 시 None, 프로세스 풀 작업으로도 사용)"""
+    try:
+        with _AST_LOCK:
+            return ast.parse(source, filename=filepath)
+    except (SyntaxError, ValueError):
+        return None
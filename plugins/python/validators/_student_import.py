@@ -0,0 +1,162 @@
+"""
+학생 모듈 import 네임스페이스
+
+제출물 디렉토리를 sys.path에 넣지 않고, 제출물 최상위 모듈 이름(models, storage 등)만
+그 제출물에서 찾는 finder를 sys.meta_path에 설치한다. 해제하면 그 동안 import된 학생 모듈과
+finder 캐시를 모두 지우므로 다음 학습자에게 이전 학습자의 모듈이 남지 않는다.
+
+활성 네임스페이스는 프로세스에 하나뿐이다. 학생 모듈은 감시 실행기(core.supervised_executor)의
+자식 프로세스에서 import하므로 채점 프로세스의 네임스페이스는 바뀌지 않는다. fork 없는 플랫폼에서
+채점 프로세스에서 직접 import하는 검증기는 shares_state로 직렬화된다.
+"""
+import importlib
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Set
+
+from core.supervised_executor import report_progress
+
+# 표준 라이브러리와 같은 이름의 학생 파일(random.py 등)은 학생 모듈로 취급하지 않음
+_STDLIB_NAMES = frozenset(getattr(sys, "stdlib_module_names", sys.builtin_module_names))
+
+_LOADER_DETAILS = (
+    (importlib.machinery.ExtensionFileLoader, importlib.machinery.EXTENSION_SUFFIXES),
+    (importlib.machinery.SourceFileLoader, importlib.machinery.SOURCE_SUFFIXES),
+    (importlib.machinery.SourcelessFileLoader, importlib.machinery.BYTECODE_SUFFIXES),
+)
+
+_lock = threading.RLock()
+_active: Optional["StudentNamespace"] = None
+
+
+class _SubmissionFinder(importlib.abc.MetaPathFinder):
+    """제출물 최상위 모듈 이름만 제출물 디렉토리에서 찾는 finder"""
+
+    def __init__(self, root: str, names: Set[str]):
+        self.names = names
+        self._finder = importlib.machinery.FileFinder(root, *_LOADER_DETAILS)
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is None and fullname in self.names:
+            return self._finder.find_spec(fullname, target)
+        return None
+
+
+class StudentNamespace:
+    """
+    제출물 하나의 import 네임스페이스
+
+    Example:
+        namespace = StudentNamespace(submission_dir)
+        namespace.activate()
+        try:
+            models = namespace.import_module("models")
+        finally:
+            namespace.deactivate()
+    """
+
+    def __init__(self, submission_dir: str):
+        self.root = str(Path(submission_dir).resolve())
+        # 이 네임스페이스가 제출물에서 찾는 최상위 모듈 이름
+        self.names: Set[str] = set()
+        self._finder: Optional[_SubmissionFinder] = None
+
+    def activate(self) -> None:
+        """finder 설치 (이미 다른 코드가 import한 이름은 제외)"""
+        self.names = {
+            name for name in _top_level_names(self.root)
+            if name not in _STDLIB_NAMES and name not in sys.modules
+        }
+        self._finder = _SubmissionFinder(self.root, self.names)
+        sys.meta_path.insert(0, self._finder)
+
+    def deactivate(self) -> None:
+        """finder 제거 + 이 네임스페이스에서 import된 모듈/finder 캐시 삭제"""
+        if self._finder is None:
+            return
+        try:
+            sys.meta_path.remove(self._finder)
+        except ValueError:
+            pass
+        self._finder = None
+
+        for name in list(sys.modules):
+            if name.split(".", 1)[0] in self.names:
+                del sys.modules[name]
+        # 학생 패키지의 하위 모듈 import로 생긴 finder 캐시
+        prefix = self.root + os.sep
+        for path in list(sys.path_importer_cache):
+            if isinstance(path, str) and (path == self.root or path.startswith(prefix)):
+                del sys.path_importer_cache[path]
+
+    def import_module(self, module_name: str) -> Optional[ModuleType]:
+        """
+        학생 모듈 import (이미 import된 모듈도 다시 실행하여 최신 코드 반영)
+
+        Returns:
+            모듈 객체 또는 None (제출물에 없음/import 중 예외)
+        """
+        top_level = module_name.split(".", 1)[0]
+        if top_level not in self.names:
+            return None
+        sys.modules.pop(module_name, None)
+        # 감시 실행기 자식 프로세스면 import 타임아웃을 이 모듈의 circuit breaker에 기록하도록 알림
+        report_progress(f"{top_level}.py")
+        try:
+            return importlib.import_module(module_name)
+        except Exception:
+            return None
+
+
+def student_namespace(submission_dir: str) -> StudentNamespace:
+    """submission_dir의 활성 네임스페이스 (다른 제출물의 네임스페이스가 남아 있으면 해제 후 새로 활성화)"""
+    global _active
+    resolved = str(Path(submission_dir).resolve())
+    with _lock:
+        if _active is not None and _active.root != resolved:
+            _active.deactivate()
+            _active = None
+        if _active is None:
+            _active = StudentNamespace(resolved)
+            _active.activate()
+        return _active
+
+
+def release_student_modules() -> None:
+    """활성 네임스페이스 해제 (채점 프로세스에서 학생 모듈을 import한 검증기의 teardown에서 호출)"""
+    global _active
+    with _lock:
+        if _active is not None:
+            _active.deactivate()
+            _active = None
+
+
+def _top_level_names(root: str) -> Set[str]:
+    """제출물 최상위에서 import 가능한 이름 (.py 모듈, .py가 있는 디렉토리)"""
+    names = set()
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return names
+    for entry in entries:
+        if entry.is_file() and entry.name.endswith(".py"):
+            name = entry.name[:-3]
+        elif entry.is_dir() and _has_python_files(entry.path):
+            name = entry.name
+        else:
+            continue
+        if name.isidentifier():
+            names.add(name)
+    return names
+
+
+def _has_python_files(path: str) -> bool:
+    try:
+        return any(name.endswith(".py") for name in os.listdir(path))
+    except OSError:
+        return False
@@ -1,33 +1,60 @@
 """
 CLI 동작 검증 플러그인 (30점)
 
-학습자의 도서 관리 cli.py가 올바르게 동작하는지 subprocess로 검증.
+학습자의 도서 관리 cli.py가 올바르게 동작하는지 실행하여 검증.
 cli.py 존재 → --help → add → list → 크래시 안전성 순서로 체크.
+cli.py 실행은 제출물당 한 번 시작한 zygote에서 fork하여 처리 (_cli_runner.py 참고).
+add가 만드는 데이터 파일은 제출물의 작업 사본(core.workspace)에만 생기고 teardown에서 버려진다.
 
 AI 트랩: --help 옵션 누락
 """
 import os
 import subprocess
-import sys
+import threading
 from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
-from core.check_item import CheckItem
+from core.check_item import CheckItem, ConcurrencyClass
+from core.process_supervisor import ProcessLimits
+from core.source_check import entry_compiles
+from core.workspace import Workspace
+from plugins.python.validators._cli_runner import CLIRunner
 
 
 class CLIValidator(BaseValidator):
     """CLI 서브커맨드 동작 검증 (cli.py, --help, add, list, 크래시 방지)"""
 
+    # 기존 데이터 파일
+    input_files = ["*.jsonl", "*.json", "*.csv"]
+    # cli.py와 그 모듈이 import하는 파일
+    input_modules = ["cli"]
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.cli_path: Optional[str] = None
+        self.cli_compiles = False
+        self.runner: Optional[CLIRunner] = None
+        # cli.py 실행 작업 디렉토리 (add가 쓰는 데이터 파일은 여기에만 생김)
+        self.workspace: Optional[Workspace] = None
+        # add/list는 같은 데이터 파일을 사용하므로 동시 실행 시에도 직렬화
+        self._data_lock = threading.Lock()
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
         cli_file = os.path.join(self.submission_dir, "cli.py")
         if os.path.isfile(cli_file):
             self.cli_path = cli_file
+            # 정적 게이트: 컴파일되지 않으면 cli_runnable 실패 → --help/add/list는 실행 없이 SKIPPED
+            self.cli_compiles = entry_compiles(self.submission_dir, "cli.py")
+            self.workspace = Workspace.from_config(self.config)
+            execution = self.config.get("execution") or {}
+            self.runner = CLIRunner(
+                self.submission_dir, cli_file,
+                use_zygote=execution.get("cli_zygote", True),
+                limits=ProcessLimits.from_config(self.config),
+                workdir=self.workspace.path,
+            )
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
@@ -35,7 +62,7 @@ class CLIValidator(BaseValidator):
             description="cli.py 파일이 존재하고 실행 가능한지 확인",
             points=5,
             validator=self._check_runnable,
-            hint="cli.py 파일을 제출 디렉토리에 포함하세요",
+            hint="cli.py 파일을 제출 디렉토리에 포함하고 문법 오류가 없는지 확인하세요",
         ))
 
         self.checklist.add_item(CheckItem(
@@ -45,6 +72,8 @@ class CLIValidator(BaseValidator):
             validator=self._check_help,
             hint="argparse를 사용하여 --help 옵션을 지원하세요",
             ai_trap=True,
+            concurrency=ConcurrencyClass.PARALLEL,
+            depends_on=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -53,6 +82,8 @@ class CLIValidator(BaseValidator):
             points=8,
             validator=self._check_add,
             hint="add 서브커맨드에 --isbn, --title, --author, --price 옵션을 구현하세요",
+            concurrency=ConcurrencyClass.PARALLEL,
+            depends_on=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -61,6 +92,8 @@ class CLIValidator(BaseValidator):
             points=7,
             validator=self._check_list,
             hint="list 서브커맨드를 구현하세요",
+            concurrency=ConcurrencyClass.PARALLEL,
+            depends_on=["cli_runnable"],
         ))
 
         self.checklist.add_item(CheckItem(
@@ -69,33 +102,31 @@ class CLIValidator(BaseValidator):
             points=5,
             validator=self._check_no_crash,
             hint="예외 처리로 잘못된 입력에도 Traceback 없이 안내 메시지를 출력하세요",
+            concurrency=ConcurrencyClass.PARALLEL,
         ))
 
     def teardown(self) -> None:
-        pass
+        """zygote 종료 + 작업 사본 삭제 (add로 생성/변경된 데이터 파일 포함)"""
+        if self.runner is not None:
+            self.runner.close()
+            self.runner = None
+        if self.workspace is not None:
+            self.workspace.close()
+            self.workspace = None
 
-    # -- subprocess 실행 헬퍼 --
+    # -- cli.py 실행 헬퍼 --
 
     def _run(self, args: list, timeout: int = 10) -> Optional[subprocess.CompletedProcess]:
-        """학생 cli.py를 subprocess로 실행"""
-        if not self.cli_path:
-            return None
-        try:
-            return subprocess.run(
-                [sys.executable, self.cli_path] + args,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=self.submission_dir,
-            )
-        except (subprocess.TimeoutExpired, OSError):
+        """학생 cli.py 실행 (python cli.py *args와 같은 결과)"""
+        if not self.cli_path or self.runner is None:
             return None
+        return self.runner.run(args, timeout=timeout)
 
     # -- 검증 함수 --
 
     def _check_runnable(self) -> bool:
-        """cli.py 파일 존재 확인"""
-        return self.cli_path is not None
+        """cli.py 파일 존재 + 컴파일 확인 (실패하면 --help/add/list는 실행하지 않고 SKIPPED)"""
+        return self.cli_path is not None and self.cli_compiles
 
     def _check_help(self) -> bool:
         """
@@ -116,55 +147,58 @@ class CLIValidator(BaseValidator):
         add 서브커맨드 동작 확인.
         returncode 0 + (stdout에 출력이 있거나 데이터 파일이 생성됨)
         """
-        # add 전 데이터 파일 목록 스냅샷
-        before_files = set(self._find_data_files())
-
-        result = self._run([
-            "add",
-            "--isbn", "978-89-0000-000-0",
-            "--title", "테스트 도서",
-            "--author", "테스터",
-            "--price", "10000",
-        ])
-        if result is None or result.returncode != 0:
-            return False
-
-        # 출력이 있거나 데이터 파일이 새로 생겼으면 동작한 것으로 판단
-        after_files = set(self._find_data_files())
-        has_output = len(result.stdout.strip()) > 0
-        has_new_file = len(after_files - before_files) > 0
-        has_file_changed = self._any_file_changed(before_files, after_files)
-
-        return has_output or has_new_file or has_file_changed
+        with self._data_lock:
+            # add 전 데이터 파일 목록 스냅샷
+            before_files = set(self._find_data_files())
+
+            result = self._run([
+                "add",
+                "--isbn", "978-89-0000-000-0",
+                "--title", "테스트 도서",
+                "--author", "테스터",
+                "--price", "10000",
+            ])
+            if result is None or result.returncode != 0:
+                return False
+
+            # 출력이 있거나 데이터 파일이 새로 생겼으면 동작한 것으로 판단
+            after_files = set(self._find_data_files())
+            has_output = len(result.stdout.strip()) > 0
+            has_new_file = len(after_files - before_files) > 0
+            has_file_changed = self._any_file_changed(before_files, after_files)
+
+            return has_output or has_new_file or has_file_changed
 
     def _check_list(self) -> bool:
         """
         list 서브커맨드 동작 확인.
         먼저 add로 데이터를 넣고, list로 조회하여 stdout에 출력이 있는지 확인.
         """
-        # 먼저 add로 데이터 넣기
-        self._run([
-            "add",
-            "--isbn", "978-89-9999-999-9",
-            "--title", "목록확인용",
-            "--author", "테스터",
-            "--price", "5000",
-        ])
-
-        result = self._run(["list"])
-        if result is None or result.returncode != 0:
-            return False
-
-        # list 결과에 내용이 있어야 함
-        return len(result.stdout.strip()) > 0
+        with self._data_lock:
+            # 먼저 add로 데이터 넣기
+            self._run([
+                "add",
+                "--isbn", "978-89-9999-999-9",
+                "--title", "목록확인용",
+                "--author", "테스터",
+                "--price", "5000",
+            ])
+
+            result = self._run(["list"])
+            if result is None or result.returncode != 0:
+                return False
+
+            # list 결과에 내용이 있어야 함
+            return len(result.stdout.strip()) > 0
 
     def _find_data_files(self) -> list:
-        """submission_dir 내 데이터 파일 목록"""
+        """cli.py 작업 디렉토리 내 데이터 파일 목록"""
         import glob
         patterns = ["*.jsonl", "*.json", "*.csv"]
+        directory = self.workspace.path if self.workspace is not None else self.submission_dir
         found = []
         for pattern in patterns:
-            found.extend(glob.glob(os.path.join(self.submission_dir, pattern)))
+            found.extend(glob.glob(os.path.join(directory, pattern)))
         return found
 
     @staticmethod
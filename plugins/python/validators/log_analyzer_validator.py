@@ -8,13 +8,15 @@ AI 트랩: 빈 IP 행, 1xx 상태코드, 소수점 response_time, 동점 내림
 """
 import os
 import re
-import subprocess
 import sys
 import tempfile
 from typing import Dict, Any, Optional, List, Tuple
 
+from core import process_supervisor
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.process_supervisor import ProcessLimits
+from core.workspace import Workspace
 
 # 함정 포함 CSV 데이터 (24행)
 # 함정 1: 빈 IP 행 (행 2)
@@ -78,6 +80,9 @@ EXPECTED_SLOW_ENDPOINTS = [
 class LogAnalyzerValidator(BaseValidator):
     """서버 접근 로그 분석기 검증 (CSV 파싱, IP 집계, 상태코드, 엔드포인트)"""
 
+    # 분석 대상 CSV는 임시 디렉토리에 생성하므로 소스만 입력
+    input_files = ["**/*.py"]
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
@@ -102,19 +107,20 @@ class LogAnalyzerValidator(BaseValidator):
         # 함정 포함 CSV 쓰기
         self._write_trap_csv(csv_path)
 
-        # subprocess로 학생 코드 실행
+        # 학생 코드 실행 (리소스 제한 + 프로세스 그룹 정리, 타임아웃은 process_supervisor가 기록)
+        # 작업 사본에서 실행하여 학생 코드가 만든 파일이 제출물에 남지 않게 함
+        workspace = Workspace.from_config(self.config)
         try:
-            subprocess.run(
-                [sys.executable, script_path,
+            process_supervisor.run(
+                [sys.executable, workspace.file("log_analyzer.py"),
                  "--log", csv_path,
                  "--output", report_path],
-                capture_output=True,
-                text=True,
                 timeout=10,
-                cwd=self.submission_dir,
+                cwd=workspace.path,
+                limits=ProcessLimits.from_config(self.config),
             )
-        except (subprocess.TimeoutExpired, OSError):
-            pass
+        finally:
+            workspace.close()
 
         # report.txt 읽기
         if os.path.isfile(report_path):
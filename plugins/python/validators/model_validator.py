@@ -4,39 +4,51 @@
 학습자가 Book 데이터 모델을 @dataclass로 올바르게 정의했는지,
 필수 필드·타입 힌트·유효성 검증(__post_init__)이 구현되어 있는지 확인.
 """
-import ast
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.supervised_executor import ISOLATED, SupervisedExecutor
+from plugins.python.validators._ast_facts import FactTable
 from plugins.python.validators._helpers import (
     import_student_module,
-    collect_py_files,
-    parse_all_files,
+    release_student_modules,
 )
+from plugins.python.validators._source_index import submission_index
 
 
 class ModelValidator(BaseValidator):
     """Book 데이터 모델 검증 (dataclass, 필드, 타입 힌트, __post_init__)"""
 
+    # 학생 코드를 채점 프로세스에서 직접 실행하는 플랫폼(fork 없음)에서만 학생 모듈 import가
+    # sys.meta_path/sys.modules를 바꾸므로 직렬화
+    shares_state = not ISOLATED
+    # Book 클래스를 models.py와 그 모듈이 import하는 파일에서 탐색
+    input_modules = ["models"]
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.models_module = None
-        self.parsed: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[FactTable] = None
+        # 학생 코드 실행용 자식 프로세스 (models import + Book 생성)
+        self.student: Optional[SupervisedExecutor] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
+        self.facts = submission_index(self.submission_dir, config=self.config).module_facts(self.input_modules)
+        self.student = SupervisedExecutor.from_config(self, self.config, prepare="_import_modules")
+
+    def _import_modules(self) -> None:
+        """자식 프로세스에서 학생 모듈 import"""
         self.models_module = import_student_module(self.submission_dir, "models")
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed = parse_all_files(py_files)
 
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
             id="model_dataclass",
             description="Book 클래스가 @dataclass로 정의되어 있는지 확인",
             points=7,
-            validator=self._check_dataclass,
+            validator=self.student.wrap(self._check_dataclass),
             hint="from dataclasses import dataclass 후 @dataclass로 Book을 정의하세요",
         ))
 
@@ -44,7 +56,7 @@ class ModelValidator(BaseValidator):
             id="model_fields",
             description="Book에 필수 필드(isbn, title, author, price, is_available)가 있는지 확인",
             points=6,
-            validator=self._check_fields,
+            validator=self.student.wrap(self._check_fields),
             hint="Book(isbn=..., title=..., author=..., price=..., is_available=...)로 생성 가능해야 합니다",
         ))
 
@@ -60,27 +72,25 @@ class ModelValidator(BaseValidator):
             id="model_post_init",
             description="price < 0일 때 ValueError가 발생하는지 확인",
             points=7,
-            validator=self._check_post_init,
+            validator=self.student.wrap(self._check_post_init),
             hint="__post_init__에서 price < 0이면 ValueError를 raise하세요",
         ))
 
     def teardown(self) -> None:
-        pass
+        if self.student is not None:
+            self.student.close()
+        if not ISOLATED:
+            release_student_modules()
 
     # -- 검증 함수 --
 
     def _check_dataclass(self) -> bool:
         """AST에서 @dataclass 데코레이터 확인 + 런타임 __dataclass_fields__ 확인"""
         # AST 확인: Book 클래스에 @dataclass 데코레이터가 있는지
-        has_decorator = False
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and node.name == "Book":
-                    for deco in node.decorator_list:
-                        name = _extract_decorator_name(deco)
-                        if name == "dataclass":
-                            has_decorator = True
-                            break
+        has_decorator = any(
+            cls.name == "Book" and "dataclass" in cls.decorators
+            for cls in self.facts.classes
+        )
         if not has_decorator:
             return False
 
@@ -132,18 +142,11 @@ class ModelValidator(BaseValidator):
         """AST에서 Book 클래스 필드의 annotation 존재 확인"""
         required_fields = {"isbn", "title", "author", "price", "is_available"}
 
-        for _, tree in self.parsed:
-            for node in ast.walk(tree):
-                if not (isinstance(node, ast.ClassDef) and node.name == "Book"):
-                    continue
-                annotated_fields = set()
-                for item in node.body:
-                    if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
-                        annotated_fields.add(item.target.id)
-                # 필수 필드가 모두 annotation을 가지고 있는지
-                if required_fields.issubset(annotated_fields):
-                    return True
-        return False
+        # 필수 필드가 모두 annotation을 가지고 있는지
+        return any(
+            cls.name == "Book" and required_fields.issubset(cls.fields)
+            for cls in self.facts.classes
+        )
 
     def _check_post_init(self) -> bool:
         """price < 0으로 Book 생성 시 ValueError 발생 확인"""
@@ -166,14 +169,3 @@ class ModelValidator(BaseValidator):
             return True
         except Exception:
             return False
-
-
-def _extract_decorator_name(deco: ast.expr) -> str:
-    """데코레이터 노드에서 이름 추출"""
-    if isinstance(deco, ast.Name):
-        return deco.id
-    if isinstance(deco, ast.Call):
-        return _extract_decorator_name(deco.func)
-    if isinstance(deco, ast.Attribute):
-        return deco.attr
-    return ""
@@ -7,52 +7,67 @@ JSONL/JSON/CSV 형식을 사용하는지, pickle을 사용하지 않는지,
 
 AI 트랩: pickle 사용
 """
-import ast
 import csv
 import glob
 import io
 import json
 import os
 import tempfile
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Optional
 
 from core.base_validator import BaseValidator
 from core.check_item import CheckItem
+from core.supervised_executor import ISOLATED, SupervisedExecutor
+from plugins.python.validators._ast_facts import FactTable
 from plugins.python.validators._helpers import (
     import_student_module,
-    collect_py_files,
-    parse_all_files,
+    release_student_modules,
 )
+from plugins.python.validators._source_index import submission_index
 
 
 class PersistenceValidator(BaseValidator):
     """데이터 저장 검증 (왕복 무결성, 형식, pickle 미사용, 필수 필드)"""
 
+    # 학생 코드를 채점 프로세스에서 직접 실행하는 플랫폼(fork 없음)에서만 학생 모듈 import가
+    # sys.meta_path/sys.modules를 바꾸므로 직렬화
+    shares_state = not ISOLATED
+    # 저장 파일 탐색 대상 + pickle 파일 검사 대상
+    input_files = ["*.jsonl", "*.json", "*.csv", "**/*.pkl", "**/*.pickle"]
+    # storage.py/models.py와 그 모듈이 import하는 파일 (pickle import 검사 대상)
+    input_modules = ["storage", "models"]
+
     def __init__(self, mission_config: Dict[str, Any]):
         super().__init__(mission_config)
         self.submission_dir = ""
         self.storage_module = None
         self.models_module = None
-        self.parsed_trees: List[Tuple[str, ast.Module]] = []
+        self.facts: Optional[FactTable] = None
         # save 후 생성된 파일 경로
         self.saved_file: Optional[str] = None
-        # 임시 디렉토리 (save 테스트용)
+        # 임시 디렉토리 (save 테스트용, 자식 프로세스가 강제 종료되어도 채점 프로세스에서 정리)
         self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        # 학생 코드 실행용 자식 프로세스 (models/storage import + save/load 호출)
+        # saved_file 등 검증 함수가 남기는 상태는 자식 프로세스에만 유지됨
+        self.student: Optional[SupervisedExecutor] = None
 
     def setup(self) -> None:
         self.submission_dir = self.config.get("submission_dir", "")
+        self.facts = submission_index(self.submission_dir, config=self.config).module_facts(self.input_modules)
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.student = SupervisedExecutor.from_config(self, self.config, prepare="_import_modules")
+
+    def _import_modules(self) -> None:
+        """자식 프로세스에서 학생 모듈 import"""
         self.models_module = import_student_module(self.submission_dir, "models")
         self.storage_module = import_student_module(self.submission_dir, "storage")
 
-        py_files = collect_py_files(self.submission_dir)
-        self.parsed_trees = parse_all_files(py_files)
-
     def build_checklist(self) -> None:
         self.checklist.add_item(CheckItem(
             id="persist_roundtrip",
             description="save_books → load_books 왕복 무결성 확인",
             points=7,
-            validator=self._check_roundtrip,
+            validator=self.student.wrap(self._check_roundtrip),
             hint="save_books로 저장한 데이터를 load_books로 정확히 복원할 수 있어야 합니다",
         ))
 
@@ -60,7 +75,7 @@ class PersistenceValidator(BaseValidator):
             id="persist_format",
             description="저장 파일이 JSONL/JSON/CSV 형식인지 확인",
             points=3,
-            validator=self._check_format,
+            validator=self.student.wrap(self._check_format),
             hint="데이터를 JSONL, JSON, 또는 CSV 형식으로 저장하세요",
         ))
 
@@ -77,11 +92,15 @@ class PersistenceValidator(BaseValidator):
             id="persist_integrity",
             description="저장된 데이터에 isbn, title, author, price 필드가 포함되어 있는지 확인",
             points=5,
-            validator=self._check_integrity,
+            validator=self.student.wrap(self._check_integrity),
             hint="각 도서 레코드에 isbn, title, author, price 필드를 포함하세요",
         ))
 
     def teardown(self) -> None:
+        if self.student is not None:
+            self.student.close()
+        if not ISOLATED:
+            release_student_modules()
         if self._tmpdir:
             self._tmpdir.cleanup()
 
@@ -112,7 +131,6 @@ class PersistenceValidator(BaseValidator):
             return None
 
         # 임시 디렉토리에서 save 테스트
-        self._tmpdir = tempfile.TemporaryDirectory()
         tmp_path = self._tmpdir.name
 
         try:
@@ -220,16 +238,9 @@ class PersistenceValidator(BaseValidator):
         AST에서 pickle import 탐색 + .pkl/.pickle 파일 존재 확인
         """
         # 1. AST에서 pickle import 탐색
-        for _, tree in self.parsed_trees:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == "pickle" or alias.name.startswith("pickle."):
-                            return False
-                if isinstance(node, ast.ImportFrom):
-                    if node.module and (node.module == "pickle"
-                                        or node.module.startswith("pickle.")):
-                        return False
+        for imp in self.facts.imports:
+            if imp.module and (imp.module == "pickle" or imp.module.startswith("pickle.")):
+                return False
 
         # 2. .pkl / .pickle 파일 존재 확인
         for pattern in ["*.pkl", "*.pickle"]:
@@ -3,30 +3,206 @@
 메인 채점 실행 스크립트
 """
 import sys
+import csv
+import asyncio
 import argparse
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from core.grader import Grader
-from utils.config_loader import load_mission_config
+from core import tracing
+from core.grader import Grader, grade_many, grade_many_async, ThroughputStats
+from core.metrics import GradingMetrics
+from core.result_cache import ResultCache
+from core.sandbox import SandboxOptions, cgroup_root, unavailable_reason
+from core.validation_result import ValidationResult
+from utils.config_loader import declared_validator_modules, load_mission_config
+
+
+def save_result(result: ValidationResult, output_dir: Path) -> Tuple[Path, Path]:
+    """채점 결과를 JSON/Markdown 파일로 저장하고 경로를 반환"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = result.timestamp.replace(":", "").replace("-", "").split(".")[0]
+    base_name = f"{result.student_id}_{result.mission_id}_{timestamp}"
+
+    # JSON 저장
+    json_path = output_dir / f"{base_name}.json"
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write(result.to_json())
+
+    # Markdown 저장
+    md_path = output_dir / f"{base_name}.md"
+    with open(md_path, 'w', encoding='utf-8') as f:
+        f.write(result.to_markdown())
+
+    return json_path, md_path
+
+
+def discover_submissions(submissions_root: str) -> List[Tuple[str, str]]:
+    """제출물 루트의 하위 디렉토리를 (학습자 ID, 제출물 경로) 목록으로 수집"""
+    root = Path(submissions_root).resolve()
+    return [
+        (entry.name, str(entry))
+        for entry in sorted(root.iterdir())
+        if entry.is_dir() and not entry.name.startswith(".")
+    ]
+
+
+def read_manifest(manifest_path: str) -> List[Tuple[str, str]]:
+    """
+    매니페스트 파일 로드
+
+    한 줄에 "학습자ID,제출물경로" 형식 (# 주석, 빈 줄 무시).
+    상대 경로는 매니페스트 파일 위치 기준으로 해석.
+    """
+    manifest = Path(manifest_path).resolve()
+    submissions = []
+    with open(manifest, 'r', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if not row or not row[0].strip() or row[0].strip().startswith("#"):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"매니페스트 형식 오류 (학습자ID,제출물경로 필요): {row}")
+            student_id, submission_dir = row[0].strip(), row[1].strip()
+            submissions.append((student_id, str((manifest.parent / submission_dir).resolve())))
+    return submissions
+
+
+def build_cache(args) -> Optional[ResultCache]:
+    """--cache 옵션으로 채점 결과 캐시 생성 (미지정 시 None)"""
+    if not args.cache:
+        return None
+    return ResultCache(
+        str(project_root / args.cache_dir),
+        max_bytes=args.cache_max_mb * 1024 * 1024,
+        max_age_seconds=args.cache_max_age_days * 24 * 3600,
+    )
+
+
+def run_batch(args, config) -> None:
+    """여러 학습자 제출물 일괄 채점"""
+    if args.manifest:
+        submissions = read_manifest(args.manifest)
+    else:
+        submissions = discover_submissions(args.submissions_root)
+
+    if not submissions:
+        print("❌ Error: 채점할 제출물이 없습니다")
+        sys.exit(1)
+
+    if args.concurrency:
+        print(f"🔍 일괄 채점 시작: {len(submissions)}명 (동시 채점 {args.concurrency})")
+    else:
+        print(f"🔍 일괄 채점 시작: {len(submissions)}명 (워커 {args.workers or '자동'})")
+    print("="*60)
+
+    output_dir = project_root / args.output_dir
+    stats = ThroughputStats()
+    passed_count = 0
+
+    cache = build_cache(args)
+    metrics = GradingMetrics(args.metrics_file) if args.metrics_file else None
+    cached_count = 0
+
+    def report(result: ValidationResult) -> None:
+        nonlocal passed_count, cached_count
+        stats.record(result)
+        save_result(result, output_dir)
+        if result.overall_passed:
+            passed_count += 1
+        if result.cache_hit:
+            cached_count += 1
+        print(f"{'✅ PASS' if result.overall_passed else '❌ FAIL'} "
+              f"{result.student_id}: {result.overall_score:.2f}점 ({result.duration:.2f}s)"
+              f"{' [캐시]' if result.cache_hit else ''}"
+              f"{' [실행 중단]' if result.circuit_breaker else ''}")
+
+    if args.concurrency:
+        async def grade_all() -> None:
+            async for result in grade_many_async(args.mission_id, config, submissions,
+                                                 concurrency=args.concurrency,
+                                                 cache=cache, metrics=metrics):
+                report(result)
+
+        asyncio.run(grade_all())
+    else:
+        preload = declared_validator_modules() if args.fresh_workers else ()
+        for result in grade_many(args.mission_id, config, submissions,
+                                 workers=args.workers, cache=cache, metrics=metrics,
+                                 fresh_workers=args.fresh_workers, preload=preload):
+            report(result)
+
+    summary = stats.summary()
+
+    print()
+    print(f"{'='*60}")
+    print(f"일괄 채점 완료!")
+    print(f"{'='*60}")
+    print(f"미션: {args.mission_id}")
+    print(f"합격: {passed_count} / {summary['submissions']}")
+    if cache is not None:
+        print(f"캐시 적중: {cached_count} / {summary['submissions']}")
+    print(f"총 소요 시간: {summary['elapsed']:.2f}s")
+    print(f"처리량: {summary['submissions_per_sec']:.2f}건/s")
+    print(f"제출물당 소요 시간: p50 {summary['p50']:.2f}s / p95 {summary['p95']:.2f}s")
+    print(f"결과 디렉토리: {output_dir}")
+    if args.trace:
+        tracing.write(args.trace)
+        print(f"트레이스: {args.trace}")
+    print(f"{'='*60}\n")
+
+    sys.exit(0 if passed_count == summary["submissions"] else 1)
 
 
 def main():
     parser = argparse.ArgumentParser(description="코디세이 시험 자동 채점 시스템")
-    parser.add_argument("--student-id", required=True, help="학습자 ID")
+    parser.add_argument("--student-id", default=None, help="학습자 ID (단일 채점)")
     parser.add_argument("--mission-id", required=True, help="미션 ID (예: linux_level1_mission01)")
     parser.add_argument("--output-dir", default="results", help="결과 저장 디렉토리")
     parser.add_argument("--submission-dir", default=None,
                         help="학습자 제출물 디렉토리 경로 (Python 미션 등)")
+    parser.add_argument("--submissions-root", default=None,
+                        help="일괄 채점: 하위 디렉토리 이름을 학습자 ID로 사용하는 제출물 루트")
+    parser.add_argument("--manifest", default=None,
+                        help="일괄 채점: '학습자ID,제출물경로' 형식의 매니페스트 파일")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="일괄 채점 워커 프로세스 수 (기본: CPU 수, 1이면 순차 실행)")
+    parser.add_argument("--fresh-workers", action="store_true",
+                        help="일괄 채점: 제출물마다 새 워커 프로세스 사용 (채점 코어/플러그인을 미리 import한 forkserver에서 fork)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="일괄 채점: 이벤트 루프 하나에서 동시에 채점할 제출물 수 (지정 시 --workers 무시)")
+    parser.add_argument("--decide-only", action="store_true",
+                        help="합격/불합격이 확정되면 남은 체크를 생략 (점수는 부분 집계)")
+    parser.add_argument("--sandbox", action="store_true",
+                        help="학생 프로그램을 네임스페이스 샌드박스에서 실행 (execution.sandbox: true와 같음)")
+    parser.add_argument("--cache", action="store_true",
+                        help="제출물/설정/채점 코드가 같으면 이전 채점 결과 재사용")
+    parser.add_argument("--cache-dir", default="results/.cache", help="결과 캐시 디렉토리")
+    parser.add_argument("--cache-max-mb", type=int, default=256, help="결과 캐시 최대 크기 (MB)")
+    parser.add_argument("--cache-max-age-days", type=float, default=30,
+                        help="마지막 사용 후 결과 캐시 보관 기간 (일)")
+    parser.add_argument("--metrics-file", default=None,
+                        help="채점 메트릭 파일 (node_exporter textfile 형식, 제출물마다 갱신)")
+    parser.add_argument("--trace", default=None, metavar="PATH",
+                        help="채점 구간 트레이스 파일 (Chrome trace-event JSON, Perfetto에서 열기)")
 
     args = parser.parse_args()
 
+    batch_mode = bool(args.submissions_root or args.manifest)
+    if not batch_mode and not args.student_id:
+        parser.error("--student-id 또는 --submissions-root/--manifest 중 하나가 필요합니다")
+
+    if args.trace:
+        tracing.enable()
+
     # 1. 미션 설정 로드
     print(f"📝 미션 설정 로드 중: {args.mission_id}")
-    config = load_mission_config(args.mission_id)
+    with tracing.span("load config", cat="config", mission_id=args.mission_id):
+        config = load_mission_config(args.mission_id)
     if not config:
         print(f"❌ Error: 미션 설정을 찾을 수 없습니다 - {args.mission_id}")
         sys.exit(1)
@@ -35,13 +211,32 @@ def main():
     if args.submission_dir:
         config["submission_dir"] = str(Path(args.submission_dir).resolve())
 
+    # decide-only는 execution 설정으로 전달 (배치 워커에도 그대로 전파)
+    if args.decide_only:
+        config["execution"] = {**(config.get("execution") or {}), "decide_only": True}
+    if args.sandbox:
+        config["execution"] = {**(config.get("execution") or {}), "sandbox": True}
+
     print(f"✅ 미션: {config.get('name', 'Unknown')}")
     print(f"   난이도: {config.get('level', '?')}")
     print(f"   합격 기준: {config.get('passing_score', 70)}점 이상")
+    sandbox_options = SandboxOptions.from_config(config)
+    if sandbox_options is not None:
+        reason = unavailable_reason(sandbox_options)
+        if reason is not None:
+            print(f"   ⚠️  샌드박스를 사용할 수 없어 일반 실행으로 채점합니다 ({reason})")
+        else:
+            cgroup = "cgroup v2 제한 적용" if cgroup_root(sandbox_options) else "cgroup v2 위임 없음, rlimit만 적용"
+            print(f"   샌드박스: 네임스페이스 ({cgroup})")
     print()
 
+    if batch_mode:
+        run_batch(args, config)
+
     # 2. Grader 인스턴스 생성
-    grader = Grader(args.student_id, args.mission_id, config)
+    metrics = GradingMetrics(args.metrics_file) if args.metrics_file else None
+    grader = Grader(args.student_id, args.mission_id, config,
+                    cache=build_cache(args), metrics=metrics)
 
     # 3. 채점 실행
     print(f"🔍 채점 시작: {args.student_id}")
@@ -49,20 +244,7 @@ def main():
     result = grader.execute()
 
     # 4. 결과 저장
-    output_dir = project_root / args.output_dir
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    timestamp = result.timestamp.replace(":", "").replace("-", "").split(".")[0]
-
-    # JSON 저장
-    json_path = output_dir / f"{args.student_id}_{args.mission_id}_{timestamp}.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        f.write(result.to_json())
-
-    # Markdown 저장
-    md_path = output_dir / f"{args.student_id}_{args.mission_id}_{timestamp}.md"
-    with open(md_path, 'w', encoding='utf-8') as f:
-        f.write(result.to_markdown())
+    json_path, md_path = save_result(result, project_root / args.output_dir)
 
     # 5. 결과 출력
     print()
@@ -73,9 +255,16 @@ def main():
     print(f"미션: {args.mission_id}")
     print(f"결과: {'✅ PASS' if result.overall_passed else '❌ FAIL'}")
     print(f"점수: {result.overall_score:.2f}점")
+    if result.cache_hit:
+        print(f"캐시: 이전 채점 결과 재사용")
+    for program, record in (result.circuit_breaker or {}).items():
+        print(f"학생 프로그램 실행 중단: {program} — {record['reason']}")
     print(f"\n결과 파일:")
     print(f"  - {json_path}")
     print(f"  - {md_path}")
+    if args.trace:
+        tracing.write(args.trace)
+        print(f"  - {args.trace} (트레이스)")
     print(f"{'='*60}\n")
 
     # 6. 종료 코드 반환 (CI/CD 통합용)
@@ -0,0 +1,101 @@
+"""
+core.checklist 테스트 (depends_on 실행 순서, 선행 항목 미통과 시 SKIPPED)
+"""
+import pytest
+
+from core.check_item import CheckItem, CheckStatus, ConcurrencyClass
+from core.checklist import Checklist
+
+
+def _item(item_id, depends_on=(), result=True, calls=None, **kwargs):
+    def validator():
+        if calls is not None:
+            calls.append(item_id)
+        return result
+
+    return CheckItem(id=item_id, description=item_id, points=10, validator=validator,
+                     depends_on=list(depends_on), **kwargs)
+
+
+def _checklist(*items, **kwargs):
+    checklist = Checklist("test", "테스트", **kwargs)
+    for item in items:
+        checklist.add_item(item)
+    return checklist
+
+
+def _ids(items):
+    return [item.id for item in items]
+
+
+def test_execution_order_keeps_add_order_without_dependencies():
+    checklist = _checklist(_item("a"), _item("b"), _item("c"))
+
+    assert _ids(checklist._execution_order()) == ["a", "b", "c"]
+
+
+def test_execution_order_runs_dependencies_first():
+    checklist = _checklist(
+        _item("report", depends_on=["runnable", "help"]),
+        _item("help", depends_on=["runnable"]),
+        _item("runnable"),
+        _item("style"),
+    )
+
+    assert _ids(checklist._execution_order()) == ["runnable", "help", "report", "style"]
+
+
+def test_execution_order_unknown_dependency():
+    checklist = _checklist(_item("a", depends_on=["missing"]))
+
+    with pytest.raises(ValueError, match="알 수 없는 선행 항목"):
+        checklist._execution_order()
+
+
+@pytest.mark.parametrize("items", [
+    [("a", ["a"])],
+    [("a", ["b"]), ("b", ["a"])],
+    [("a", []), ("b", ["c"]), ("c", ["d"]), ("d", ["b"])],
+])
+def test_execution_order_cycle(items):
+    checklist = _checklist(*(_item(item_id, depends_on) for item_id, depends_on in items))
+
+    with pytest.raises(ValueError, match="순환 의존성"):
+        checklist._execution_order()
+
+
+def test_execute_all_skips_dependents_of_failed_item():
+    calls = []
+    checklist = _checklist(
+        _item("runnable", result=False, calls=calls),
+        _item("help", depends_on=["runnable"], calls=calls),
+        _item("add", depends_on=["help"], calls=calls),
+        _item("style", calls=calls),
+    )
+
+    checklist.execute_all()
+
+    assert calls == ["runnable", "style"]
+    statuses = {item.id: item.status for item in checklist.items}
+    assert statuses == {
+        "runnable": CheckStatus.FAILED,
+        "help": CheckStatus.SKIPPED,
+        "add": CheckStatus.SKIPPED,
+        "style": CheckStatus.PASSED,
+    }
+    assert "runnable" in checklist.items[1].skip_reason
+
+
+def test_execute_all_parallel_respects_dependencies():
+    calls = []
+    checklist = _checklist(
+        _item("second", depends_on=["first"], calls=calls, concurrency=ConcurrencyClass.PARALLEL),
+        _item("first", calls=calls, concurrency=ConcurrencyClass.PARALLEL),
+        _item("other", calls=calls, concurrency=ConcurrencyClass.PARALLEL),
+        max_workers=4,
+    )
+
+    checklist.execute_all()
+
+    assert calls.index("first") < calls.index("second")
+    assert all(item.status == CheckStatus.PASSED for item in checklist.items)
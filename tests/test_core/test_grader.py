@@ -0,0 +1,38 @@
+"""
+core.grader 테스트 (비동기 검증기 미션의 동기 채점)
+"""
+import asyncio
+
+from core.async_validator import AsyncBaseValidator
+from core.check_item import CheckItem
+from core.grader import Grader
+
+
+class _SleepValidator(AsyncBaseValidator):
+    async def setup_async(self):
+        await asyncio.sleep(0)
+
+    def build_checklist(self):
+        self.checklist.add_item(CheckItem(id="sleep", description="대기 후 통과", points=10,
+                                          validator=self._check_sleep))
+
+    async def _check_sleep(self) -> bool:
+        await asyncio.sleep(0.01)
+        return True
+
+
+def _grader():
+    config = {"validators": [{"module": __name__, "class": "_SleepValidator"}]}
+    return Grader("student", "test_mission", config)
+
+
+def test_execute_with_async_validators():
+    assert _grader().execute().overall_passed
+
+
+def test_execute_inside_running_event_loop():
+    """이벤트 루프가 도는 중에 execute()를 호출해도 asyncio.run() 오류 없이 채점"""
+    async def main():
+        return _grader().execute()
+
+    assert asyncio.run(main()).overall_passed
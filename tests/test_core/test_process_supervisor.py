@@ -0,0 +1,142 @@
+"""
+core.process_supervisor 테스트 (run 타임아웃/출력 한도, rlimit 적용)
+"""
+import signal
+import sys
+import time
+
+import pytest
+
+from core import process_supervisor
+from core.process_supervisor import ProcessLimits, run
+from core.resource_usage import ResourceMeter
+from core.submission_health import SCOPE_KEY, SubmissionHealth
+from core.submission_scope import SubmissionScope
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="리눅스 전용 (rlimit, 프로세스 그룹)")
+
+
+def _python(code: str):
+    return [sys.executable, "-c", code]
+
+
+def test_run_captures_output_and_returncode():
+    result = run(_python("import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"))
+
+    assert result.stdout == "out\n"
+    assert result.stderr == "err\n"
+    assert result.returncode == 3
+    assert result.usage is not None
+
+
+def test_run_passes_input():
+    result = run(_python("print(input()[::-1])"), input="abc\n")
+
+    assert result.stdout == "cba\n"
+
+
+def test_run_missing_program_returns_none(tmp_path):
+    assert run([str(tmp_path / "missing")]) is None
+
+
+def test_run_timeout_returns_none_and_records_timeout():
+    with ResourceMeter() as meter:
+        start = time.monotonic()
+        result = run(_python("import time; time.sleep(30)"), timeout=0.5)
+        elapsed = time.monotonic() - start
+
+    assert result is None
+    assert elapsed < 5
+    assert meter.counts["timeouts"] == 1
+
+
+def test_run_timeout_kills_process_group():
+    """타임아웃 시 학생 프로그램이 만든 자식 프로세스도 함께 종료 (파이프를 잡고 있어도 기다리지 않음)"""
+    code = "import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)"
+
+    start = time.monotonic()
+    assert run(_python(code), timeout=0.5) is None
+
+    assert time.monotonic() - start < 5
+
+
+def test_run_timeout_opens_circuit_breaker(tmp_path):
+    script = tmp_path / "cli.py"
+    script.write_text("import time\ntime.sleep(30)\n", encoding="utf-8")
+    scope = SubmissionScope()
+    health = scope.get(SCOPE_KEY, SubmissionHealth)
+
+    with scope.activate():
+        assert run([sys.executable, str(script)], timeout=0.5) is None
+        start = time.monotonic()
+        # 같은 프로그램의 다음 실행은 시작하지 않고 바로 실패
+        assert run([sys.executable, str(script)], timeout=5) is None
+        assert time.monotonic() - start < 1
+
+    assert health.to_dict() == {"cli.py": {"reason": "타임아웃 1회", "refused": 1}}
+
+
+def test_run_output_limit_kills_process():
+    limits = ProcessLimits(output_mb=1)
+
+    start = time.monotonic()
+    result = run(_python("import sys\nwhile True: sys.stdout.write('x' * 65536)"), timeout=10, limits=limits)
+
+    assert time.monotonic() - start < 5
+    assert result.returncode == -signal.SIGKILL
+    assert limits.output_bytes < len(result.stdout) <= limits.output_bytes + 65536
+
+
+def test_run_output_limit_counts_stderr():
+    limits = ProcessLimits(output_mb=1)
+
+    result = run(_python("import sys\nwhile True: sys.stderr.write('x' * 65536)"), timeout=10, limits=limits)
+
+    assert result.returncode == -signal.SIGKILL
+    assert result.stdout == ""
+    assert len(result.stderr) > limits.output_bytes
+
+
+def test_run_output_within_limit():
+    result = run(_python("print('x' * 1000)"), limits=ProcessLimits(output_mb=1))
+
+    assert result.returncode == 0
+    assert result.stdout == "x" * 1000 + "\n"
+
+
+PRINT_LIMITS = (
+    "import resource\n"
+    "for name in ('CPU', 'NOFILE', 'FSIZE'):\n"
+    "    print(name, *resource.getrlimit(getattr(resource, 'RLIMIT_' + name)))\n"
+)
+
+
+@pytest.mark.parametrize("use_prlimit", [True, False])
+def test_run_applies_rlimits(monkeypatch, use_prlimit):
+    if use_prlimit and process_supervisor._prlimit_command() is None:
+        pytest.skip("prlimit 명령 없음")
+    if not use_prlimit:
+        monkeypatch.setattr(process_supervisor, "_prlimit_command", lambda: None)
+    limits = ProcessLimits(cpu_s=7, memory_mb=None, open_files=64, file_size_mb=1)
+
+    result = run(_python(PRINT_LIMITS), limits=limits)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ["CPU 7 8", "NOFILE 64 64", f"FSIZE {1024 * 1024} {1024 * 1024}"]
+
+
+def test_wrap_without_limits_returns_argv():
+    limits = ProcessLimits(cpu_s=None, memory_mb=None, open_files=None, file_size_mb=None)
+
+    assert limits.wrap(["python3", "cli.py"]) == ["python3", "cli.py"]
+
+
+def test_wrap_fallback_uses_rlimit_script(monkeypatch):
+    monkeypatch.setattr(process_supervisor, "_prlimit_command", lambda: None)
+    limits = ProcessLimits(cpu_s=None, memory_mb=None, open_files=32, file_size_mb=None)
+
+    argv = limits.wrap(["python3", "cli.py"])
+
+    assert argv[-3:] == ["--", "python3", "cli.py"]
+    assert process_supervisor._RLIMIT_SCRIPT in argv
+    assert "NOFILE=32:32" in argv
@@ -0,0 +1,309 @@
+"""
+core.result_cache 테스트 (캐시 키 무효화, 저장/조회/축출)
+"""
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from core import result_cache
+from core.result_cache import ResultCache, hash_config, hash_tree
+from core.source_check import student_module_files
+from plugins.ds.validators.basic_command_validator import BasicCommandValidator
+from plugins.ds.validators.structure_validator import StructureValidator
+from plugins.python.validators.model_validator import ModelValidator
+from plugins.python.validators.persistence_validator import PersistenceValidator
+
+MISSION_ID = "ds_level1_mission01"
+
+
+@pytest.fixture
+def submission(tmp_path):
+    root = tmp_path / "submission"
+    root.mkdir()
+    (root / "cli.py").write_text("print('hello')\n", encoding="utf-8")
+    (root / "notes.txt").write_text("메모\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / "cache"))
+
+
+def _config(submission_dir: Path) -> dict:
+    return {
+        "submission_dir": str(submission_dir),
+        "validators": [{"module": BasicCommandValidator.__module__, "class": "BasicCommandValidator"}],
+        "execution": {"student_call_timeout": 10},
+    }
+
+
+def test_submission_key_changes_when_any_file_changes(cache, submission):
+    config = _config(submission)
+    before = cache.submission_key(MISSION_ID, config)
+
+    (submission / "notes.txt").write_text("수정\n", encoding="utf-8")
+
+    assert cache.submission_key(MISSION_ID, config) != before
+
+
+def test_submission_key_ignores_bytecode_and_location(cache, submission, tmp_path):
+    config = _config(submission)
+    before = cache.submission_key(MISSION_ID, config)
+
+    (submission / "__pycache__").mkdir()
+    (submission / "__pycache__" / "cli.cpython-311.pyc").write_bytes(b"\0" * 16)
+    moved = tmp_path / "moved"
+    submission.rename(moved)
+
+    assert cache.submission_key(MISSION_ID, _config(moved)) == before
+
+
+def test_submission_key_changes_with_config_and_mission(cache, submission):
+    config = _config(submission)
+    before = cache.submission_key(MISSION_ID, config)
+
+    changed = dict(config, execution={"student_call_timeout": 5})
+
+    assert cache.submission_key(MISSION_ID, changed) != before
+    assert cache.submission_key("other_mission", config) != before
+
+
+def test_submission_key_none_without_submission_dir(cache, tmp_path):
+    assert cache.submission_key(MISSION_ID, {"validators": []}) is None
+    assert cache.submission_key(MISSION_ID, {"submission_dir": str(tmp_path / "missing")}) is None
+
+
+def test_validator_key_only_tracks_declared_input_files(cache, submission):
+    config = _config(submission)
+    before = cache.validator_key(MISSION_ID, config, BasicCommandValidator)
+
+    # input_files = ["**/*.py"]: .py가 아닌 파일은 검증기 결과에 영향 없음
+    (submission / "notes.txt").write_text("수정\n", encoding="utf-8")
+    assert cache.validator_key(MISSION_ID, config, BasicCommandValidator) == before
+
+    (submission / "cli.py").write_text("print('changed')\n", encoding="utf-8")
+    assert cache.validator_key(MISSION_ID, config, BasicCommandValidator) != before
+
+
+@pytest.fixture
+def python_submission(tmp_path):
+    root = tmp_path / "python_submission"
+    root.mkdir()
+    files = {
+        "models.py": "from dataclasses import dataclass\nimport validators\n",
+        "validators.py": "def check(value):\n    return value\n",
+        "storage.py": "import json\nfrom models import Book\n",
+        "cli.py": "import storage\n",
+    }
+    for name, source in files.items():
+        (root / name).write_text(source, encoding="utf-8")
+    return root
+
+
+def test_validator_key_follows_input_modules(cache, python_submission):
+    """storage.py만 바뀌면 models.py만 읽는 검증기는 재사용, storage를 읽는 검증기는 재실행"""
+    config = _config(python_submission)
+    model_key = cache.validator_key(MISSION_ID, config, ModelValidator)
+    persistence_key = cache.validator_key(MISSION_ID, config, PersistenceValidator)
+
+    (python_submission / "storage.py").write_text("import csv\nfrom models import Book\n", encoding="utf-8")
+    assert cache.validator_key(MISSION_ID, config, ModelValidator) == model_key
+    assert cache.validator_key(MISSION_ID, config, PersistenceValidator) != persistence_key
+
+    # models.py가 간접적으로 import하는 파일이 바뀌면 재실행
+    (python_submission / "validators.py").write_text("def check(value):\n    return None\n", encoding="utf-8")
+    assert cache.validator_key(MISSION_ID, config, ModelValidator) != model_key
+
+
+def test_student_module_files(python_submission):
+    assert student_module_files(str(python_submission), ["models"]) == ["models.py", "validators.py"]
+    assert student_module_files(str(python_submission), ["cli"]) == [
+        "cli.py", "models.py", "storage.py", "validators.py",
+    ]
+    assert student_module_files(str(python_submission), ["missing"]) == []
+
+
+def test_student_module_files_package(python_submission):
+    package = python_submission / "helpers"
+    package.mkdir()
+    (package / "__init__.py").write_text("from .text import clean\n", encoding="utf-8")
+    (package / "text.py").write_text("def clean(value):\n    return value\n", encoding="utf-8")
+    (python_submission / "models.py").write_text("from helpers import clean\n", encoding="utf-8")
+
+    assert student_module_files(str(python_submission), ["models"]) == [
+        "helpers/__init__.py", "helpers/text.py", "models.py",
+    ]
+
+
+@pytest.mark.parametrize("source", [
+    "import importlib\nstorage = importlib.import_module('storage')\n",
+    "storage = __import__('storage')\n",
+    "def broken(:\n",
+])
+def test_student_module_files_unknown_scope(python_submission, source):
+    """동적 import나 문법 오류로 읽는 파일을 알 수 없으면 None (검증기 입력은 모든 .py)"""
+    (python_submission / "validators.py").write_text(source, encoding="utf-8")
+
+    assert student_module_files(str(python_submission), ["models"]) is None
+
+
+def test_hash_tree_includes_relative_paths(tmp_path):
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    for root, name in ((first, "x.py"), (second, "y.py")):
+        root.mkdir()
+        (root / name).write_text("pass\n", encoding="utf-8")
+
+    assert hash_tree(first) != hash_tree(second)
+
+
+def test_hash_config_ignores_key_order_and_submission_dir():
+    assert hash_config({"a": 1, "b": 2, "submission_dir": "/x"}) == hash_config({"b": 2, "a": 1, "submission_dir": "/y"})
+
+
+def test_project_closure_follows_transitive_imports():
+    """ds 검증기가 간접적으로 import하는 python 플러그인 헬퍼도 채점 코드 해시에 포함"""
+    module = StructureValidator.__module__
+    origin = Path(result_cache.importlib.util.find_spec(module).origin)
+
+    closure = result_cache._project_closure(origin, module)
+
+    helpers = result_cache._PROJECT_DIR / "plugins" / "python" / "validators"
+    assert helpers / "_source_index.py" in closure
+    assert helpers / "_ast_facts.py" in closure
+    # core/는 디렉토리 전체가 따로 해시됨
+    assert not any(result_cache._CORE_DIR in path.parents for path in closure)
+
+
+def test_hash_sources_changes_when_transitive_module_changes(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    package = project / "pkg_a"
+    helper = project / "pkg_b"
+    for directory in (package, helper):
+        directory.mkdir(parents=True)
+        (directory / "__init__.py").write_text("", encoding="utf-8")
+    (package / "validator.py").write_text("from pkg_b.inner import VALUE\n", encoding="utf-8")
+    (helper / "inner.py").write_text("from pkg_b._deep import VALUE\n", encoding="utf-8")
+    (helper / "_deep.py").write_text("VALUE = 1\n", encoding="utf-8")
+    unrelated = project / "pkg_c"
+    unrelated.mkdir()
+    (unrelated / "__init__.py").write_text("", encoding="utf-8")
+    (unrelated / "other.py").write_text("VALUE = 1\n", encoding="utf-8")
+
+    monkeypatch.setattr(result_cache, "_PROJECT_DIR", project)
+    monkeypatch.syspath_prepend(str(project))
+    before = result_cache.hash_sources(["pkg_a.validator"])
+
+    (unrelated / "other.py").write_text("VALUE = 2\n", encoding="utf-8")
+    assert result_cache.hash_sources(["pkg_a.validator"]) == before
+
+    (helper / "_deep.py").write_text("VALUE = 22\n", encoding="utf-8")
+    assert result_cache.hash_sources(["pkg_a.validator"]) != before
+
+
+def test_hash_sources_unknown_module():
+    with pytest.raises(ImportError):
+        result_cache.hash_sources(["plugins.no_such_module"])
+
+
+def test_put_get_roundtrip(cache):
+    cache.put("key", {"score": 100, "message": "통과"})
+
+    assert cache.get("key") == {"score": 100, "message": "통과"}
+    assert cache.get("missing") is None
+
+
+def test_get_ignores_corrupt_entry(cache):
+    cache.cache_dir.mkdir(parents=True)
+    (cache.cache_dir / "key.json").write_text("{broken", encoding="utf-8")
+
+    assert cache.get("key") is None
+
+
+def test_evict_removes_expired_entries(tmp_path):
+    cache = ResultCache(str(tmp_path), max_age_seconds=60)
+    cache.put("old", {"v": 1})
+    old_time = time.time() - 3600
+    os.utime(cache.cache_dir / "old.json", (old_time, old_time))
+
+    cache.put("new", {"v": 2})
+    cache.evict()
+
+    assert cache.get("old") is None
+    assert cache.get("new") == {"v": 2}
+
+
+def test_evict_removes_least_recently_used_over_budget(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=None)
+    for index, key in enumerate(("a", "b", "c")):
+        cache.put(key, {"data": "x" * 100})
+        stamp = time.time() - 100 + index
+        os.utime(cache.cache_dir / f"{key}.json", (stamp, stamp))
+    entry_size = (cache.cache_dir / "a.json").stat().st_size
+
+    # a를 사용하면 b가 가장 오래 사용되지 않은 항목
+    cache.get("a")
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert not (cache.cache_dir / "b.json").exists()
+    assert (cache.cache_dir / "a.json").exists()
+    assert (cache.cache_dir / "c.json").exists()
+
+
+def test_put_evicts_only_when_due(tmp_path, monkeypatch):
+    """저장마다 디렉토리 전체를 훑지 않음 (첫 저장, 일정 시간 후, 쓴 크기가 예산의 1/16을 넘을 때만 축출)"""
+    cache = ResultCache(str(tmp_path), max_bytes=16 * 1024 * 1024)
+    calls = []
+    original = ResultCache.evict
+    monkeypatch.setattr(ResultCache, "evict", lambda self: (calls.append(1), original(self)))
+
+    for index in range(20):
+        cache.put(f"key{index}", {"v": index})
+    assert len(calls) == 1
+
+    stale = time.time() - 3600
+    os.utime(tmp_path / result_cache._EVICT_STAMP, (stale, stale))
+    cache.put("later", {"v": 0})
+    assert len(calls) == 2
+
+    cache.put("big", {"data": "x" * (cache.max_bytes // 16)})
+    assert len(calls) == 3
+
+
+def test_put_same_key_from_threads(cache):
+    """같은 키를 여러 스레드가 동시에 저장해도 임시 파일이 겹치지 않음"""
+    errors = []
+
+    def put(index):
+        try:
+            for _ in range(50):
+                cache.put("same", {"writer": index, "data": "x" * 1000})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=put, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.get("same")["data"] == "x" * 1000
+    assert not list(cache.cache_dir.glob("*.tmp"))
+
+
+@pytest.mark.parametrize("result, transient", [
+    ({"score": 100, "resources": {"timeouts": 0}}, False),
+    ({"score": 40, "resources": {"timeouts": 1}}, True),
+    ({"score": 0, "error": "검증기 실행 오류"}, True),
+])
+def test_grader_skips_caching_transient_results(result, transient):
+    """타임아웃/실행 오류가 있었던 검증기 결과는 캐시에 저장하지 않음"""
+    from core.grader import _transient
+
+    assert _transient(result) is transient
@@ -0,0 +1,73 @@
+"""
+core.submission_scope 테스트 (자원 정리 순서, 정리 중 예외)
+"""
+import asyncio
+
+import pytest
+
+from core.submission_scope import SubmissionScope, current_scope
+
+
+class _Resource:
+    def __init__(self, name, closed, error=None):
+        self.name = name
+        self.closed = closed
+        self.error = error
+
+    def close(self):
+        self.closed.append(self.name)
+        if self.error is not None:
+            raise self.error
+
+
+class _AsyncResource(_Resource):
+    async def aclose(self):
+        self.close()
+
+
+def _scope(resource_class, closed, errors):
+    scope = SubmissionScope()
+    for name in ("a", "b", "c"):
+        scope.get(name, lambda name=name: resource_class(name, closed, errors.get(name)))
+    return scope
+
+
+def test_activate_sets_current_scope():
+    scope = SubmissionScope()
+
+    with scope.activate():
+        assert current_scope() is scope
+    assert current_scope() is None
+
+
+def test_close_closes_in_reverse_order():
+    closed = []
+    scope = _scope(_Resource, closed, {})
+
+    scope.close()
+
+    assert closed == ["c", "b", "a"]
+
+
+def test_close_closes_all_and_raises_first_error():
+    """한 자원의 정리가 실패해도 나머지 자원은 정리"""
+    closed = []
+    scope = _scope(_Resource, closed, {"c": ValueError("c"), "a": OSError("a")})
+
+    with pytest.raises(ValueError, match="c"):
+        scope.close()
+
+    assert closed == ["c", "b", "a"]
+    # 이미 꺼낸 자원은 다시 정리하지 않음
+    scope.close()
+    assert closed == ["c", "b", "a"]
+
+
+def test_aclose_closes_all_and_raises_first_error():
+    closed = []
+    scope = _scope(_AsyncResource, closed, {"b": RuntimeError("b"), "a": OSError("a")})
+
+    with pytest.raises(RuntimeError, match="b"):
+        asyncio.run(scope.aclose())
+
+    assert closed == ["c", "b", "a"]
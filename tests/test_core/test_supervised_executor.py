@@ -0,0 +1,90 @@
+"""
+core.supervised_executor 테스트 (자식 프로세스 호출, 제한 시간, import 타임아웃 circuit breaker)
+"""
+import subprocess
+import time
+
+import pytest
+
+from core import supervised_executor
+from core.submission_health import SCOPE_KEY, SubmissionHealth
+from core.submission_scope import SubmissionScope
+from core.supervised_executor import SupervisedExecutor, report_progress
+
+pytestmark = pytest.mark.skipif(not supervised_executor.ISOLATED, reason="forkserver 필요")
+
+
+class _Target:
+    def __init__(self, hang_on_import: bool = False):
+        self.hang_on_import = hang_on_import
+        self.value = 0
+
+    def prepare(self):
+        report_progress("models.py")
+        if self.hang_on_import:
+            time.sleep(30)
+        self.value = 1
+
+    def get_value(self):
+        return self.value
+
+    def hang(self):
+        time.sleep(30)
+
+    def fail(self):
+        raise ValueError("학생 코드 오류")
+
+
+def test_call_runs_in_child_after_prepare():
+    target = _Target()
+    executor = SupervisedExecutor(target, prepare="prepare", timeout=5)
+    try:
+        assert executor.call("get_value") == 1
+    finally:
+        executor.close()
+    # 자식 프로세스의 상태 변경은 채점 프로세스에 반영되지 않음
+    assert target.value == 0
+
+
+def test_call_error_raises_runtime_error():
+    executor = SupervisedExecutor(_Target(), prepare="prepare", timeout=5)
+    try:
+        with pytest.raises(RuntimeError, match="ValueError"):
+            executor.call("fail")
+        # 오류 뒤에도 같은 자식 프로세스로 계속 호출
+        assert executor.call("get_value") == 1
+    finally:
+        executor.close()
+
+
+def test_call_timeout_restarts_child():
+    executor = SupervisedExecutor(_Target(), prepare="prepare", timeout=0.5)
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            executor.call("hang")
+        assert executor.call("get_value") == 1
+    finally:
+        executor.close()
+
+
+def test_prepare_timeout_opens_circuit_for_module():
+    """import 중 멈춘 모듈은 처음 한 번만 기다리고, 같은 모듈을 import하는 다른 실행기는 바로 실패"""
+    scope = SubmissionScope()
+    health = scope.get(SCOPE_KEY, SubmissionHealth)
+
+    with scope.activate():
+        first = SupervisedExecutor(_Target(hang_on_import=True), prepare="prepare", timeout=0.5)
+        with pytest.raises(RuntimeError, match="준비 시간 초과"):
+            first.call("get_value")
+
+        second = SupervisedExecutor(_Target(), prepare="prepare", timeout=5)
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="models.py"):
+            second.call("get_value")
+        assert time.monotonic() - start < 2
+
+    assert health.to_dict() == {"models.py": {"reason": "타임아웃 1회", "refused": 1}}
+
+
+def test_report_progress_outside_child_is_ignored():
+    report_progress("models.py")
@@ -0,0 +1,114 @@
+"""
+plugins.ds.validators._repl_session 테스트 (ResponseParser 스트리밍 파싱, 출력 한도)
+"""
+import random
+
+import pytest
+
+from plugins.ds.validators._repl_session import PROMPT, ResponseParser, parse_responses
+
+TRANSCRIPT = (
+    f"{PROMPT}OK\n"
+    f"{PROMPT}\"Alice\"\n"
+    f"{PROMPT}(nil)\n"
+    f"{PROMPT}# Memory\nused_memory:1024\nmaxmemory:0\n"
+    f"{PROMPT}"
+)
+
+
+def _feed(chunks, limit=None):
+    parser = ResponseParser(limit=limit)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser
+
+
+def test_parse_responses():
+    assert parse_responses(TRANSCRIPT) == [
+        "OK",
+        "\"Alice\"",
+        "(nil)",
+        "# Memory\nused_memory:1024\nmaxmemory:0",
+    ]
+
+
+def test_feed_returns_response_when_next_prompt_arrives():
+    parser = ResponseParser()
+
+    assert parser.feed(PROMPT) == []
+    assert parser.feed("OK\n") == []
+    assert parser.feed(PROMPT) == ["OK"]
+    assert parser.prompts == 2
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_fixed_size_chunks_match_whole_output(size):
+    chunks = [TRANSCRIPT[i:i + size] for i in range(0, len(TRANSCRIPT), size)]
+
+    parser = _feed(chunks)
+
+    assert parser.result() == parse_responses(TRANSCRIPT)
+    assert parser.prompts == TRANSCRIPT.count(PROMPT)
+
+
+def test_prompt_split_across_chunks():
+    middle = len(PROMPT) // 2
+    parser = _feed([PROMPT + "OK\n" + PROMPT[:middle], PROMPT[middle:]])
+
+    assert parser.responses == ["OK"]
+    assert parser.prompts == 2
+
+
+def test_random_chunks_match_whole_output():
+    atoms = [PROMPT, "mini-redis", "> ", "\n", "OK", " ", "(nil)", "\n\n", PROMPT + PROMPT]
+    rng = random.Random(0)
+    for _ in range(500):
+        output = "".join(rng.choice(atoms) for _ in range(rng.randint(0, 20)))
+        cuts = sorted(rng.sample(range(len(output) + 1), min(len(output) + 1, rng.randint(0, 5))))
+        chunks = [output[start:end] for start, end in zip([0, *cuts], [*cuts, len(output)])]
+
+        parser = _feed(chunks)
+
+        assert parser.result() == parse_responses(output), chunks
+        assert parser.prompts == output.count(PROMPT)
+
+
+def test_restart_keeps_only_responses_after_last_prompt():
+    parser = _feed([f"{PROMPT}OK\n{PROMPT}"])
+    parser.restart()
+    parser.feed(f"\"v\"\n{PROMPT}")
+
+    assert parser.result() == ["\"v\""]
+    assert parser.prompts == 3
+
+
+def test_restart_after_prompt_on_completed_line():
+    """마지막 프롬프트 줄이 이미 끝난 상태에서 restart하면 그 프롬프트 뒤 텍스트부터 다시 수집"""
+    parser = _feed([f"{PROMPT}OK\n{PROMPT}1\n"])
+    parser.restart()
+    parser.feed(f"2\n{PROMPT}")
+
+    assert parser.result() == ["1\n2"]
+
+
+def test_limit_sets_overflowed_and_drops_output():
+    parser = ResponseParser(limit=16)
+
+    parser.feed(PROMPT)
+    assert not parser.overflowed
+    assert parser.feed("x" * 32 + "\n" + PROMPT) == []
+
+    assert parser.overflowed
+    assert parser.feed(f"OK\n{PROMPT}") == []
+
+
+def test_restart_resets_limit():
+    """출력 크기는 시나리오(restart)마다 다시 셈"""
+    parser = ResponseParser(limit=len(PROMPT) + 4)
+    parser.feed(PROMPT)
+    parser.restart()
+
+    parser.feed(f"OK\n{PROMPT}")
+
+    assert not parser.overflowed
+    assert parser.responses == ["OK"]
@@ -3,7 +3,7 @@ YAML 설정 파일 로더
 """
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 def load_mission_config(mission_id: str) -> Optional[Dict[str, Any]]:
@@ -42,6 +42,27 @@ def load_mission_config(mission_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def declared_validator_modules() -> List[str]:
+    """
+    missions/**/config.yaml에 선언된 모든 검증기 모듈 (배치 워커 preload용)
+
+    Returns:
+        모듈 경로 리스트 (중복 제거, 발견 순서)
+    """
+    modules: List[str] = []
+    for config_path in sorted((get_project_root() / "missions").glob("**/config.yaml")):
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError):
+            continue
+        for validator_config in config.get("validators") or []:
+            module = validator_config.get("module")
+            if module and module not in modules:
+                modules.append(module)
+    return modules
+
+
 def get_project_root() -> Path:
     """프로젝트 루트 디렉토리 반환"""
     return Path(__file__).parent.parent